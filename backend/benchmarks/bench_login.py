@@ -0,0 +1,141 @@
+"""
+Login throughput benchmark under concurrency.
+
+In-process mode (default) verifies bcrypt hashes with N concurrent "logins", either inline
+on the event loop or through the password hashing pool, while a probe coroutine measures
+how long the loop stalls. Probe lag is what every other request would wait.
+
+    cd backend && python benchmarks/bench_login.py [--logins 40] [--concurrency 8]
+
+Against a running server, the same numbers come from real HTTP logins, with /api/health
+as the probe:
+
+    python benchmarks/bench_login.py --url http://localhost:8001 \\
+        --email seth.cushing@compassx.com --password '...'
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "benchmark")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bcrypt  # noqa: E402
+
+import server  # noqa: E402
+
+PROBE_INTERVAL = 0.01
+
+
+def percentile(values, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def probe(stop: asyncio.Event, lags: list):
+    """Sleep in short ticks and record how late each wake-up is"""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - started - PROBE_INTERVAL)
+
+
+async def run_logins(login, logins: int, concurrency: int) -> tuple:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            await login()
+            latencies.append(time.perf_counter() - started)
+
+    stop, lags = asyncio.Event(), []
+    prober = asyncio.create_task(probe(stop, lags))
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await prober
+    return elapsed, latencies, lags
+
+
+def report(name: str, logins: int, elapsed: float, latencies: list, lags: list):
+    print(
+        f"{name:<18} {logins / elapsed:>9.1f} {percentile(latencies, 50) * 1000:>10.0f} "
+        f"{percentile(latencies, 95) * 1000:>10.0f} {percentile(lags, 95) * 1000:>12.1f} {max(lags, default=0) * 1000:>12.1f}"
+    )
+
+
+async def in_process(args):
+    password = "CompassX2026!"
+    stored = (await server.hash_password(password)).encode()
+
+    async def inline():
+        # What a naive KDF migration would do: hash on the event loop
+        assert bcrypt.checkpw(password.encode(), stored)
+
+    async def pooled():
+        assert await server.verify_password(password, stored.decode())
+
+    print(f"bcrypt cost {server.PASSWORD_BCRYPT_ROUNDS}, {server.PASSWORD_HASH_WORKERS} hashing threads, "
+          f"{args.logins} logins at concurrency {args.concurrency}")
+    print(f"{'path':<18} {'logins/s':>9} {'p50 ms':>10} {'p95 ms':>10} {'loop p95 ms':>12} {'loop max ms':>12}")
+    for name, login in [("inline", inline), ("thread pool", pooled)]:
+        report(name, args.logins, *await run_logins(login, args.logins, args.concurrency))
+    server.password_hasher.shutdown()
+
+
+async def against_server(args):
+    import httpx
+
+    async with httpx.AsyncClient(base_url=args.url, timeout=60) as client:
+        async def login():
+            response = await client.post("/api/auth/login", json={"email": args.email, "password": args.password})
+            response.raise_for_status()
+
+        health_latencies = []
+
+        async def health_probe(stop: asyncio.Event):
+            while not stop.is_set():
+                started = time.perf_counter()
+                await client.get("/api/health")
+                health_latencies.append(time.perf_counter() - started)
+                await asyncio.sleep(PROBE_INTERVAL)
+
+        stop = asyncio.Event()
+        prober = asyncio.create_task(health_probe(stop))
+        elapsed, latencies, lags = await run_logins(login, args.logins, args.concurrency)
+        stop.set()
+        await prober
+
+    print(f"{args.logins} logins at concurrency {args.concurrency} against {args.url}")
+    print(f"{'path':<18} {'logins/s':>9} {'p50 ms':>10} {'p95 ms':>10} {'health p95':>12} {'health max':>12}")
+    report("POST /auth/login", args.logins, elapsed, latencies, health_latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--url", help="Benchmark a running server instead of in-process hashing")
+    parser.add_argument("--email")
+    parser.add_argument("--password")
+    args = parser.parse_args()
+
+    if args.url:
+        if not (args.email and args.password):
+            parser.error("--url needs --email and --password")
+        asyncio.run(against_server(args))
+    else:
+        asyncio.run(in_process(args))
+
+
+if __name__ == "__main__":
+    main()
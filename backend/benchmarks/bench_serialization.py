@@ -0,0 +1,154 @@
+"""
+Response serialization benchmark.
+
+Compares the previous response path (deserialize_doc, then FastAPI's jsonable_encoder,
+then the stdlib JSONResponse) with the orjson path used by json_response, on payloads
+shaped like the large list endpoints and the four-blocker overview.
+
+    cd backend && python benchmarks/bench_serialization.py [--items 1000] [--repeat 50]
+
+No database is needed: documents are generated in their stored (ISO string) form.
+"""
+import argparse
+import copy
+import os
+import sys
+import timeit
+import uuid
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "benchmark")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+import server  # noqa: E402
+
+NOW = datetime.now(timezone.utc)
+
+
+def iso(days: int = 0) -> str:
+    return (NOW + timedelta(days=days)).isoformat()
+
+
+def make_issue(i: int, engagement_id: str) -> dict:
+    return {
+        "issue_id": f"issue_{uuid.uuid4().hex[:12]}",
+        "engagement_id": engagement_id,
+        "title": f"Issue {i}: integration environment unavailable",
+        "description": "Downstream team cannot deploy to the shared integration environment. " * 3,
+        "severity": ["CRITICAL", "HIGH", "MEDIUM", "LOW"][i % 4],
+        "status": ["OPEN", "IN_PROGRESS", "BLOCKED", "RESOLVED"][i % 4],
+        "owner": "Platform team",
+        "blocked_by": None,
+        "due_date": iso(i % 30 - 10),
+        "created_at": iso(-i),
+        "updated_at": iso(-i),
+    }
+
+
+def make_milestone(i: int, engagement_id: str) -> dict:
+    return {
+        "milestone_id": f"ms_{uuid.uuid4().hex[:12]}",
+        "engagement_id": engagement_id,
+        "title": f"Milestone {i}",
+        "description": "Deliverable sign-off",
+        "status": ["NOT_STARTED", "IN_PROGRESS", "AT_RISK", "DONE"][i % 4],
+        "due_date": iso(i % 40 - 15),
+        "original_due_date": iso(i % 40 - 20),
+        "date_change_history": [
+            {"previous_date": iso(-20), "new_date": iso(i % 40 - 15), "reason": "Client delay", "changed_at": iso(-5), "changed_by": "user_admin001"}
+        ] if i % 3 == 0 else [],
+        "created_at": iso(-60),
+        "updated_at": iso(-5),
+    }
+
+
+def make_engagement(i: int) -> dict:
+    return {
+        "engagement_id": f"eng_{i:05d}",
+        "client_id": f"client_{i % 20:03d}",
+        "engagement_name": f"Engagement {i}",
+        "engagement_code": f"ENG-{i:05d}",
+        "consultant_user_id": f"user_{i:05d}",
+        "rag_status": ["GREEN", "AMBER", "RED"][i % 3],
+        "health_score": 100 - i % 60,
+        "start_date": iso(-90),
+        "target_end_date": iso(120),
+        "is_active": True,
+        "created_at": iso(-90),
+        "updated_at": iso(-1),
+        "client": {"client_id": f"client_{i % 20:03d}", "client_name": f"Client {i % 20}", "created_at": iso(-200), "updated_at": iso(-10)},
+        "consultant": {"user_id": f"user_{i:05d}", "name": f"Consultant {i}", "email": f"c{i}@firm.com", "role": "CONSULTANT", "created_at": iso(-300), "updated_at": iso(-30)},
+        "issues_summary": {"critical": i % 2, "high": i % 3, "medium": 1, "low": 0},
+        "risks_count": i % 4,
+    }
+
+
+def make_four_blocker(items: int) -> dict:
+    engagement = make_engagement(1)
+    pulse = {
+        "pulse_id": "pulse_0001", "engagement_id": engagement["engagement_id"], "week_start_date": iso(-3),
+        "rag_status_this_week": "AMBER", "what_went_well": "Demo landed well. " * 10, "roadblocks": "Access requests pending. " * 10,
+        "is_draft": False, "created_at": iso(-2), "updated_at": iso(-2),
+    }
+    size = server.FOUR_BLOCKER_LIST_SIZE
+    milestones = [make_milestone(i, engagement["engagement_id"]) for i in range(size * 2)]
+    issues = [make_issue(i, engagement["engagement_id"]) for i in range(size)]
+    risks = [{**issue, "risk_id": issue["issue_id"], "probability": "HIGH", "impact": "HIGH", "category": "SCOPE"} for issue in issues]
+    # Counts as aggregate_four_blocker_stats returns them, with its capped short lists
+    return server.assemble_four_blocker(engagement, pulse, {
+        "milestones": {"total": items, "completed": items // 4, "at_risk": items // 4, "date_changes": items // 3,
+                       "upcoming": milestones[:size], "upcoming_count": items // 10, "overdue": milestones[size:], "overdue_count": items // 10},
+        "risks": {"total": items, "open": items // 2, "high_impact": items // 4, "open_risks": risks},
+        "issues": {"total": items, "open": items // 2, "critical": items // 8, "high": items // 8, "open_issues": issues},
+        "meetings": {"total": 0, "upcoming": 0, "completed": 0},
+        "action_items": {"total": 0, "open": 0, "overdue": 0, "done": 0},
+    })
+
+
+def legacy_render(docs) -> bytes:
+    """The old path: parse date strings, let FastAPI re-encode them, render with json"""
+    if isinstance(docs, list):
+        content = [server.deserialize_doc(dict(d)) for d in docs]
+    else:
+        content = server.deserialize_doc(dict(docs))
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def fast_render(docs) -> bytes:
+    return server.json_response(docs).body
+
+
+def bench(name: str, payload, repeat: int):
+    # Each request starts from freshly loaded documents, as a Motor cursor would hand them over
+    copies = [copy.deepcopy(payload) for _ in range(repeat * 2)]
+    legacy_iter, fast_iter = iter(copies[:repeat]), iter(copies[repeat:])
+    legacy = timeit.timeit(lambda: legacy_render(next(legacy_iter)), number=repeat) / repeat
+    fast = timeit.timeit(lambda: fast_render(next(fast_iter)), number=repeat) / repeat
+    size = len(fast_render(payload))
+    print(f"{name:<28} {size / 1024:>9.1f} {legacy * 1000:>12.2f} {fast * 1000:>12.2f} {legacy / fast:>8.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1000, help="Documents per list payload")
+    parser.add_argument("--repeat", type=int, default=50, help="Renders timed per path")
+    args = parser.parse_args()
+
+    payloads = {
+        f"GET /issues ({args.items})": [make_issue(i, f"eng_{i % 50:05d}") for i in range(args.items)],
+        f"GET /milestones ({args.items})": [make_milestone(i, f"eng_{i % 50:05d}") for i in range(args.items)],
+        f"GET /engagements ({args.items})": [make_engagement(i) for i in range(args.items)],
+        "GET /four-blocker": make_four_blocker(args.items),
+    }
+
+    print(f"{'payload':<28} {'KiB':>9} {'legacy ms':>12} {'orjson ms':>12} {'speedup':>9}")
+    for name, payload in payloads.items():
+        bench(name, payload, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,40 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Request, Response, Depends
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse, ORJSONResponse, PlainTextResponse
+from fastapi.routing import APIRoute
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne, ASCENDING, DESCENDING, ReturnDocument, monitoring
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 import os
+import asyncio
+import base64
+import csv
+import gzip
+import io
+import json
+import orjson
 import logging
+import math
+import threading
+import time
+from contextvars import ContextVar
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict, EmailStr
-from typing import List, Optional
+from pydantic import BaseModel, Field, ConfigDict, EmailStr, ValidationError
+from typing import List, Optional, Union, get_args, get_origin
 import uuid
 from datetime import datetime, timezone, timedelta
 from enum import Enum
+from collections import OrderedDict
 import hashlib
+import hmac
+import itertools
 import secrets
 import jwt
+import bcrypt
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(
@@ -35,13 +54,143 @@ JWT_EXPIRATION_HOURS = 24 * 7  # 7 days
 # Security
 security = HTTPBearer(auto_error=False)
 
+# Authenticated principal cache (per process)
+PRINCIPAL_CACHE_SIZE = int(os.environ.get('PRINCIPAL_CACHE_SIZE', '1024'))
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.environ.get('PRINCIPAL_CACHE_TTL_SECONDS', '60'))
+
+# Password hashing: bcrypt cost factor, and threads doing it so the event loop never does
+PASSWORD_BCRYPT_ROUNDS = int(os.environ.get('PASSWORD_BCRYPT_ROUNDS', '12'))
+PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', '4'))
+
+# Login throttling: attempts allowed per client IP and per email within the window (0 disables).
+# "memory" keeps buckets per worker; "mongo" shares sliding-window counters across workers.
+LOGIN_RATE_LIMIT_STORE = os.environ.get('LOGIN_RATE_LIMIT_STORE', 'memory').lower()
+LOGIN_RATE_LIMIT_WINDOW_SECONDS = float(os.environ.get('LOGIN_RATE_LIMIT_WINDOW_SECONDS', '300'))
+LOGIN_RATE_LIMIT_IP_ATTEMPTS = int(os.environ.get('LOGIN_RATE_LIMIT_IP_ATTEMPTS', '50'))
+LOGIN_RATE_LIMIT_EMAIL_ATTEMPTS = int(os.environ.get('LOGIN_RATE_LIMIT_EMAIL_ATTEMPTS', '5'))
+LOGIN_RATE_LIMIT_MAX_KEYS = int(os.environ.get('LOGIN_RATE_LIMIT_MAX_KEYS', '100000'))
+# Reverse proxies in front of the app that append to X-Forwarded-For (Koyeb's edge is one);
+# 0 trusts no forwarding headers and uses the connection's peer address
+TRUSTED_PROXY_HOPS = int(os.environ.get('TRUSTED_PROXY_HOPS', '0'))
+
+# Activity log writes: "buffered" queues entries and batch-inserts them in the background
+# (audit-critical entries are still written synchronously), "sync" writes every entry inline
+ACTIVITY_LOG_DURABILITY = os.environ.get('ACTIVITY_LOG_DURABILITY', 'buffered').lower()
+ACTIVITY_LOG_BATCH_SIZE = int(os.environ.get('ACTIVITY_LOG_BATCH_SIZE', '100'))
+ACTIVITY_LOG_FLUSH_INTERVAL_SECONDS = float(os.environ.get('ACTIVITY_LOG_FLUSH_INTERVAL_SECONDS', '1'))
+ACTIVITY_LOG_QUEUE_SIZE = int(os.environ.get('ACTIVITY_LOG_QUEUE_SIZE', '10000'))
+# A failed batch is retried with exponential backoff, then inserted one entry at a time
+ACTIVITY_LOG_FLUSH_RETRIES = int(os.environ.get('ACTIVITY_LOG_FLUSH_RETRIES', '3'))
+ACTIVITY_LOG_RETRY_BACKOFF_SECONDS = float(os.environ.get('ACTIVITY_LOG_RETRY_BACKOFF_SECONDS', '0.5'))
+
+# Activity log retention: entries older than ACTIVITY_LOG_RETENTION_DAYS (0 keeps everything) are
+# moved to a monthly archive, either gzipped chunks in a MongoDB collection or JSONL.gz files.
+# With native dates a TTL index also expires entries the archiver has missed for the grace period.
+ACTIVITY_LOG_RETENTION_DAYS = int(os.environ.get('ACTIVITY_LOG_RETENTION_DAYS', '180'))
+ACTIVITY_LOG_TTL_GRACE_DAYS = int(os.environ.get('ACTIVITY_LOG_TTL_GRACE_DAYS', '30'))
+ACTIVITY_LOG_ARCHIVE = os.environ.get('ACTIVITY_LOG_ARCHIVE', 'collection').lower()
+ACTIVITY_LOG_ARCHIVE_DIR = Path(os.environ.get('ACTIVITY_LOG_ARCHIVE_DIR', str(ROOT_DIR / 'archive')))
+
+# Live mutation events: "local" publishes writes made by this process, "change_stream" tails a
+# MongoDB change stream (replica set required) so every worker sees every worker's writes
+EVENT_SOURCE = os.environ.get('EVENT_SOURCE', 'local').lower()
+EVENT_SUBSCRIBER_QUEUE_SIZE = int(os.environ.get('EVENT_SUBSCRIBER_QUEUE_SIZE', '1000'))
+SSE_HEARTBEAT_SECONDS = float(os.environ.get('SSE_HEARTBEAT_SECONDS', '15'))
+# EventSource cannot send headers; it opens the stream with a single-use ticket valid this long
+SSE_TICKET_TTL_SECONDS = float(os.environ.get('SSE_TICKET_TTL_SECONDS', '60'))
+
+# Dashboard summary snapshot: rebuilt in the background after relevant writes, and at least
+# every max-age seconds since its date windows move with the clock
+DASHBOARD_CACHE_MAX_AGE_SECONDS = float(os.environ.get('DASHBOARD_CACHE_MAX_AGE_SECONDS', '60'))
+DASHBOARD_CACHE_DEBOUNCE_SECONDS = float(os.environ.get('DASHBOARD_CACHE_DEBOUNCE_SECONDS', '1'))
+
+# Request metrics: GET /api/metrics accepts this bearer token (for scrapers) as well as an admin JWT
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+METRICS_LATENCY_BUCKETS = tuple(float(b) for b in os.environ.get(
+    'METRICS_LATENCY_BUCKETS', '0.005,0.01,0.025,0.05,0.1,0.25,0.5,1,2.5,5,10'
+).split(','))
+
+# Slow request log: /api requests over either budget are logged with their MongoDB usage (0 disables)
+SLOW_REQUEST_MS = float(os.environ.get('SLOW_REQUEST_MS', '1000'))
+SLOW_REQUEST_DB_QUERIES = int(os.environ.get('SLOW_REQUEST_DB_QUERIES', '50'))
+
+# Date storage: "iso" keeps dates as ISO-8601 strings, "native" stores BSON dates
+# (switching to "native" converts existing documents once at startup)
+DATE_STORAGE = os.environ.get('DATE_STORAGE', 'iso').lower()
+
+# MongoDB command monitoring
+class DbQueryStats:
+    """MongoDB commands, documents returned and round-trip time attributed to one request"""
+    
+    def __init__(self):
+        self.queries = 0
+        self.documents = 0
+        self.seconds = 0.0
+        # Commands issued concurrently (asyncio.gather) complete on different threads
+        self._lock = threading.Lock()
+    
+    def record(self, seconds: float, documents: int):
+        with self._lock:
+            self.queries += 1
+            self.documents += documents
+            self.seconds += seconds
+
+# The current request's DbQueryStats; Motor copies the context into the threads running pymongo,
+# and tasks a request spawns share the same object
+db_query_stats: ContextVar[Optional[DbQueryStats]] = ContextVar("db_query_stats", default=None)
+
+def reply_document_count(reply: dict) -> int:
+    """Documents returned by a command: its cursor batch, or a findAndModify value"""
+    cursor = reply.get("cursor")
+    if cursor:
+        return len(cursor.get("firstBatch") or cursor.get("nextBatch") or [])
+    if reply.get("value") is not None:
+        return 1
+    return 0
+
+class QueryAccountingListener(monitoring.CommandListener):
+    """Charges every MongoDB command to the request that issued it and keeps per-command totals"""
+    
+    def __init__(self):
+        self.commands = {}
+        self._lock = threading.Lock()
+    
+    def _record(self, event, documents: int, failed: bool):
+        seconds = event.duration_micros / 1_000_000
+        stats = db_query_stats.get()
+        if stats is not None:
+            stats.record(seconds, documents)
+        with self._lock:
+            totals = self.commands.get(event.command_name)
+            if totals is None:
+                totals = self.commands[event.command_name] = {"count": 0, "failures": 0, "documents": 0, "seconds": 0.0}
+            totals["count"] += 1
+            totals["failures"] += failed
+            totals["documents"] += documents
+            totals["seconds"] += seconds
+    
+    def started(self, event):
+        pass
+    
+    def succeeded(self, event):
+        self._record(event, reply_document_count(event.reply), False)
+    
+    def failed(self, event):
+        self._record(event, 0, True)
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {name: dict(totals) for name, totals in self.commands.items()}
+
+db_query_listener = QueryAccountingListener()
+
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(mongo_url, tz_aware=True, event_listeners=[db_query_listener])
 db = client[os.environ['DB_NAME']]
 
 # Create the main app
-app = FastAPI(title="Engagement Pulse API")
+app = FastAPI(title="Engagement Pulse API", default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -518,15 +667,202 @@ class ActivityLog(BaseModel):
     message: str
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+# ===================== BULK CREATE MODELS =====================
+class BulkCreateRequest(BaseModel):
+    items: List[dict]
+    ordered: bool = True  # Stop at the first failure, like MongoDB ordered inserts
+
 # ===================== HELPER FUNCTIONS =====================
-def hash_password(password: str) -> str:
-    """Hash a password using SHA-256 with salt"""
+def legacy_password_hash(password: str) -> str:
+    """Static-salted SHA-256 used before bcrypt; only verified, never written"""
     salt = "engagement_pulse_salt_2026"
     return hashlib.sha256(f"{password}{salt}".encode()).hexdigest()
 
-def verify_password(password: str, password_hash: str) -> bool:
-    """Verify a password against its hash"""
-    return hash_password(password) == password_hash
+class PasswordHasher:
+    """bcrypt hashing on a bounded thread pool, so a login never blocks the event loop"""
+    
+    def __init__(self, rounds: int, workers: int):
+        self.rounds = rounds
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+    
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+    
+    async def hash(self, password: str) -> str:
+        hashed = await self._run(bcrypt.hashpw, password.encode(), bcrypt.gensalt(self.rounds))
+        return hashed.decode()
+    
+    async def verify(self, password: str, password_hash: str) -> bool:
+        if not password_hash:
+            return False
+        if password_hash.startswith("$2"):
+            try:
+                return await self._run(bcrypt.checkpw, password.encode(), password_hash.encode())
+            except ValueError:
+                return False
+        return hmac.compare_digest(legacy_password_hash(password), password_hash)
+    
+    def needs_rehash(self, password_hash: str) -> bool:
+        """True for legacy SHA-256 hashes and bcrypt hashes below the configured cost"""
+        if not password_hash.startswith("$2"):
+            return True
+        try:
+            return int(password_hash.split("$")[2]) < self.rounds
+        except (IndexError, ValueError):
+            return True
+    
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+password_hasher = PasswordHasher(PASSWORD_BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS)
+
+async def hash_password(password: str) -> str:
+    """Hash a password with bcrypt off the event loop"""
+    return await password_hasher.hash(password)
+
+async def verify_password(password: str, password_hash: str) -> bool:
+    """Verify a password against its bcrypt or legacy SHA-256 hash"""
+    return await password_hasher.verify(password, password_hash)
+
+def client_ip(request: Request) -> Optional[str]:
+    """The caller's address, as seen by the outermost of TRUSTED_PROXY_HOPS proxies.
+
+    Each proxy appends the address it received from, so only the last TRUSTED_PROXY_HOPS
+    X-Forwarded-For entries are trustworthy; anything left of them is client-supplied.
+    """
+    if TRUSTED_PROXY_HOPS:
+        forwarded = [host.strip() for host in request.headers.get("X-Forwarded-For", "").split(",") if host.strip()]
+        if forwarded:
+            return forwarded[-min(TRUSTED_PROXY_HOPS, len(forwarded))]
+    return request.client.host if request.client else None
+
+class TokenBucketStore:
+    """In-process token buckets refilling continuously, so the window slides rather than resets"""
+    
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()
+    
+    async def hit(self, key: str, limit: int, window: float) -> float:
+        """Take a token; return 0 if allowed, else seconds until one is available"""
+        now = time.monotonic()
+        rate = limit / window
+        tokens, updated = self._buckets.pop(key, (limit, now))
+        tokens = min(limit, tokens + (now - updated) * rate)
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / rate
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return retry_after
+    
+    async def reset(self, key: str, window: float):
+        self._buckets.pop(key, None)
+    
+    def __len__(self):
+        return len(self._buckets)
+
+class MongoSlidingWindowStore:
+    """Sliding-window counters in MongoDB, shared by every worker.
+
+    The previous window's count is weighted by how much of it still overlaps the
+    sliding window; expired windows are removed by a TTL index on expires_at.
+    """
+    
+    async def hit(self, key: str, limit: int, window: float) -> float:
+        now = time.time()
+        index = int(now // window)
+        elapsed = (now % window) / window
+        current, previous = await asyncio.gather(
+            db.rate_limits.find_one_and_update(
+                {"_id": f"{key}:{index}"},
+                {"$inc": {"count": 1}, "$setOnInsert": {"expires_at": datetime.fromtimestamp((index + 2) * window, timezone.utc)}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            ),
+            db.rate_limits.find_one({"_id": f"{key}:{index - 1}"})
+        )
+        current_count = current["count"]
+        previous_count = previous["count"] if previous else 0
+        if previous_count * (1 - elapsed) + current_count <= limit:
+            return 0.0
+        if current_count <= limit:
+            # Wait for enough of the previous window to slide out
+            return max((1 - (limit - current_count) / previous_count - elapsed) * window, 1.0)
+        # Wait for this window to become the previous one and partly slide out
+        return ((1 - elapsed) + (1 - limit / current_count)) * window
+    
+    async def reset(self, key: str, window: float):
+        index = int(time.time() // window)
+        await db.rate_limits.delete_many({"_id": {"$in": [f"{key}:{index}", f"{key}:{index - 1}"]}})
+    
+    def __len__(self):
+        return 0
+
+class LoginRateLimiter:
+    """Per-IP and per-email login throttle, checked before any user lookup"""
+    
+    def __init__(self, store, ip_limit: int, email_limit: int, window: float):
+        self.store = store
+        self.ip_limit = ip_limit
+        self.email_limit = email_limit
+        self.window = window
+        self.allowed = 0
+        self.throttled_ip = 0
+        self.throttled_email = 0
+    
+    async def check(self, ip: str, email: str) -> float:
+        """Record an attempt; return 0 if it may proceed, else the Retry-After seconds"""
+        if self.ip_limit and ip:
+            retry_after = await self.store.hit(f"login:ip:{ip}", self.ip_limit, self.window)
+            if retry_after:
+                self.throttled_ip += 1
+                return retry_after
+        if self.email_limit:
+            retry_after = await self.store.hit(f"login:email:{email}", self.email_limit, self.window)
+            if retry_after:
+                self.throttled_email += 1
+                return retry_after
+        self.allowed += 1
+        return 0.0
+    
+    async def succeeded(self, email: str):
+        """A correct password clears the email's failed attempts"""
+        if self.email_limit:
+            await self.store.reset(f"login:email:{email}", self.window)
+    
+    def stats(self) -> dict:
+        return {
+            "store": LOGIN_RATE_LIMIT_STORE,
+            "window_seconds": self.window,
+            "ip_limit": self.ip_limit,
+            "email_limit": self.email_limit,
+            "allowed": self.allowed,
+            "throttled_ip": self.throttled_ip,
+            "throttled_email": self.throttled_email,
+            "tracked_keys": len(self.store)
+        }
+
+login_rate_limiter = LoginRateLimiter(
+    MongoSlidingWindowStore() if LOGIN_RATE_LIMIT_STORE == "mongo" else TokenBucketStore(LOGIN_RATE_LIMIT_MAX_KEYS),
+    LOGIN_RATE_LIMIT_IP_ATTEMPTS,
+    LOGIN_RATE_LIMIT_EMAIL_ATTEMPTS,
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS
+)
+
+def normalize_email(email: str) -> str:
+    """Canonical form of an email address, used as the indexed login key"""
+    return email.strip().lower()
+
+def serialize_user(user: "User") -> dict:
+    """Serialize a user for storage along with its normalized email"""
+    doc = serialize_doc(user.model_dump())
+    doc["email_normalized"] = normalize_email(user.email)
+    return doc
 
 def create_jwt_token(user_id: str, email: str, role: str) -> str:
     """Create a JWT token"""
@@ -549,19 +885,25 @@ def decode_jwt_token(token: str) -> Optional[dict]:
     except jwt.InvalidTokenError:
         return None
 
+def get_week_start(day: datetime):
+    """Get the Monday 00:00 UTC of the week containing a date"""
+    day = day.replace(tzinfo=timezone.utc) if day.tzinfo is None else day.astimezone(timezone.utc)
+    monday = day - timedelta(days=day.weekday())
+    return monday.replace(hour=0, minute=0, second=0, microsecond=0)
+
 def get_current_week_start():
     """Get the Monday of the current week"""
-    today = datetime.now(timezone.utc)
-    monday = today - timedelta(days=today.weekday())
-    return monday.replace(hour=0, minute=0, second=0, microsecond=0)
+    return get_week_start(datetime.now(timezone.utc))
 
 def get_week_end(week_start: datetime):
     """Get the Sunday of the week"""
     return week_start + timedelta(days=6, hours=23, minutes=59, seconds=59)
 
 def serialize_datetime(dt):
-    """Serialize datetime to ISO string"""
+    """Serialize a datetime for MongoDB in the configured date storage mode"""
     if isinstance(dt, datetime):
+        if DATE_STORAGE == "native":
+            return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
         return dt.isoformat()
     return dt
 
@@ -570,7 +912,7 @@ def serialize_doc(doc):
     result = {}
     for key, value in doc.items():
         if isinstance(value, datetime):
-            result[key] = value.isoformat()
+            result[key] = serialize_datetime(value)
         elif isinstance(value, Enum):
             result[key] = value.value
         else:
@@ -589,54 +931,324 @@ def deserialize_doc(doc):
                 pass
     return doc
 
-async def calculate_health_score(engagement_id: str) -> int:
-    """Calculate health score for an engagement"""
-    engagement = await db.engagements.find_one({"engagement_id": engagement_id}, {"_id": 0})
-    if not engagement:
-        return 100
-    
+OPEN_ISSUE_STATUSES = ["OPEN", "IN_PROGRESS", "BLOCKED"]
+
+ISSUE_SEVERITY_PENALTIES = {"CRITICAL": 15, "HIGH": 8, "MEDIUM": 4, "LOW": 2}
+
+def compute_health_score(rag_status: str, open_issues_by_severity: dict, high_risks_count: int, has_current_pulse: bool) -> int:
+    """Compute a health score from already-loaded engagement signals"""
     score = 100
     
     # RAG status penalty
-    rag_status = engagement.get("rag_status", "GREEN")
     if rag_status == "AMBER":
         score -= 15
     elif rag_status == "RED":
         score -= 35
     
     # Open issues penalty
-    issues = await db.issues.find({"engagement_id": engagement_id, "status": {"$in": ["OPEN", "IN_PROGRESS", "BLOCKED"]}}, {"_id": 0}).to_list(100)
-    for issue in issues:
-        severity = issue.get("severity", "LOW")
-        if severity == "CRITICAL":
-            score -= 15
-        elif severity == "HIGH":
-            score -= 8
-        elif severity == "MEDIUM":
-            score -= 4
-        else:
-            score -= 2
+    for severity, count in open_issues_by_severity.items():
+        score -= ISSUE_SEVERITY_PENALTIES.get(severity, 2) * count
     
     # High/High risks penalty
-    risks = await db.risks.find({
-        "engagement_id": engagement_id, 
-        "status": "OPEN",
-        "probability": "HIGH",
-        "impact": "HIGH"
-    }, {"_id": 0}).to_list(100)
-    score -= len(risks) * 10
+    score -= high_risks_count * 10
     
     # Missing pulse this week
-    week_start = get_current_week_start()
-    current_pulse = await db.weekly_pulses.find_one({
-        "engagement_id": engagement_id,
-        "week_start_date": week_start.isoformat()
-    }, {"_id": 0})
-    if not current_pulse:
+    if not has_current_pulse:
         score -= 10
     
     return max(0, score)
 
+async def calculate_health_scores(engagement_ids: List[str], rag_statuses: Optional[dict] = None) -> dict:
+    """Calculate health scores for many engagements with one grouped query per signal"""
+    engagement_ids = list(dict.fromkeys(engagement_ids))
+    if not engagement_ids:
+        return {}
+    
+    if rag_statuses is None:
+        engagements = await db.engagements.find(
+            {"engagement_id": {"$in": engagement_ids}},
+            {"_id": 0, "engagement_id": 1, "rag_status": 1}
+        ).to_list(None)
+        rag_statuses = {e["engagement_id"]: e.get("rag_status", "GREEN") for e in engagements}
+    
+    # Open issues grouped by engagement and severity
+    open_issues = {}
+    issue_groups = await db.issues.aggregate([
+        {"$match": {"engagement_id": {"$in": engagement_ids}, "status": {"$in": OPEN_ISSUE_STATUSES}}},
+        {"$group": {"_id": {"engagement_id": "$engagement_id", "severity": "$severity"}, "count": {"$sum": 1}}}
+    ]).to_list(None)
+    for row in issue_groups:
+        by_severity = open_issues.setdefault(row["_id"]["engagement_id"], {})
+        by_severity[row["_id"].get("severity", "LOW")] = row["count"]
+    
+    # Open High/High risks per engagement
+    risk_groups = await db.risks.aggregate([
+        {"$match": {
+            "engagement_id": {"$in": engagement_ids},
+            "status": "OPEN",
+            "probability": "HIGH",
+            "impact": "HIGH"
+        }},
+        {"$group": {"_id": "$engagement_id", "count": {"$sum": 1}}}
+    ]).to_list(None)
+    high_risks = {row["_id"]: row["count"] for row in risk_groups}
+    
+    # Engagements with a pulse this week
+    week_start = get_current_week_start()
+    pulsed = set(await db.weekly_pulses.distinct("engagement_id", {
+        "engagement_id": {"$in": engagement_ids},
+        "week_start_date": serialize_datetime(week_start)
+    }))
+    
+    scores = {}
+    for engagement_id in engagement_ids:
+        if engagement_id not in rag_statuses:
+            scores[engagement_id] = 100
+            continue
+        scores[engagement_id] = compute_health_score(
+            rag_statuses[engagement_id],
+            open_issues.get(engagement_id, {}),
+            high_risks.get(engagement_id, 0),
+            engagement_id in pulsed
+        )
+    return scores
+
+async def calculate_health_score(engagement_id: str) -> int:
+    """Calculate health score for an engagement"""
+    scores = await calculate_health_scores([engagement_id])
+    return scores[engagement_id]
+
+async def refresh_health_score(engagement_id: Optional[str]) -> Optional[int]:
+    """Recompute and persist the materialized health score of one engagement"""
+    if not engagement_id:
+        return None
+    score = await calculate_health_score(engagement_id)
+    await db.engagements.update_one({"engagement_id": engagement_id}, {"$set": {"health_score": score}})
+    return score
+
+async def rebuild_health_scores(dry_run: bool = False, batch_size: int = 500) -> dict:
+    """Recompute every stored health score, reporting and (unless dry_run) fixing drift"""
+    checked = 0
+    drifted = []
+    
+    async def process(batch):
+        scores = await calculate_health_scores(
+            [e["engagement_id"] for e in batch],
+            {e["engagement_id"]: e.get("rag_status", "GREEN") for e in batch}
+        )
+        updates = []
+        for eng in batch:
+            computed = scores[eng["engagement_id"]]
+            if eng.get("health_score") != computed:
+                drifted.append({"engagement_id": eng["engagement_id"], "stored": eng.get("health_score"), "computed": computed})
+                updates.append(UpdateOne({"engagement_id": eng["engagement_id"]}, {"$set": {"health_score": computed}, "$inc": {"version": 1}}))
+        if updates and not dry_run:
+            await db.engagements.bulk_write(updates, ordered=False)
+            await bump_data_versions()
+    
+    batch = []
+    cursor = db.engagements.find({}, {"_id": 0, "engagement_id": 1, "rag_status": 1, "health_score": 1})
+    async for eng in cursor:
+        batch.append(eng)
+        checked += 1
+        if len(batch) >= batch_size:
+            await process(batch)
+            batch = []
+    if batch:
+        await process(batch)
+    
+    return {
+        "checked": checked,
+        "drift_count": len(drifted),
+        "updated": 0 if dry_run else len(drifted),
+        "dry_run": dry_run,
+        "drift": drifted[:100]
+    }
+
+HEALTH_SCORE_ROLLOVER_JOB = "health_score_weekly_rollover"
+
+async def run_health_score_rollover() -> bool:
+    """Rebuild health scores once per week so the missing-pulse penalty applies when a new week starts"""
+    week_start = serialize_datetime(get_current_week_start())
+    state = await db.job_state.find_one({"_id": HEALTH_SCORE_ROLLOVER_JOB})
+    if state and state.get("week_start_date") == week_start:
+        return False
+    
+    result = await rebuild_health_scores()
+    await db.job_state.update_one(
+        {"_id": HEALTH_SCORE_ROLLOVER_JOB},
+        {"$set": {"week_start_date": week_start, "ran_at": serialize_datetime(datetime.now(timezone.utc)), "updated": result["updated"]}},
+        upsert=True
+    )
+    logger.info(f"Health score rollover for week of {week_start}: {result['updated']} of {result['checked']} engagements updated")
+    return True
+
+async def health_score_rollover_loop():
+    """Run the weekly health score rollover at every Monday 00:00 UTC"""
+    while True:
+        try:
+            await run_health_score_rollover()
+            next_week_start = get_current_week_start() + timedelta(weeks=1)
+            delay = (next_week_start - datetime.now(timezone.utc)).total_seconds() + 1
+        except Exception as e:
+            logger.error(f"Health score rollover failed: {e}")
+            delay = 300
+        await asyncio.sleep(max(delay, 1))
+
+def build_engagement_enrichment_pipeline(query: dict, sort: list = None, limit: int = None) -> list:
+    """Aggregation pipeline returning engagements joined with client, consultant, issue and risk data"""
+    window = []
+    if sort:
+        window.append({"$sort": dict(sort)})
+    if limit:
+        window.append({"$limit": limit})
+    return [
+        {"$match": query},
+        *window,
+        {"$project": {"_id": 0, "version": 0}},
+        {"$lookup": {
+            "from": "clients",
+            "localField": "client_id",
+            "foreignField": "client_id",
+            "pipeline": [{"$project": {"_id": 0}}],
+            "as": "_client"
+        }},
+        {"$lookup": {
+            "from": "users",
+            "localField": "consultant_user_id",
+            "foreignField": "user_id",
+            "pipeline": [{"$project": {"_id": 0, "password_hash": 0, "email_normalized": 0}}],
+            "as": "_consultant"
+        }},
+        {"$lookup": {
+            "from": "issues",
+            "localField": "engagement_id",
+            "foreignField": "engagement_id",
+            "pipeline": [
+                {"$match": {"status": {"$in": OPEN_ISSUE_STATUSES}}},
+                {"$group": {"_id": "$severity", "count": {"$sum": 1}}}
+            ],
+            "as": "_open_issues"
+        }},
+        {"$lookup": {
+            "from": "risks",
+            "localField": "engagement_id",
+            "foreignField": "engagement_id",
+            "pipeline": [
+                {"$match": {"status": "OPEN"}},
+                {"$count": "count"}
+            ],
+            "as": "_open_risks"
+        }}
+    ]
+
+def finalize_enriched_engagement(eng: dict) -> dict:
+    """Shape an enrichment pipeline row into the engagement API response"""
+    clients = eng.pop("_client")
+    consultants = eng.pop("_consultant")
+    open_issues = {row["_id"]: row["count"] for row in eng.pop("_open_issues")}
+    open_risks = eng.pop("_open_risks")
+    
+    eng["client"] = clients[0] if clients else None
+    if eng.get("consultant_user_id"):
+        eng["consultant"] = consultants[0] if consultants else None
+    
+    eng["issues_summary"] = {
+        "critical": open_issues.get("CRITICAL", 0),
+        "high": open_issues.get("HIGH", 0),
+        "medium": open_issues.get("MEDIUM", 0),
+        "low": open_issues.get("LOW", 0)
+    }
+    eng["risks_count"] = open_risks[0]["count"] if open_risks else 0
+    return eng
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire a fixed number of seconds after being set"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+    
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key, value):
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def discard_where(self, predicate):
+        for key in [k for k in self._entries if predicate(k)]:
+            del self._entries[key]
+    
+    def clear(self):
+        self._entries.clear()
+    
+    def __len__(self):
+        return len(self._entries)
+
+# Keyed by (user_id, token iat) so a re-issued token never reads another token's entry
+principal_cache = TTLCache(PRINCIPAL_CACHE_SIZE, PRINCIPAL_CACHE_TTL_SECONDS)
+
+def invalidate_principal(user_id: str):
+    """Drop every cached principal for a user so the next request re-reads it"""
+    principal_cache.discard_where(lambda key: key[0] == user_id)
+
+async def find_missing_pulses(week_start: datetime, skip: int = 0, limit: Optional[int] = None, sort: Optional[list] = None):
+    """Return (total, page) of active engagements without a pulse for a week, enriched with consultant and client"""
+    pulsed_ids = await db.weekly_pulses.distinct("engagement_id", {"week_start_date": serialize_datetime(week_start)})
+    
+    page = [
+        {"$sort": dict(sort or [("engagement_id", 1)])},
+        {"$skip": skip}
+    ]
+    if limit:
+        page.append({"$limit": limit})
+    page += [
+        {"$lookup": {
+            "from": "users",
+            "localField": "consultant_user_id",
+            "foreignField": "user_id",
+            "pipeline": [{"$project": {"_id": 0, "password_hash": 0, "email_normalized": 0}}],
+            "as": "_consultant"
+        }},
+        {"$lookup": {
+            "from": "clients",
+            "localField": "client_id",
+            "foreignField": "client_id",
+            "pipeline": [{"$project": {"_id": 0}}],
+            "as": "_client"
+        }}
+    ]
+    result = await db.engagements.aggregate([
+        {"$match": {"is_active": True, "engagement_id": {"$nin": pulsed_ids}}},
+        {"$project": {"_id": 0, "version": 0}},
+        {"$facet": {"items": page, "total": [{"$count": "count"}]}}
+    ]).to_list(1)
+    result = result[0] if result else {"items": [], "total": []}
+    
+    missing = []
+    for eng in result["items"]:
+        consultants = eng.pop("_consultant")
+        clients = eng.pop("_client")
+        eng = deserialize_doc(eng)
+        if eng.get("consultant_user_id"):
+            eng["consultant"] = deserialize_doc(consultants[0]) if consultants else None
+        eng["client"] = deserialize_doc(clients[0]) if clients else None
+        missing.append(eng)
+    total = result["total"][0]["count"] if result["total"] else 0
+    return total, missing
+
 async def get_current_user(request: Request) -> Optional[dict]:
     """Get current user from JWT token"""
     # Check Authorization header
@@ -644,19 +1256,27 @@ async def get_current_user(request: Request) -> Optional[dict]:
     if not auth_header or not auth_header.startswith("Bearer "):
         return None
     
-    token = auth_header.split(" ")[1]
+    return await get_user_from_token(auth_header.split(" ")[1])
+
+async def get_user_from_token(token: str) -> Optional[dict]:
+    """Resolve a JWT to its active user, via the principal cache"""
     payload = decode_jwt_token(token)
     
     if not payload:
         return None
     
-    user = await db.users.find_one({"user_id": payload["user_id"]}, {"_id": 0})
-    if not user:
+    cache_key = (payload["user_id"], payload.get("iat"))
+    user = principal_cache.get(cache_key)
+    if user is not None:
+        return dict(user)
+    
+    user = await db.users.find_one({"user_id": payload["user_id"]}, {"_id": 0, "password_hash": 0, "email_normalized": 0})
+    if not user or not user.get("is_active", True):
         return None
     
-    # Don't return password_hash
-    user.pop("password_hash", None)
-    return deserialize_doc(user)
+    user = deserialize_doc(user)
+    principal_cache.set(cache_key, user)
+    return dict(user)
 
 async def require_auth(request: Request) -> dict:
     """Require authentication"""
@@ -672,8 +1292,144 @@ async def require_role(request: Request, roles: List[UserRole]) -> dict:
         raise HTTPException(status_code=403, detail="Insufficient permissions")
     return user
 
-async def log_activity(actor_user_id: str, entity_type: EntityType, entity_id: str, action: ActionType, message: str, engagement_id: str = None):
-    """Log an activity"""
+class ActivityLogWriter:
+    """Queues activity log documents and batch-inserts them from a background task.
+
+    A batch is flushed once batch_size entries are waiting or flush_interval seconds
+    have passed. Writes fall back to inline inserts when the writer is not running,
+    the queue is full, durability is "sync", or the caller marks the entry critical.
+    A batch that fails to insert is retried before any entry in it is given up on.
+    """
+    
+    def __init__(self, batch_size: int, flush_interval: float, max_queue: int):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self._queue: Optional[asyncio.Queue] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+        self.peak_queue_depth = 0
+        self.buffered_writes = 0
+        self.sync_writes = 0
+        self.batches_flushed = 0
+        self.retried_batches = 0
+        self.failed_writes = 0
+    
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+    
+    def start(self):
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._wake = asyncio.Event()
+        self._closing = False
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop the flush loop after writing out everything still queued"""
+        if not self.running:
+            return
+        self._closing = True
+        self._wake.set()
+        await self._task
+    
+    async def write(self, docs: List[dict], critical: bool = False):
+        if critical or ACTIVITY_LOG_DURABILITY == "sync" or not self.running:
+            await self._insert(docs)
+            self.sync_writes += len(docs)
+            return
+        for i, doc in enumerate(docs):
+            try:
+                self._queue.put_nowait(doc)
+            except asyncio.QueueFull:
+                # Backpressure: write the overflow inline rather than drop it
+                await self._insert(docs[i:])
+                self.sync_writes += len(docs) - i
+                break
+            self.buffered_writes += 1
+        self.peak_queue_depth = max(self.peak_queue_depth, self._queue.qsize())
+        if self._queue.qsize() >= self.batch_size:
+            self._wake.set()
+    
+    async def _insert(self, docs: List[dict]):
+        if len(docs) == 1:
+            await db.activity_logs.insert_one(docs[0])
+        elif docs:
+            await db.activity_logs.insert_many(docs, ordered=False)
+    
+    async def _run(self):
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self._drain()
+        await self._drain()
+    
+    async def _drain(self):
+        while not self._queue.empty():
+            batch = []
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            await self._flush(batch)
+    
+    async def _flush(self, batch: List[dict]):
+        """Insert a batch, retrying transient failures, then fall back to one insert per entry"""
+        for attempt in range(ACTIVITY_LOG_FLUSH_RETRIES + 1):
+            if attempt:
+                self.retried_batches += 1
+                await asyncio.sleep(ACTIVITY_LOG_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+            try:
+                await self._insert(batch)
+                self.batches_flushed += 1
+                return
+            except DuplicateKeyError:
+                # A single entry an earlier attempt already wrote
+                self.batches_flushed += 1
+                return
+            except BulkWriteError as e:
+                # Unordered: only the rows reported failed are missing, and duplicate keys
+                # (insert_many assigned _id in place) were written by an earlier attempt
+                batch = [batch[error["index"]] for error in e.details.get("writeErrors", []) if error.get("code") != 11000]
+                if not batch:
+                    self.batches_flushed += 1
+                    return
+                logger.warning(f"Activity log flush attempt {attempt + 1} left {len(batch)} entries unwritten: {e}")
+            except Exception as e:
+                logger.warning(f"Activity log flush attempt {attempt + 1} failed for {len(batch)} entries: {e}")
+        
+        # Retries exhausted: give each entry its own chance so one bad document cannot sink the rest
+        for doc in batch:
+            try:
+                await db.activity_logs.insert_one(doc)
+            except DuplicateKeyError:
+                pass
+            except Exception as e:
+                self.failed_writes += 1
+                logger.error(f"Dropped activity log entry {doc.get('log_id')} ({doc.get('action')} {doc.get('entity_type')} {doc.get('entity_id')}): {e}")
+    
+    def stats(self) -> dict:
+        return {
+            "durability": ACTIVITY_LOG_DURABILITY,
+            "running": self.running,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "peak_queue_depth": self.peak_queue_depth,
+            "max_queue": self.max_queue,
+            "batch_size": self.batch_size,
+            "flush_interval_seconds": self.flush_interval,
+            "buffered_writes": self.buffered_writes,
+            "sync_writes": self.sync_writes,
+            "batches_flushed": self.batches_flushed,
+            "retried_batches": self.retried_batches,
+            "failed_writes": self.failed_writes
+        }
+
+activity_log_writer = ActivityLogWriter(ACTIVITY_LOG_BATCH_SIZE, ACTIVITY_LOG_FLUSH_INTERVAL_SECONDS, ACTIVITY_LOG_QUEUE_SIZE)
+
+async def log_activity(actor_user_id: str, entity_type: EntityType, entity_id: str, action: ActionType, message: str, engagement_id: str = None, critical: bool = False):
+    """Log an activity; critical entries are written before returning regardless of durability mode"""
     log = ActivityLog(
         actor_user_id=actor_user_id,
         engagement_id=engagement_id,
@@ -682,17 +1438,312 @@ async def log_activity(actor_user_id: str, entity_type: EntityType, entity_id: s
         action=action,
         message=message
     )
-    await db.activity_logs.insert_one(serialize_doc(log.model_dump()))
+    await activity_log_writer.write([serialize_doc(log.model_dump())], critical=critical)
+
+async def log_activities(logs: List[ActivityLog], critical: bool = False):
+    """Log several activities in one batch"""
+    if logs:
+        await activity_log_writer.write([serialize_doc(log.model_dump()) for log in logs], critical=critical)
+
+class EventSubscription:
+    """One subscriber's bounded event queue, optionally limited to some engagements"""
+    
+    def __init__(self, engagement_ids: Optional[set], maxsize: int):
+        self.engagement_ids = engagement_ids
+        self.queue = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+    
+    def wants(self, event: dict) -> bool:
+        return self.engagement_ids is None or event.get("engagement_id") in self.engagement_ids
+    
+    def offer(self, event: dict):
+        if self.queue.full():
+            # A slow consumer loses its oldest events rather than stalling publishers
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+class EventBus:
+    """In-process pub/sub fanning mutation events out to subscribers and listeners"""
+    
+    def __init__(self, subscriber_queue_size: int):
+        self.subscriber_queue_size = subscriber_queue_size
+        self._subscriptions = set()
+        self._listeners = []
+        self._ids = itertools.count(1)
+        self.published = 0
+    
+    def subscribe(self, engagement_ids: Optional[set] = None) -> EventSubscription:
+        subscription = EventSubscription(engagement_ids, self.subscriber_queue_size)
+        self._subscriptions.add(subscription)
+        return subscription
+    
+    def unsubscribe(self, subscription: EventSubscription):
+        self._subscriptions.discard(subscription)
+    
+    def add_listener(self, listener):
+        """Register a callback invoked synchronously with every published event"""
+        self._listeners.append(listener)
+    
+    def publish(self, event: dict):
+        event = {"id": next(self._ids), **event}
+        self.published += 1
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.error(f"Event listener failed for {event['type']}: {e}")
+        for subscription in list(self._subscriptions):
+            if subscription.wants(event):
+                subscription.offer(event)
+    
+    def stats(self) -> dict:
+        return {
+            "source": EVENT_SOURCE,
+            "subscribers": len(self._subscriptions),
+            "published": self.published,
+            "dropped": sum(s.dropped for s in self._subscriptions)
+        }
+
+event_bus = EventBus(EVENT_SUBSCRIBER_QUEUE_SIZE)
+
+def mutation_event(entity: str, action: str, entity_id: Optional[str], engagement_id: Optional[str] = None, data: Optional[dict] = None) -> dict:
+    return {
+        "type": f"{entity}.{action}",
+        "entity": entity,
+        "action": action,
+        "entity_id": entity_id,
+        "engagement_id": engagement_id,
+        "at": datetime.now(timezone.utc).isoformat(),
+        "data": data
+    }
+
+def publish_mutation(entity: str, action: str, entity_id: Optional[str], engagement_id: Optional[str] = None, data: Optional[dict] = None):
+    """Announce a committed write; with the change-stream source the stream announces it instead"""
+    if EVENT_SOURCE != "change_stream":
+        event_bus.publish(mutation_event(entity, action, entity_id, engagement_id, data))
+
+async def bump_data_versions(engagement_filter: Optional[dict] = None):
+    """Advance the global data version and the version of every engagement matching the filter"""
+    writes = [db.data_versions.update_one({"_id": "global"}, {"$inc": {"version": 1}}, upsert=True)]
+    if engagement_filter:
+        writes.append(db.engagements.update_many(engagement_filter, {"$inc": {"version": 1}}))
+    await asyncio.gather(*writes)
+
+async def emit_mutation(entity: str, action: str, entity_id: Optional[str], engagement_id: Optional[str] = None, data: Optional[dict] = None):
+    """Record a committed write: bump the data versions behind ETags, then publish the event"""
+    if entity == "client":
+        engagement_filter = {"client_id": entity_id}
+    else:
+        engagement_filter = {"engagement_id": engagement_id} if engagement_id else None
+    await bump_data_versions(engagement_filter)
+    publish_mutation(entity, action, entity_id, engagement_id, data)
+
+def make_etag(request: Request, user: dict, version) -> str:
+    """Weak ETag for this URL as seen by this user at a data version, keyed so clients cannot forge it"""
+    key = f"{request.url.path}?{request.url.query}|{user['user_id']}|{user['role']}|{version}"
+    return f'W/"{hmac.new(JWT_SECRET.encode(), key.encode(), hashlib.sha1).hexdigest()}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+async def conditional_get(request: Request, response: Response, user: dict, engagement_id: Optional[str] = None,
+                          stream: bool = False, version=None) -> Optional[Response]:
+    """Stamp the response with an ETag and return a 304 if the client already holds it.
+
+    Reads scoped to an engagement key off that engagement's version, other reads off the
+    global version (or an explicit one). Streams and unknown engagements get no ETag.
+    Callers must have checked access first, so a 304 never reveals a record.
+    """
+    if wants_stream(request, stream):
+        return None
+    if version is None:
+        if engagement_id:
+            engagement = await db.engagements.find_one({"engagement_id": engagement_id}, {"_id": 0, "version": 1})
+            if not engagement:
+                return None
+            version = engagement.get("version", 0)
+        else:
+            state = await db.data_versions.find_one({"_id": "global"})
+            version = state["version"] if state else 0
+    
+    etag = make_etag(request, user, version)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+# Upper bound on any single list page; callers follow X-Next-Cursor for the rest
+MAX_PAGE_SIZE = 1000
+
+def encode_cursor(values: list) -> str:
+    """Encode the sort key values of the last row on a page as an opaque cursor"""
+    encoded = [{"$date": v.isoformat()} if isinstance(v, datetime) else v for v in values]
+    return base64.urlsafe_b64encode(json.dumps(encoded, separators=(",", ":")).encode()).decode()
+
+def decode_cursor(cursor: str, width: int) -> list:
+    """Decode a cursor produced by encode_cursor, rejecting anything malformed"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != width:
+            raise ValueError("cursor width mismatch")
+        decoded = []
+        for v in values:
+            if isinstance(v, dict) and list(v) == ["$date"]:
+                v = datetime.fromisoformat(v["$date"])
+            elif not (v is None or isinstance(v, (str, int, float))):
+                # Values are spliced into $gt/$lt and equality clauses; an object could carry operators
+                raise ValueError("cursor value is not a scalar")
+            decoded.append(v)
+        return decoded
+    except (ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def keyset_query(query: dict, sort_keys: list, cursor: Optional[str]) -> dict:
+    """Restrict a query to rows strictly after the cursor in sort_keys order.
+
+    Sort keys must be fields every document carries, ending with the entity id so
+    the order is total.
+    """
+    if not cursor:
+        return query
+    values = decode_cursor(cursor, len(sort_keys))
+    clauses = []
+    for i, (field, direction) in enumerate(sort_keys):
+        clause = {prev_field: values[j] for j, (prev_field, _) in enumerate(sort_keys[:i])}
+        clause[field] = {"$gt" if direction == ASCENDING else "$lt": values[i]}
+        clauses.append(clause)
+    return {"$and": [query, {"$or": clauses}]} if query else {"$or": clauses}
+
+def page_size(limit: int) -> int:
+    """Clamp a requested page size to 1..MAX_PAGE_SIZE"""
+    return min(max(limit, 1), MAX_PAGE_SIZE)
+
+def finish_page(docs: list, sort_keys: list, limit: int, response: Response) -> list:
+    """Trim a limit + 1 fetch to the page and set X-Next-Cursor when more rows remain"""
+    if len(docs) > limit:
+        docs = docs[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor([docs[-1].get(field) for field, _ in sort_keys])
+    return docs
+
+async def fetch_page(collection, query: dict, sort_keys: list, response: Response, limit: int,
+                     cursor: Optional[str] = None, include_total: bool = False, projection: dict = None) -> List[dict]:
+    """Fetch one keyset page of a collection, setting pagination headers on the response"""
+    limit = page_size(limit)
+    docs = await collection.find(keyset_query(query, sort_keys, cursor), projection or {"_id": 0}).sort(sort_keys).limit(limit + 1).to_list(limit + 1)
+    if include_total:
+        response.headers["X-Total-Count"] = str(await collection.count_documents(query))
+    return finish_page(docs, sort_keys, limit, response)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+def wants_stream(request: Request, stream: bool) -> bool:
+    """Whether the caller opted into NDJSON streaming via ?stream=1 or the Accept header"""
+    return stream or NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+def json_default(value):
+    """json.dumps fallback for the non-JSON types stored in documents"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def json_response(content, response: Optional[Response] = None) -> ORJSONResponse:
+    """Render documents straight from MongoDB with orjson, skipping FastAPI's jsonable_encoder.
+
+    Stored ISO date strings are emitted as-is and native dates are rendered by orjson, so
+    nothing makes the string -> datetime -> string round trip that deserialize_doc implies.
+    Headers already set on the endpoint's response (cursor, total, ETag) are carried over.
+    """
+    rendered = ORJSONResponse(content)
+    if response is not None:
+        rendered.headers.update({k: v for k, v in response.headers.items() if k not in ("content-length", "content-type")})
+    return rendered
+
+def normalize_free_form_dates(doc: dict) -> dict:
+    """Render an action item's free-text due_date as deserialize_doc did (2026-10-20 -> 2026-10-20T00:00:00).
+
+    Model date fields are stored in isoformat() already; this one keeps whatever the client sent.
+    """
+    value = doc.get("due_date")
+    if isinstance(value, str):
+        try:
+            doc["due_date"] = datetime.fromisoformat(value).isoformat()
+        except ValueError:
+            pass
+    return doc
+
+async def ndjson_lines(docs, transform):
+    """Serialize documents one per line as the database cursor yields them"""
+    async for doc in docs:
+        yield orjson.dumps(transform(doc) if transform else doc, default=json_default) + b"\n"
+
+def ndjson_response(docs, transform=None, total: Optional[int] = None) -> StreamingResponse:
+    """Stream a Motor cursor as NDJSON without materializing the result"""
+    headers = {"X-Total-Count": str(total)} if total is not None else None
+    return StreamingResponse(ndjson_lines(docs, transform), media_type=NDJSON_MEDIA_TYPE, headers=headers)
+
+async def list_documents(collection, query: dict, sort_keys: list, request: Request, response: Response, limit: int,
+                         cursor: Optional[str] = None, include_total: bool = False, stream: bool = False, projection: dict = None,
+                         validated: bool = False, transform=None):
+    """Serve a list endpoint as one keyset page, or as an NDJSON stream when requested.
+
+    A stream covers everything after the cursor in sort order, capped only by an
+    explicit limit, and carries no X-Next-Cursor. Pages are rendered directly unless
+    `validated` is set for endpoints whose response_model must still check them.
+    `transform` is applied to each document before it is rendered.
+    """
+    if wants_stream(request, stream):
+        docs = collection.find(keyset_query(query, sort_keys, cursor), projection or {"_id": 0}).sort(sort_keys)
+        if "limit" in request.query_params:
+            docs = docs.limit(page_size(limit))
+        total = await collection.count_documents(query) if include_total else None
+        return ndjson_response(docs, transform, total)
+    docs = await fetch_page(collection, query, sort_keys, response, limit, cursor, include_total, projection)
+    if transform:
+        docs = [transform(d) for d in docs]
+    if validated:
+        return [deserialize_doc(d) for d in docs]
+    return json_response(docs, response)
+
+async def build_engagement_scope_query(user: dict, engagement_id: str = None) -> dict:
+    """Filter for engagement-owned records, defaulting consultants to their engagement"""
+    query = {}
+    if engagement_id:
+        query["engagement_id"] = engagement_id
+    elif user["role"] == "CONSULTANT":
+        engagement = await db.engagements.find_one({"consultant_user_id": user["user_id"]}, {"_id": 0})
+        if engagement:
+            query["engagement_id"] = engagement["engagement_id"]
+    return query
 
 # ===================== AUTH ENDPOINTS =====================
 @api_router.post("/auth/login")
-async def login(login_data: LoginRequest):
+async def login(login_data: LoginRequest, request: Request):
     """Login with email and password"""
+    email = normalize_email(login_data.email)
+    
     try:
-        email = login_data.email.lower().strip()
+        try:
+            retry_after = await login_rate_limiter.check(client_ip(request), email)
+        except Exception as e:
+            # Fail closed: without the limiter, password guessing would be unthrottled
+            logger.error(f"Login rate limiter unavailable, refusing login: {e}")
+            raise HTTPException(status_code=503, detail="Login is temporarily unavailable. Please try again.")
+        if retry_after:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many login attempts. Try again later.",
+                headers={"Retry-After": str(math.ceil(retry_after))}
+            )
         
-        # Find user by email
-        user = await db.users.find_one({"email": {"$regex": f"^{email}$", "$options": "i"}}, {"_id": 0})
+        # Exact match on the unique email_normalized index
+        user = await db.users.find_one({"email_normalized": email}, {"_id": 0, "email_normalized": 0})
         
         if not user:
             raise HTTPException(status_code=401, detail="Invalid email or password")
@@ -705,9 +1756,22 @@ async def login(login_data: LoginRequest):
         if not user.get("password_hash"):
             raise HTTPException(status_code=401, detail="Password not set. Contact administrator.")
         
-        if not verify_password(login_data.password, user["password_hash"]):
+        if not await verify_password(login_data.password, user["password_hash"]):
             raise HTTPException(status_code=401, detail="Invalid email or password")
         
+        try:
+            await login_rate_limiter.succeeded(email)
+        except Exception as e:
+            # Fail open: the password checked out, and stale failures only expire on their own
+            logger.warning(f"Could not reset login failures for {email}: {e}")
+        
+        # Upgrade legacy or weaker hashes while the plaintext is at hand
+        if password_hasher.needs_rehash(user["password_hash"]):
+            await db.users.update_one(
+                {"user_id": user["user_id"], "password_hash": user["password_hash"]},
+                {"$set": {"password_hash": await hash_password(login_data.password)}}
+            )
+        
         # Create JWT token
         token = create_jwt_token(user["user_id"], user["email"], user["role"])
         
@@ -750,6 +1814,12 @@ async def get_me(request: Request):
         raise HTTPException(status_code=401, detail="Not authenticated")
     return user
 
+@api_router.get("/auth/login-limiter")
+async def get_login_limiter_stats(request: Request):
+    """Login throttling counters (Admin only)"""
+    await require_role(request, [UserRole.ADMIN])
+    return login_rate_limiter.stats()
+
 @api_router.post("/auth/change-password")
 async def change_password(request: Request, password_data: ChangePasswordRequest):
     """Change user password"""
@@ -760,15 +1830,16 @@ async def change_password(request: Request, password_data: ChangePasswordRequest
     
     # If user has existing password, verify current password (unless admin is resetting)
     if full_user.get("password_hash") and password_data.current_password:
-        if not verify_password(password_data.current_password, full_user["password_hash"]):
+        if not await verify_password(password_data.current_password, full_user["password_hash"]):
             raise HTTPException(status_code=400, detail="Current password is incorrect")
     
     # Hash new password and update
-    new_hash = hash_password(password_data.new_password)
+    new_hash = await hash_password(password_data.new_password)
     await db.users.update_one(
         {"user_id": user["user_id"]},
-        {"$set": {"password_hash": new_hash, "updated_at": datetime.now(timezone.utc).isoformat()}}
+        {"$set": {"password_hash": new_hash, "updated_at": serialize_datetime(datetime.now(timezone.utc))}}
     )
+    invalidate_principal(user["user_id"])
     
     return {"message": "Password changed successfully"}
 
@@ -783,21 +1854,24 @@ async def reset_password(user_id: str, password_data: ChangePasswordRequest, req
         raise HTTPException(status_code=404, detail="User not found")
     
     # Hash new password and update
-    new_hash = hash_password(password_data.new_password)
+    new_hash = await hash_password(password_data.new_password)
     await db.users.update_one(
         {"user_id": user_id},
-        {"$set": {"password_hash": new_hash, "updated_at": datetime.now(timezone.utc).isoformat()}}
+        {"$set": {"password_hash": new_hash, "updated_at": serialize_datetime(datetime.now(timezone.utc))}}
     )
+    invalidate_principal(user_id)
     
     return {"message": f"Password reset for {target_user['email']}"}
 
 # ===================== USER ENDPOINTS =====================
+USER_SORT = [("created_at", ASCENDING), ("user_id", ASCENDING)]
+
 @api_router.get("/users", response_model=List[User])
-async def get_users(request: Request):
+async def get_users(request: Request, response: Response, limit: int = MAX_PAGE_SIZE, cursor: Optional[str] = None, include_total: bool = False, stream: bool = False):
     """Get all users (Admin/Lead only)"""
     await require_role(request, [UserRole.ADMIN, UserRole.LEAD])
-    users = await db.users.find({}, {"_id": 0}).to_list(1000)
-    return [deserialize_doc(u) for u in users]
+    return await list_documents(db.users, {}, USER_SORT, request, response, limit, cursor, include_total, stream,
+                                projection={"_id": 0, "password_hash": 0, "email_normalized": 0}, validated=True)
 
 @api_router.get("/users/{user_id}")
 async def get_user(user_id: str, request: Request):
@@ -806,7 +1880,7 @@ async def get_user(user_id: str, request: Request):
     if current_user["user_id"] != user_id and current_user["role"] not in ["ADMIN", "LEAD"]:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    user = await db.users.find_one({"user_id": user_id}, {"_id": 0})
+    user = await db.users.find_one({"user_id": user_id}, {"_id": 0, "email_normalized": 0})
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return deserialize_doc(user)
@@ -816,16 +1890,20 @@ async def create_user(user_data: UserCreate, request: Request):
     """Create a new user (Admin only)"""
     await require_role(request, [UserRole.ADMIN])
     
-    existing = await db.users.find_one({"email": {"$regex": f"^{user_data.email}$", "$options": "i"}}, {"_id": 0})
+    existing = await db.users.find_one({"email_normalized": normalize_email(user_data.email)}, {"_id": 1})
     if existing:
         raise HTTPException(status_code=400, detail="User with this email already exists")
     
     # Create user with hashed password
     user_dict = user_data.model_dump()
     password = user_dict.pop("password")
-    user = User(**user_dict, password_hash=hash_password(password))
+    user = User(**user_dict, password_hash=await hash_password(password))
     
-    await db.users.insert_one(serialize_doc(user.model_dump()))
+    try:
+        await db.users.insert_one(serialize_user(user))
+    except DuplicateKeyError:
+        # Lost a race with a concurrent create for the same address
+        raise HTTPException(status_code=400, detail="User with this email already exists")
     
     # Return user without password_hash
     result = user.model_dump()
@@ -846,28 +1924,30 @@ async def update_user(user_id: str, user_data: UserUpdate, request: Request):
     
     # If password provided, hash it
     if password:
-        update_data["password_hash"] = hash_password(password)
+        update_data["password_hash"] = await hash_password(password)
     
     if not update_data:
         raise HTTPException(status_code=400, detail="No data to update")
     
-    update_data["updated_at"] = datetime.now(timezone.utc).isoformat()
+    update_data["updated_at"] = serialize_datetime(datetime.now(timezone.utc))
     
     result = await db.users.update_one({"user_id": user_id}, {"$set": update_data})
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="User not found")
+    invalidate_principal(user_id)
+    await bump_data_versions({"consultant_user_id": user_id})
     
-    user = await db.users.find_one({"user_id": user_id}, {"_id": 0})
-    user.pop("password_hash", None)
+    user = await db.users.find_one({"user_id": user_id}, {"_id": 0, "password_hash": 0, "email_normalized": 0})
     return deserialize_doc(user)
 
 # ===================== CLIENT ENDPOINTS =====================
+CLIENT_SORT = [("created_at", ASCENDING), ("client_id", ASCENDING)]
+
 @api_router.get("/clients", response_model=List[Client])
-async def get_clients(request: Request):
+async def get_clients(request: Request, response: Response, limit: int = MAX_PAGE_SIZE, cursor: Optional[str] = None, include_total: bool = False, stream: bool = False):
     """Get all clients"""
     await require_role(request, [UserRole.ADMIN, UserRole.LEAD])
-    clients = await db.clients.find({}, {"_id": 0}).to_list(1000)
-    return [deserialize_doc(c) for c in clients]
+    return await list_documents(db.clients, {}, CLIENT_SORT, request, response, limit, cursor, include_total, stream, validated=True)
 
 @api_router.get("/clients/{client_id}")
 async def get_client(client_id: str, request: Request):
@@ -885,6 +1965,7 @@ async def create_client(client_data: ClientCreate, request: Request):
     client = Client(**client_data.model_dump())
     await db.clients.insert_one(serialize_doc(client.model_dump()))
     await log_activity(user["user_id"], EntityType.ENGAGEMENT, client.client_id, ActionType.CREATE, f"Created client: {client.client_name}")
+    await emit_mutation("client", "create", client.client_id, data=client.model_dump())
     return client
 
 @api_router.put("/clients/{client_id}")
@@ -893,13 +1974,14 @@ async def update_client(client_id: str, client_data: ClientCreate, request: Requ
     user = await require_role(request, [UserRole.ADMIN])
     
     update_data = client_data.model_dump()
-    update_data["updated_at"] = datetime.now(timezone.utc).isoformat()
+    update_data["updated_at"] = serialize_datetime(datetime.now(timezone.utc))
     
     result = await db.clients.update_one({"client_id": client_id}, {"$set": update_data})
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Client not found")
     
     client = await db.clients.find_one({"client_id": client_id}, {"_id": 0})
+    await emit_mutation("client", "update", client_id, data=client)
     return deserialize_doc(client)
 
 @api_router.delete("/clients/{client_id}")
@@ -909,14 +1991,14 @@ async def delete_client(client_id: str, request: Request):
     result = await db.clients.delete_one({"client_id": client_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Client not found")
+    await emit_mutation("client", "delete", client_id)
     return {"message": "Client deleted"}
 
 # ===================== ENGAGEMENT ENDPOINTS =====================
-@api_router.get("/engagements")
-async def get_engagements(request: Request, client_id: str = None, consultant_user_id: str = None, rag_status: str = None, is_active: bool = None):
-    """Get engagements with optional filters"""
-    user = await require_auth(request)
-    
+ENGAGEMENT_SORT = [("created_at", ASCENDING), ("engagement_id", ASCENDING)]
+
+def build_engagement_query(user: dict, client_id: str = None, consultant_user_id: str = None, rag_status: str = None, is_active: bool = None) -> dict:
+    """Engagement list filter; consultants only ever see their own engagements"""
     query = {}
     if user["role"] == "CONSULTANT":
         query["consultant_user_id"] = user["user_id"]
@@ -929,42 +2011,37 @@ async def get_engagements(request: Request, client_id: str = None, consultant_us
             query["rag_status"] = rag_status
         if is_active is not None:
             query["is_active"] = is_active
-    
-    engagements = await db.engagements.find(query, {"_id": 0}).to_list(1000)
-    
-    # Enrich with client info and recalculate health scores
-    result = []
-    for eng in engagements:
-        eng = deserialize_doc(eng)
-        # Get client info
-        client = await db.clients.find_one({"client_id": eng["client_id"]}, {"_id": 0})
-        eng["client"] = deserialize_doc(client) if client else None
-        # Get consultant info
-        if eng.get("consultant_user_id"):
-            consultant = await db.users.find_one({"user_id": eng["consultant_user_id"]}, {"_id": 0})
-            eng["consultant"] = deserialize_doc(consultant) if consultant else None
-        # Recalculate health score
-        eng["health_score"] = await calculate_health_score(eng["engagement_id"])
-        # Get open issues count by severity
-        issues = await db.issues.find({"engagement_id": eng["engagement_id"], "status": {"$in": ["OPEN", "IN_PROGRESS", "BLOCKED"]}}, {"_id": 0}).to_list(100)
-        eng["issues_summary"] = {
-            "critical": len([i for i in issues if i.get("severity") == "CRITICAL"]),
-            "high": len([i for i in issues if i.get("severity") == "HIGH"]),
-            "medium": len([i for i in issues if i.get("severity") == "MEDIUM"]),
-            "low": len([i for i in issues if i.get("severity") == "LOW"])
-        }
-        # Get open risks count
-        risks = await db.risks.find({"engagement_id": eng["engagement_id"], "status": "OPEN"}, {"_id": 0}).to_list(100)
-        eng["risks_count"] = len(risks)
-        result.append(eng)
-    
-    return result
+    return query
+
+@api_router.get("/engagements")
+async def get_engagements(request: Request, response: Response, client_id: str = None, consultant_user_id: str = None, rag_status: str = None, is_active: bool = None,
+                          limit: int = MAX_PAGE_SIZE, cursor: Optional[str] = None, include_total: bool = False, stream: bool = False):
+    """Get engagements with optional filters"""
+    user = await require_auth(request)
+    query = build_engagement_query(user, client_id, consultant_user_id, rag_status, is_active)
+    not_modified = await conditional_get(request, response, user, stream=stream)
+    if not_modified:
+        return not_modified
+    
+    # Enrich with client, consultant, issues and risks in a single round trip, one page at a time
+    if wants_stream(request, stream):
+        pipeline = build_engagement_enrichment_pipeline(
+            keyset_query(query, ENGAGEMENT_SORT, cursor), sort=ENGAGEMENT_SORT,
+            limit=page_size(limit) if "limit" in request.query_params else None
+        )
+        total = await db.engagements.count_documents(query) if include_total else None
+        return ndjson_response(db.engagements.aggregate(pipeline), finalize_enriched_engagement, total)
+    limit = page_size(limit)
+    pipeline = build_engagement_enrichment_pipeline(keyset_query(query, ENGAGEMENT_SORT, cursor), sort=ENGAGEMENT_SORT, limit=limit + 1)
+    engagements = await db.engagements.aggregate(pipeline).to_list(limit + 1)
+    if include_total:
+        response.headers["X-Total-Count"] = str(await db.engagements.count_documents(query))
+    return json_response([finalize_enriched_engagement(eng) for eng in finish_page(engagements, ENGAGEMENT_SORT, limit, response)], response)
 
 @api_router.get("/engagements/{engagement_id}")
-async def get_engagement(engagement_id: str, request: Request):
+async def get_engagement(engagement_id: str, request: Request, response: Response):
     """Get engagement by ID"""
     user = await require_auth(request)
-    
     engagement = await db.engagements.find_one({"engagement_id": engagement_id}, {"_id": 0})
     if not engagement:
         raise HTTPException(status_code=404, detail="Engagement not found")
@@ -972,19 +2049,18 @@ async def get_engagement(engagement_id: str, request: Request):
     if user["role"] == "CONSULTANT" and engagement.get("consultant_user_id") != user["user_id"]:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    engagement = deserialize_doc(engagement)
+    # The version only keys the ETag; it is not part of the engagement
+    not_modified = await conditional_get(request, response, user, version=engagement.pop("version", 0))
+    if not_modified:
+        return not_modified
     
     # Enrich with related data
-    client = await db.clients.find_one({"client_id": engagement["client_id"]}, {"_id": 0})
-    engagement["client"] = deserialize_doc(client) if client else None
+    engagement["client"] = await db.clients.find_one({"client_id": engagement["client_id"]}, {"_id": 0})
     
     if engagement.get("consultant_user_id"):
-        consultant = await db.users.find_one({"user_id": engagement["consultant_user_id"]}, {"_id": 0})
-        engagement["consultant"] = deserialize_doc(consultant) if consultant else None
+        engagement["consultant"] = await db.users.find_one({"user_id": engagement["consultant_user_id"]}, {"_id": 0, "password_hash": 0, "email_normalized": 0})
     
-    engagement["health_score"] = await calculate_health_score(engagement_id)
-    
-    return engagement
+    return json_response(engagement, response)
 
 @api_router.post("/engagements", response_model=Engagement)
 async def create_engagement(engagement_data: EngagementCreate, request: Request):
@@ -1007,7 +2083,9 @@ async def create_engagement(engagement_data: EngagementCreate, request: Request)
     
     engagement = Engagement(**engagement_data.model_dump())
     await db.engagements.insert_one(serialize_doc(engagement.model_dump()))
+    engagement.health_score = await refresh_health_score(engagement.engagement_id)
     await log_activity(user["user_id"], EntityType.ENGAGEMENT, engagement.engagement_id, ActionType.CREATE, f"Created engagement: {engagement.engagement_name}", engagement.engagement_id)
+    await emit_mutation("engagement", "create", engagement.engagement_id, engagement.engagement_id, engagement.model_dump())
     return engagement
 
 @api_router.put("/engagements/{engagement_id}")
@@ -1031,19 +2109,23 @@ async def update_engagement(engagement_id: str, engagement_data: EngagementUpdat
         if other:
             raise HTTPException(status_code=400, detail="Consultant is already assigned to another active engagement")
     
-    update_data["updated_at"] = datetime.now(timezone.utc).isoformat()
+    update_data["updated_at"] = serialize_datetime(datetime.now(timezone.utc))
     
     # Serialize enums and datetimes
     for key, value in update_data.items():
         if isinstance(value, Enum):
             update_data[key] = value.value
         elif isinstance(value, datetime):
-            update_data[key] = value.isoformat()
+            update_data[key] = serialize_datetime(value)
     
     await db.engagements.update_one({"engagement_id": engagement_id}, {"$set": update_data})
-    await log_activity(user["user_id"], EntityType.ENGAGEMENT, engagement_id, ActionType.UPDATE, f"Updated engagement", engagement_id)
+    if "rag_status" in update_data:
+        await refresh_health_score(engagement_id)
+    # RAG changes are reported upward, so their audit entry must not sit in the buffer
+    await log_activity(user["user_id"], EntityType.ENGAGEMENT, engagement_id, ActionType.UPDATE, f"Updated engagement", engagement_id, critical="rag_status" in update_data)
     
-    engagement = await db.engagements.find_one({"engagement_id": engagement_id}, {"_id": 0})
+    engagement = await db.engagements.find_one({"engagement_id": engagement_id}, {"_id": 0, "version": 0})
+    await emit_mutation("engagement", "update", engagement_id, engagement_id, engagement)
     return deserialize_doc(engagement)
 
 @api_router.delete("/engagements/{engagement_id}")
@@ -1053,22 +2135,28 @@ async def delete_engagement(engagement_id: str, request: Request):
     result = await db.engagements.delete_one({"engagement_id": engagement_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Engagement not found")
+    await emit_mutation("engagement", "delete", engagement_id, engagement_id)
     return {"message": "Engagement deleted"}
 
 # ===================== WEEKLY PULSE ENDPOINTS =====================
+PULSE_SORT = [("week_start_date", DESCENDING), ("pulse_id", DESCENDING)]
+
+def build_pulse_query(user: dict, engagement_id: str = None) -> dict:
+    """Pulse list filter; consultants only ever see their own pulses"""
+    if user["role"] == "CONSULTANT":
+        return {"consultant_user_id": user["user_id"]}
+    return {"engagement_id": engagement_id} if engagement_id else {}
+
 @api_router.get("/pulses")
-async def get_pulses(request: Request, engagement_id: str = None, limit: int = 50):
+async def get_pulses(request: Request, response: Response, engagement_id: str = None, limit: int = 50, cursor: Optional[str] = None, include_total: bool = False, stream: bool = False):
     """Get pulses with optional filters"""
     user = await require_auth(request)
-    
-    query = {}
-    if user["role"] == "CONSULTANT":
-        query["consultant_user_id"] = user["user_id"]
-    elif engagement_id:
-        query["engagement_id"] = engagement_id
-    
-    pulses = await db.weekly_pulses.find(query, {"_id": 0}).sort("week_start_date", -1).to_list(limit)
-    return [deserialize_doc(p) for p in pulses]
+    query = build_pulse_query(user, engagement_id)
+    # Consultants' pulses span their engagements, so only the global version covers them
+    not_modified = await conditional_get(request, response, user, query.get("engagement_id"), stream)
+    if not_modified:
+        return not_modified
+    return await list_documents(db.weekly_pulses, query, PULSE_SORT, request, response, limit, cursor, include_total, stream)
 
 @api_router.get("/pulses/current-week/{engagement_id}")
 async def get_current_week_pulse(engagement_id: str, request: Request):
@@ -1086,7 +2174,7 @@ async def get_current_week_pulse(engagement_id: str, request: Request):
     week_start = get_current_week_start()
     pulse = await db.weekly_pulses.find_one({
         "engagement_id": engagement_id,
-        "week_start_date": week_start.isoformat()
+        "week_start_date": serialize_datetime(week_start)
     }, {"_id": 0})
     
     if not pulse:
@@ -1094,6 +2182,41 @@ async def get_current_week_pulse(engagement_id: str, request: Request):
     
     return deserialize_doc(pulse)
 
+@api_router.get("/pulses/missing")
+async def get_missing_pulses(request: Request, week_start: Optional[datetime] = None, page: int = 1, page_size: int = 50, group_by: Optional[str] = None):
+    """Get active engagements missing a pulse for a week (Admin/Lead only)"""
+    await require_role(request, [UserRole.ADMIN, UserRole.LEAD])
+    
+    if group_by not in (None, "consultant"):
+        raise HTTPException(status_code=400, detail="group_by must be 'consultant'")
+    page = max(page, 1)
+    page_size = min(max(page_size, 1), 200)
+    week = get_week_start(week_start) if week_start else get_current_week_start()
+    
+    # Grouping pages by consultant so a consultant's engagements stay together
+    sort = [("consultant_user_id", 1), ("engagement_id", 1)] if group_by == "consultant" else None
+    total, missing = await find_missing_pulses(week, skip=(page - 1) * page_size, limit=page_size, sort=sort)
+    
+    response = {
+        "week_start_date": week,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "has_more": page * page_size < total,
+        "items": missing
+    }
+    if group_by == "consultant":
+        groups = {}
+        for eng in missing:
+            group = groups.setdefault(eng.get("consultant_user_id"), {
+                "consultant_user_id": eng.get("consultant_user_id"),
+                "consultant": eng.get("consultant"),
+                "engagements": []
+            })
+            group["engagements"].append(eng)
+        response["groups"] = list(groups.values())
+    return response
+
 @api_router.get("/pulses/{pulse_id}")
 async def get_pulse(pulse_id: str, request: Request):
     """Get pulse by ID"""
@@ -1127,7 +2250,7 @@ async def create_pulse(pulse_data: WeeklyPulseCreate, request: Request):
     # Check if pulse already exists for this week
     existing = await db.weekly_pulses.find_one({
         "engagement_id": pulse_data.engagement_id,
-        "week_start_date": week_start.isoformat()
+        "week_start_date": serialize_datetime(week_start)
     }, {"_id": 0})
     
     if existing:
@@ -1143,7 +2266,7 @@ async def create_pulse(pulse_data: WeeklyPulseCreate, request: Request):
     await db.weekly_pulses.insert_one(serialize_doc(pulse.model_dump()))
     
     # Update engagement last_pulse_date and potentially RAG status
-    update_data = {"last_pulse_date": pulse.submitted_at.isoformat()}
+    update_data = {"last_pulse_date": serialize_datetime(pulse.submitted_at)}
     if not pulse_data.is_draft:
         update_data["rag_status"] = pulse_data.rag_status_this_week.value
     
@@ -1151,8 +2274,10 @@ async def create_pulse(pulse_data: WeeklyPulseCreate, request: Request):
         {"engagement_id": pulse_data.engagement_id},
         {"$set": update_data}
     )
+    await refresh_health_score(pulse_data.engagement_id)
     
     await log_activity(user["user_id"], EntityType.PULSE, pulse.pulse_id, ActionType.CREATE, f"Created pulse for week of {week_start.strftime('%Y-%m-%d')}", pulse_data.engagement_id)
+    await emit_mutation("pulse", "create", pulse.pulse_id, pulse.engagement_id, pulse.model_dump())
     
     return pulse
 
@@ -1180,7 +2305,7 @@ async def update_pulse(pulse_id: str, pulse_data: WeeklyPulseUpdate, request: Re
         raise HTTPException(status_code=400, detail="Cannot edit pulse after the week has ended")
     
     update_data = {k: v for k, v in pulse_data.model_dump().items() if v is not None}
-    update_data["updated_at"] = datetime.now(timezone.utc).isoformat()
+    update_data["updated_at"] = serialize_datetime(datetime.now(timezone.utc))
     
     # Serialize enums
     for key, value in update_data.items():
@@ -1195,40 +2320,43 @@ async def update_pulse(pulse_id: str, pulse_data: WeeklyPulseUpdate, request: Re
             {"engagement_id": pulse["engagement_id"]},
             {"$set": {"rag_status": pulse_data.rag_status_this_week.value}}
         )
+        await refresh_health_score(pulse["engagement_id"])
     
     await log_activity(user["user_id"], EntityType.PULSE, pulse_id, ActionType.UPDATE, "Updated pulse", pulse["engagement_id"])
     
     updated_pulse = await db.weekly_pulses.find_one({"pulse_id": pulse_id}, {"_id": 0})
+    await emit_mutation("pulse", "update", pulse_id, pulse["engagement_id"], updated_pulse)
     return deserialize_doc(updated_pulse)
 
 # ===================== MILESTONE ENDPOINTS =====================
+MILESTONE_SORT = [("due_date", ASCENDING), ("milestone_id", ASCENDING)]
+
 @api_router.get("/milestones")
-async def get_milestones(request: Request, engagement_id: str = None):
+async def get_milestones(request: Request, response: Response, engagement_id: str = None, limit: int = MAX_PAGE_SIZE, cursor: Optional[str] = None, include_total: bool = False, stream: bool = False):
     """Get milestones"""
     user = await require_auth(request)
-    
-    query = {}
-    if engagement_id:
-        query["engagement_id"] = engagement_id
-    elif user["role"] == "CONSULTANT":
-        engagement = await db.engagements.find_one({"consultant_user_id": user["user_id"]}, {"_id": 0})
-        if engagement:
-            query["engagement_id"] = engagement["engagement_id"]
-    
-    milestones = await db.milestones.find(query, {"_id": 0}).sort("due_date", 1).to_list(1000)
-    return [deserialize_doc(m) for m in milestones]
+    query = await build_engagement_scope_query(user, engagement_id)
+    not_modified = await conditional_get(request, response, user, engagement_id, stream)
+    if not_modified:
+        return not_modified
+    return await list_documents(db.milestones, query, MILESTONE_SORT, request, response, limit, cursor, include_total, stream)
+
+def new_milestone(milestone_data: MilestoneCreate, user: dict) -> Milestone:
+    """Build a milestone with its original due date locked"""
+    milestone_dict = milestone_data.model_dump()
+    milestone_dict["original_due_date"] = milestone_dict["due_date"]  # Lock original date
+    milestone_dict["date_change_history"] = []
+    return Milestone(**milestone_dict)
 
 @api_router.post("/milestones", response_model=Milestone)
 async def create_milestone(milestone_data: MilestoneCreate, request: Request):
     """Create a milestone"""
     user = await require_auth(request)
     
-    milestone_dict = milestone_data.model_dump()
-    milestone_dict["original_due_date"] = milestone_dict["due_date"]  # Lock original date
-    milestone_dict["date_change_history"] = []
-    milestone = Milestone(**milestone_dict)
+    milestone = new_milestone(milestone_data, user)
     await db.milestones.insert_one(serialize_doc(milestone.model_dump()))
     await log_activity(user["user_id"], EntityType.MILESTONE, milestone.milestone_id, ActionType.CREATE, f"Created milestone: {milestone.title}", milestone_data.engagement_id)
+    await emit_mutation("milestone", "create", milestone.milestone_id, milestone.engagement_id, milestone.model_dump())
     return milestone
 
 @api_router.put("/milestones/{milestone_id}")
@@ -1247,13 +2375,13 @@ async def update_milestone(milestone_id: str, milestone_data: MilestoneUpdate, r
             raise HTTPException(status_code=403, detail="Access denied")
     
     update_data = {k: v for k, v in milestone_data.model_dump().items() if v is not None}
-    update_data["updated_at"] = datetime.now(timezone.utc).isoformat()
+    update_data["updated_at"] = serialize_datetime(datetime.now(timezone.utc))
     
     for key, value in update_data.items():
         if isinstance(value, Enum):
             update_data[key] = value.value
         elif isinstance(value, datetime):
-            update_data[key] = value.isoformat()
+            update_data[key] = serialize_datetime(value)
     
     result = await db.milestones.update_one({"milestone_id": milestone_id}, {"$set": update_data})
     if result.matched_count == 0:
@@ -1261,6 +2389,7 @@ async def update_milestone(milestone_id: str, milestone_data: MilestoneUpdate, r
     
     milestone = await db.milestones.find_one({"milestone_id": milestone_id}, {"_id": 0})
     await log_activity(user["user_id"], EntityType.MILESTONE, milestone_id, ActionType.UPDATE, "Updated milestone", milestone.get("engagement_id"))
+    await emit_mutation("milestone", "update", milestone_id, milestone.get("engagement_id"), milestone)
     return deserialize_doc(milestone)
 
 @api_router.post("/milestones/{milestone_id}/change-date")
@@ -1280,11 +2409,11 @@ async def change_milestone_date(milestone_id: str, date_change: MilestoneDateCha
     
     # Create date change record
     date_change_record = {
-        "changed_at": datetime.now(timezone.utc).isoformat(),
+        "changed_at": serialize_datetime(datetime.now(timezone.utc)),
         "changed_by_user_id": user["user_id"],
         "changed_by_name": user["name"],
-        "previous_date": current_due_date.isoformat() if isinstance(current_due_date, datetime) else current_due_date,
-        "new_date": date_change.new_date.isoformat(),
+        "previous_date": serialize_datetime(current_due_date),
+        "new_date": serialize_datetime(date_change.new_date),
         "reason": date_change.reason
     }
     
@@ -1294,14 +2423,14 @@ async def change_milestone_date(milestone_id: str, date_change: MilestoneDateCha
     
     # Update milestone
     update_data = {
-        "due_date": date_change.new_date.isoformat(),
+        "due_date": serialize_datetime(date_change.new_date),
         "date_change_history": history,
-        "updated_at": datetime.now(timezone.utc).isoformat()
+        "updated_at": serialize_datetime(datetime.now(timezone.utc))
     }
     
     # Set original_due_date if not set
     if not milestone.get("original_due_date"):
-        update_data["original_due_date"] = current_due_date.isoformat() if isinstance(current_due_date, datetime) else current_due_date
+        update_data["original_due_date"] = serialize_datetime(current_due_date)
     
     await db.milestones.update_one({"milestone_id": milestone_id}, {"$set": update_data})
     
@@ -1311,10 +2440,12 @@ async def change_milestone_date(milestone_id: str, date_change: MilestoneDateCha
         milestone_id, 
         ActionType.UPDATE, 
         f"Changed due date from {current_due_date} to {date_change.new_date}: {date_change.reason}", 
-        milestone.get("engagement_id")
+        milestone.get("engagement_id"),
+        critical=True
     )
     
     updated_milestone = await db.milestones.find_one({"milestone_id": milestone_id}, {"_id": 0})
+    await emit_mutation("milestone", "update", milestone_id, milestone.get("engagement_id"), updated_milestone)
     return deserialize_doc(updated_milestone)
 
 @api_router.get("/milestones/{milestone_id}/date-history")
@@ -1350,27 +2481,28 @@ async def delete_milestone(milestone_id: str, request: Request):
             raise HTTPException(status_code=403, detail="Access denied")
     
     await db.milestones.delete_one({"milestone_id": milestone_id})
+    await emit_mutation("milestone", "delete", milestone_id, milestone.get("engagement_id"))
     return {"message": "Milestone deleted"}
 
 # ===================== RISK ENDPOINTS =====================
+RISK_SORT = [("created_at", ASCENDING), ("risk_id", ASCENDING)]
+
+async def build_risk_query(user: dict, engagement_id: str = None, status: str = None) -> dict:
+    """Risk list filter"""
+    query = await build_engagement_scope_query(user, engagement_id)
+    if status:
+        query["status"] = status
+    return query
+
 @api_router.get("/risks")
-async def get_risks(request: Request, engagement_id: str = None, status: str = None):
+async def get_risks(request: Request, response: Response, engagement_id: str = None, status: str = None, limit: int = MAX_PAGE_SIZE, cursor: Optional[str] = None, include_total: bool = False, stream: bool = False):
     """Get risks"""
     user = await require_auth(request)
-    
-    query = {}
-    if engagement_id:
-        query["engagement_id"] = engagement_id
-    elif user["role"] == "CONSULTANT":
-        engagement = await db.engagements.find_one({"consultant_user_id": user["user_id"]}, {"_id": 0})
-        if engagement:
-            query["engagement_id"] = engagement["engagement_id"]
-    
-    if status:
-        query["status"] = status
-    
-    risks = await db.risks.find(query, {"_id": 0}).to_list(1000)
-    return [deserialize_doc(r) for r in risks]
+    query = await build_risk_query(user, engagement_id, status)
+    not_modified = await conditional_get(request, response, user, engagement_id, stream)
+    if not_modified:
+        return not_modified
+    return await list_documents(db.risks, query, RISK_SORT, request, response, limit, cursor, include_total, stream)
 
 @api_router.post("/risks", response_model=Risk)
 async def create_risk(risk_data: RiskCreate, request: Request):
@@ -1379,7 +2511,9 @@ async def create_risk(risk_data: RiskCreate, request: Request):
     
     risk = Risk(**risk_data.model_dump())
     await db.risks.insert_one(serialize_doc(risk.model_dump()))
+    await refresh_health_score(risk.engagement_id)
     await log_activity(user["user_id"], EntityType.RISK, risk.risk_id, ActionType.CREATE, f"Created risk: {risk.title}", risk_data.engagement_id)
+    await emit_mutation("risk", "create", risk.risk_id, risk.engagement_id, risk.model_dump())
     return risk
 
 @api_router.put("/risks/{risk_id}")
@@ -1398,20 +2532,22 @@ async def update_risk(risk_id: str, risk_data: RiskUpdate, request: Request):
             raise HTTPException(status_code=403, detail="Access denied")
     
     update_data = {k: v for k, v in risk_data.model_dump().items() if v is not None}
-    update_data["updated_at"] = datetime.now(timezone.utc).isoformat()
+    update_data["updated_at"] = serialize_datetime(datetime.now(timezone.utc))
     
     for key, value in update_data.items():
         if isinstance(value, Enum):
             update_data[key] = value.value
         elif isinstance(value, datetime):
-            update_data[key] = value.isoformat()
+            update_data[key] = serialize_datetime(value)
     
     result = await db.risks.update_one({"risk_id": risk_id}, {"$set": update_data})
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Risk not found")
     
     risk = await db.risks.find_one({"risk_id": risk_id}, {"_id": 0})
+    await refresh_health_score(risk.get("engagement_id"))
     await log_activity(user["user_id"], EntityType.RISK, risk_id, ActionType.UPDATE, "Updated risk", risk.get("engagement_id"))
+    await emit_mutation("risk", "update", risk_id, risk.get("engagement_id"), risk)
     return deserialize_doc(risk)
 
 @api_router.delete("/risks/{risk_id}")
@@ -1430,29 +2566,32 @@ async def delete_risk(risk_id: str, request: Request):
             raise HTTPException(status_code=403, detail="Access denied")
     
     await db.risks.delete_one({"risk_id": risk_id})
+    await refresh_health_score(risk.get("engagement_id"))
+    await emit_mutation("risk", "delete", risk_id, risk.get("engagement_id"))
     return {"message": "Risk deleted"}
 
 # ===================== ISSUE ENDPOINTS =====================
-@api_router.get("/issues")
-async def get_issues(request: Request, engagement_id: str = None, status: str = None, severity: str = None):
-    """Get issues"""
-    user = await require_auth(request)
-    
-    query = {}
-    if engagement_id:
-        query["engagement_id"] = engagement_id
-    elif user["role"] == "CONSULTANT":
-        engagement = await db.engagements.find_one({"consultant_user_id": user["user_id"]}, {"_id": 0})
-        if engagement:
-            query["engagement_id"] = engagement["engagement_id"]
-    
+ISSUE_SORT = [("created_at", ASCENDING), ("issue_id", ASCENDING)]
+
+async def build_issue_query(user: dict, engagement_id: str = None, status: str = None, severity: str = None) -> dict:
+    """Issue list filter"""
+    query = await build_engagement_scope_query(user, engagement_id)
     if status:
         query["status"] = status
     if severity:
         query["severity"] = severity
-    
-    issues = await db.issues.find(query, {"_id": 0}).to_list(1000)
-    return [deserialize_doc(i) for i in issues]
+    return query
+
+@api_router.get("/issues")
+async def get_issues(request: Request, response: Response, engagement_id: str = None, status: str = None, severity: str = None,
+                     limit: int = MAX_PAGE_SIZE, cursor: Optional[str] = None, include_total: bool = False, stream: bool = False):
+    """Get issues"""
+    user = await require_auth(request)
+    query = await build_issue_query(user, engagement_id, status, severity)
+    not_modified = await conditional_get(request, response, user, engagement_id, stream)
+    if not_modified:
+        return not_modified
+    return await list_documents(db.issues, query, ISSUE_SORT, request, response, limit, cursor, include_total, stream)
 
 @api_router.post("/issues", response_model=Issue)
 async def create_issue(issue_data: IssueCreate, request: Request):
@@ -1461,7 +2600,9 @@ async def create_issue(issue_data: IssueCreate, request: Request):
     
     issue = Issue(**issue_data.model_dump())
     await db.issues.insert_one(serialize_doc(issue.model_dump()))
+    await refresh_health_score(issue.engagement_id)
     await log_activity(user["user_id"], EntityType.ISSUE, issue.issue_id, ActionType.CREATE, f"Created issue: {issue.title}", issue_data.engagement_id)
+    await emit_mutation("issue", "create", issue.issue_id, issue.engagement_id, issue.model_dump())
     return issue
 
 @api_router.put("/issues/{issue_id}")
@@ -1480,20 +2621,22 @@ async def update_issue(issue_id: str, issue_data: IssueUpdate, request: Request)
             raise HTTPException(status_code=403, detail="Access denied")
     
     update_data = {k: v for k, v in issue_data.model_dump().items() if v is not None}
-    update_data["updated_at"] = datetime.now(timezone.utc).isoformat()
+    update_data["updated_at"] = serialize_datetime(datetime.now(timezone.utc))
     
     for key, value in update_data.items():
         if isinstance(value, Enum):
             update_data[key] = value.value
         elif isinstance(value, datetime):
-            update_data[key] = value.isoformat()
+            update_data[key] = serialize_datetime(value)
     
     result = await db.issues.update_one({"issue_id": issue_id}, {"$set": update_data})
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Issue not found")
     
     issue = await db.issues.find_one({"issue_id": issue_id}, {"_id": 0})
+    await refresh_health_score(issue.get("engagement_id"))
     await log_activity(user["user_id"], EntityType.ISSUE, issue_id, ActionType.UPDATE, "Updated issue", issue.get("engagement_id"))
+    await emit_mutation("issue", "update", issue_id, issue.get("engagement_id"), issue)
     return deserialize_doc(issue)
 
 @api_router.delete("/issues/{issue_id}")
@@ -1512,24 +2655,19 @@ async def delete_issue(issue_id: str, request: Request):
             raise HTTPException(status_code=403, detail="Access denied")
     
     await db.issues.delete_one({"issue_id": issue_id})
+    await refresh_health_score(issue.get("engagement_id"))
+    await emit_mutation("issue", "delete", issue_id, issue.get("engagement_id"))
     return {"message": "Issue deleted"}
 
 # ===================== CONTACT ENDPOINTS =====================
+CONTACT_SORT = [("created_at", ASCENDING), ("contact_id", ASCENDING)]
+
 @api_router.get("/contacts")
-async def get_contacts(request: Request, engagement_id: str = None):
+async def get_contacts(request: Request, response: Response, engagement_id: str = None, limit: int = MAX_PAGE_SIZE, cursor: Optional[str] = None, include_total: bool = False, stream: bool = False):
     """Get contacts"""
     user = await require_auth(request)
-    
-    query = {}
-    if engagement_id:
-        query["engagement_id"] = engagement_id
-    elif user["role"] == "CONSULTANT":
-        engagement = await db.engagements.find_one({"consultant_user_id": user["user_id"]}, {"_id": 0})
-        if engagement:
-            query["engagement_id"] = engagement["engagement_id"]
-    
-    contacts = await db.contacts.find(query, {"_id": 0}).to_list(1000)
-    return [deserialize_doc(c) for c in contacts]
+    query = await build_engagement_scope_query(user, engagement_id)
+    return await list_documents(db.contacts, query, CONTACT_SORT, request, response, limit, cursor, include_total, stream)
 
 @api_router.post("/contacts", response_model=Contact)
 async def create_contact(contact_data: ContactCreate, request: Request):
@@ -1539,6 +2677,7 @@ async def create_contact(contact_data: ContactCreate, request: Request):
     contact = Contact(**contact_data.model_dump())
     await db.contacts.insert_one(serialize_doc(contact.model_dump()))
     await log_activity(user["user_id"], EntityType.CONTACT, contact.contact_id, ActionType.CREATE, f"Created contact: {contact.name}", contact_data.engagement_id)
+    await emit_mutation("contact", "create", contact.contact_id, contact.engagement_id, contact.model_dump())
     return contact
 
 @api_router.put("/contacts/{contact_id}")
@@ -1557,7 +2696,7 @@ async def update_contact(contact_id: str, contact_data: ContactUpdate, request:
             raise HTTPException(status_code=403, detail="Access denied")
     
     update_data = {k: v for k, v in contact_data.model_dump().items() if v is not None}
-    update_data["updated_at"] = datetime.now(timezone.utc).isoformat()
+    update_data["updated_at"] = serialize_datetime(datetime.now(timezone.utc))
     
     for key, value in update_data.items():
         if isinstance(value, Enum):
@@ -1569,6 +2708,7 @@ async def update_contact(contact_id: str, contact_data: ContactUpdate, request:
     
     contact = await db.contacts.find_one({"contact_id": contact_id}, {"_id": 0})
     await log_activity(user["user_id"], EntityType.CONTACT, contact_id, ActionType.UPDATE, "Updated contact", contact.get("engagement_id"))
+    await emit_mutation("contact", "update", contact_id, contact.get("engagement_id"), contact)
     return deserialize_doc(contact)
 
 @api_router.delete("/contacts/{contact_id}")
@@ -1587,18 +2727,22 @@ async def delete_contact(contact_id: str, request: Request):
             raise HTTPException(status_code=403, detail="Access denied")
     
     await db.contacts.delete_one({"contact_id": contact_id})
+    await emit_mutation("contact", "delete", contact_id, contact.get("engagement_id"))
     return {"message": "Contact deleted"}
 
 # ===================== MEETING ENDPOINTS =====================
+MEETING_SORT = [("date", DESCENDING), ("meeting_id", DESCENDING)]
+
+def build_meeting_query(engagement_id: str = None) -> dict:
+    """Meeting list filter"""
+    return {"engagement_id": engagement_id} if engagement_id else {}
+
 @api_router.get("/meetings")
-async def get_meetings(request: Request, engagement_id: Optional[str] = None):
+async def get_meetings(request: Request, response: Response, engagement_id: Optional[str] = None, limit: int = 200, cursor: Optional[str] = None, include_total: bool = False, stream: bool = False):
     """Get meetings, optionally filtered by engagement"""
     user = await require_auth(request)
-    query = {}
-    if engagement_id:
-        query["engagement_id"] = engagement_id
-    meetings = await db.meetings.find(query, {"_id": 0}).sort("date", -1).to_list(200)
-    return [deserialize_doc(m) for m in meetings]
+    query = build_meeting_query(engagement_id)
+    return await list_documents(db.meetings, query, MEETING_SORT, request, response, limit, cursor, include_total, stream)
 
 @api_router.post("/meetings")
 async def create_meeting(meeting_data: MeetingCreate, request: Request):
@@ -1610,9 +2754,10 @@ async def create_meeting(meeting_data: MeetingCreate, request: Request):
         if isinstance(value, Enum):
             meeting_dict[key] = value.value
         elif isinstance(value, datetime):
-            meeting_dict[key] = value.isoformat()
+            meeting_dict[key] = serialize_datetime(value)
     await db.meetings.insert_one(meeting_dict)
     result = await db.meetings.find_one({"meeting_id": meeting_dict["meeting_id"]}, {"_id": 0})
+    await emit_mutation("meeting", "create", meeting.meeting_id, meeting.engagement_id, result)
     return deserialize_doc(result)
 
 @api_router.put("/meetings/{meeting_id}")
@@ -1629,13 +2774,14 @@ async def update_meeting(meeting_id: str, meeting_data: MeetingUpdate, request:
             raise HTTPException(status_code=403, detail="Access denied")
     
     update_data = {k: v for k, v in meeting_data.model_dump().items() if v is not None}
-    update_data["updated_at"] = datetime.now(timezone.utc).isoformat()
+    update_data["updated_at"] = serialize_datetime(datetime.now(timezone.utc))
     for key, value in update_data.items():
         if isinstance(value, Enum):
             update_data[key] = value.value
     
     await db.meetings.update_one({"meeting_id": meeting_id}, {"$set": update_data})
     result = await db.meetings.find_one({"meeting_id": meeting_id}, {"_id": 0})
+    await emit_mutation("meeting", "update", meeting_id, existing["engagement_id"], result)
     return deserialize_doc(result)
 
 @api_router.delete("/meetings/{meeting_id}")
@@ -1653,35 +2799,43 @@ async def delete_meeting(meeting_id: str, request: Request):
     
     await db.meetings.delete_one({"meeting_id": meeting_id})
     await db.action_items.delete_many({"meeting_id": meeting_id})
+    await emit_mutation("meeting", "delete", meeting_id, meeting["engagement_id"])
     return {"message": "Meeting deleted"}
 
 # ===================== ACTION ITEM ENDPOINTS =====================
-@api_router.get("/action-items")
-async def get_action_items(request: Request, engagement_id: Optional[str] = None, meeting_id: Optional[str] = None):
-    """Get action items, optionally filtered"""
-    user = await require_auth(request)
+ACTION_ITEM_SORT = [("created_at", DESCENDING), ("action_item_id", DESCENDING)]
+
+def build_action_item_query(engagement_id: str = None, meeting_id: str = None) -> dict:
+    """Action item list filter"""
     query = {}
     if engagement_id:
         query["engagement_id"] = engagement_id
     if meeting_id:
         query["meeting_id"] = meeting_id
-    items = await db.action_items.find(query, {"_id": 0}).sort("created_at", -1).to_list(500)
-    return [deserialize_doc(i) for i in items]
+    return query
+
+@api_router.get("/action-items")
+async def get_action_items(request: Request, response: Response, engagement_id: Optional[str] = None, meeting_id: Optional[str] = None,
+                           limit: int = 500, cursor: Optional[str] = None, include_total: bool = False, stream: bool = False):
+    """Get action items, optionally filtered"""
+    user = await require_auth(request)
+    query = build_action_item_query(engagement_id, meeting_id)
+    return await list_documents(db.action_items, query, ACTION_ITEM_SORT, request, response, limit, cursor, include_total, stream,
+                                transform=normalize_free_form_dates)
+
+def new_action_item(item_data: ActionItemCreate, user: dict) -> ActionItem:
+    """Build an action item owned by its creator"""
+    return ActionItem(**item_data.model_dump(), created_by=user["user_id"])
 
 @api_router.post("/action-items")
 async def create_action_item(item_data: ActionItemCreate, request: Request):
     """Create a new action item"""
     user = await require_auth(request)
-    item = ActionItem(**item_data.model_dump(), created_by=user["user_id"])
-    item_dict = item.model_dump()
-    for key, value in item_dict.items():
-        if isinstance(value, Enum):
-            item_dict[key] = value.value
-        elif isinstance(value, datetime):
-            item_dict[key] = value.isoformat()
+    item_dict = serialize_doc(new_action_item(item_data, user).model_dump())
     await db.action_items.insert_one(item_dict)
-    result = await db.action_items.find_one({"action_item_id": item_dict["action_item_id"]}, {"_id": 0})
-    return deserialize_doc(result)
+    item_dict.pop("_id", None)
+    await emit_mutation("action_item", "create", item_dict["action_item_id"], item_dict["engagement_id"], item_dict)
+    return deserialize_doc(item_dict)
 
 @api_router.put("/action-items/{action_item_id}")
 async def update_action_item(action_item_id: str, item_data: ActionItemUpdate, request: Request):
@@ -1697,13 +2851,14 @@ async def update_action_item(action_item_id: str, item_data: ActionItemUpdate, r
             raise HTTPException(status_code=403, detail="Access denied")
     
     update_data = {k: v for k, v in item_data.model_dump().items() if v is not None}
-    update_data["updated_at"] = datetime.now(timezone.utc).isoformat()
+    update_data["updated_at"] = serialize_datetime(datetime.now(timezone.utc))
     for key, value in update_data.items():
         if isinstance(value, Enum):
             update_data[key] = value.value
     
     await db.action_items.update_one({"action_item_id": action_item_id}, {"$set": update_data})
     result = await db.action_items.find_one({"action_item_id": action_item_id}, {"_id": 0})
+    await emit_mutation("action_item", "update", action_item_id, existing["engagement_id"], result)
     return deserialize_doc(result)
 
 @api_router.delete("/action-items/{action_item_id}")
@@ -1720,112 +2875,304 @@ async def delete_action_item(action_item_id: str, request: Request):
             raise HTTPException(status_code=403, detail="Access denied")
     
     await db.action_items.delete_one({"action_item_id": action_item_id})
+    await emit_mutation("action_item", "delete", action_item_id, item["engagement_id"])
     return {"message": "Action item deleted"}
 
+# ===================== BULK CREATE =====================
+BULK_MAX_ITEMS = 1000
+
+# URL entity -> how to validate, build, store and log each item
+BULK_ENTITIES = {
+    "milestones": {
+        "event": "milestone",
+        "collection": "milestones",
+        "create_model": MilestoneCreate,
+        "factory": new_milestone,
+        "id_field": "milestone_id",
+        "entity_type": EntityType.MILESTONE,
+        "message": lambda m: f"Created milestone: {m.title}",
+    },
+    "risks": {
+        "event": "risk",
+        "collection": "risks",
+        "create_model": RiskCreate,
+        "factory": lambda data, user: Risk(**data.model_dump()),
+        "id_field": "risk_id",
+        "entity_type": EntityType.RISK,
+        "message": lambda r: f"Created risk: {r.title}",
+        "refreshes_health": True,
+    },
+    "issues": {
+        "event": "issue",
+        "collection": "issues",
+        "create_model": IssueCreate,
+        "factory": lambda data, user: Issue(**data.model_dump()),
+        "id_field": "issue_id",
+        "entity_type": EntityType.ISSUE,
+        "message": lambda i: f"Created issue: {i.title}",
+        "refreshes_health": True,
+    },
+    "contacts": {
+        "event": "contact",
+        "collection": "contacts",
+        "create_model": ContactCreate,
+        "factory": lambda data, user: Contact(**data.model_dump()),
+        "id_field": "contact_id",
+        "entity_type": EntityType.CONTACT,
+        "message": lambda c: f"Created contact: {c.name}",
+    },
+    # Single action item creates are not activity-logged either
+    "action-items": {
+        "event": "action_item",
+        "collection": "action_items",
+        "create_model": ActionItemCreate,
+        "factory": new_action_item,
+        "id_field": "action_item_id",
+    },
+}
+
+def format_validation_error(error: ValidationError) -> str:
+    """Flatten pydantic errors into one readable line"""
+    return "; ".join(f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in error.errors())
+
+@api_router.post("/{entity}/bulk")
+async def bulk_create(entity: str, bulk: BulkCreateRequest, request: Request):
+    """Create many milestones, risks, issues, contacts or action items in one request"""
+    user = await require_auth(request)
+    spec = BULK_ENTITIES.get(entity)
+    if not spec:
+        raise HTTPException(status_code=404, detail=f"Bulk create not supported for {entity}")
+    if len(bulk.items) > BULK_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {BULK_MAX_ITEMS} items per request")
+    
+    results = [None] * len(bulk.items)
+    models, positions = [], []
+    for index, raw in enumerate(bulk.items):
+        try:
+            model = spec["factory"](spec["create_model"].model_validate(raw), user)
+        except ValidationError as e:
+            results[index] = {"index": index, "ok": False, "error": format_validation_error(e)}
+            if bulk.ordered:
+                break
+            continue
+        models.append(model)
+        positions.append(index)
+    
+    written, write_errors = set(), {}
+    if models:
+        try:
+            await db[spec["collection"]].insert_many([serialize_doc(m.model_dump()) for m in models], ordered=bulk.ordered)
+            written = set(range(len(models)))
+        except BulkWriteError as e:
+            write_errors = {err["index"]: err.get("errmsg", "Write failed") for err in e.details.get("writeErrors", [])}
+            # An ordered insert stops at its first failure; an unordered one writes everything else
+            if bulk.ordered:
+                written = set(range(min(write_errors, default=len(models))))
+            else:
+                written = set(range(len(models))) - set(write_errors)
+    
+    for i, (index, model) in enumerate(zip(positions, models)):
+        if i in written:
+            results[index] = {"index": index, "ok": True, "id": getattr(model, spec["id_field"]), "item": model}
+        elif i in write_errors:
+            results[index] = {"index": index, "ok": False, "error": write_errors[i]}
+    for index, result in enumerate(results):
+        if result is None:
+            results[index] = {"index": index, "ok": False, "error": "Not attempted after an earlier failure"}
+    
+    inserted = [models[i] for i in sorted(written)]
+    if inserted and spec.get("entity_type"):
+        await log_activities([
+            ActivityLog(
+                actor_user_id=user["user_id"],
+                engagement_id=m.engagement_id,
+                entity_type=spec["entity_type"],
+                entity_id=getattr(m, spec["id_field"]),
+                action=ActionType.CREATE,
+                message=spec["message"](m)
+            )
+            for m in inserted
+        ])
+    if spec.get("refreshes_health"):
+        for engagement_id in {m.engagement_id for m in inserted}:
+            await refresh_health_score(engagement_id)
+    if inserted:
+        await bump_data_versions({"engagement_id": {"$in": list({m.engagement_id for m in inserted})}})
+    for m in inserted:
+        publish_mutation(spec["event"], "create", getattr(m, spec["id_field"]), m.engagement_id, m.model_dump())
+    
+    return {
+        "ordered": bulk.ordered,
+        "inserted": len(inserted),
+        "failed": len(results) - len(inserted),
+        "results": results
+    }
+
 # ===================== ENGAGEMENT 4-BLOCKER OVERVIEW =====================
 @api_router.get("/engagements/{engagement_id}/four-blocker")
-async def get_engagement_four_blocker(engagement_id: str, request: Request):
+async def get_engagement_four_blocker(engagement_id: str, request: Request, response: Response):
     """Get AI-powered 4-blocker summary for an engagement (Pulse, Milestones, Risks, Issues)"""
     user = await require_auth(request)
-    
-    # Get engagement
     engagement = await db.engagements.find_one({"engagement_id": engagement_id}, {"_id": 0})
     if not engagement:
         raise HTTPException(status_code=404, detail="Engagement not found")
     
-    # Get latest pulse
-    latest_pulse = await db.weekly_pulses.find_one(
-        {"engagement_id": engagement_id, "is_draft": {"$ne": True}},
-        {"_id": 0},
-        sort=[("week_start_date", -1)]
-    )
+    if user["role"] == "CONSULTANT" and engagement.get("consultant_user_id") != user["user_id"]:
+        raise HTTPException(status_code=403, detail="Access denied")
     
-    # Get milestones
-    milestones = await db.milestones.find({"engagement_id": engagement_id}, {"_id": 0}).sort("due_date", 1).to_list(100)
+    not_modified = await conditional_get(request, response, user, version=await windowed_version(engagement))
+    if not_modified:
+        return not_modified
     
-    # Get risks
-    risks = await db.risks.find({"engagement_id": engagement_id}, {"_id": 0}).to_list(100)
+    # Latest pulse and one $facet per related collection, in parallel
+    latest_pulse, stats = await asyncio.gather(
+        db.weekly_pulses.find_one(
+            {"engagement_id": engagement_id, "is_draft": {"$ne": True}},
+            {"_id": 0},
+            sort=[("week_start_date", -1)]
+        ),
+        aggregate_four_blocker_stats(engagement_id)
+    )
     
-    # Get issues
-    issues = await db.issues.find({"engagement_id": engagement_id}, {"_id": 0}).to_list(100)
+    return json_response(assemble_four_blocker(engagement, latest_pulse, stats), response)
+
+FOUR_BLOCKER_UPCOMING_DAYS = 14
+FOUR_BLOCKER_LIST_SIZE = 5
+
+def count_where(condition) -> dict:
+    return {"$sum": {"$cond": [condition, 1, 0]}}
+
+def facet_count(match: dict) -> list:
+    return [{"$match": match}, {"$count": "count"}]
+
+def facet_items(match: dict, sort_keys: list) -> list:
+    return [{"$match": match}, {"$sort": dict(sort_keys)}, {"$limit": FOUR_BLOCKER_LIST_SIZE}, {"$project": {"_id": 0}}]
+
+async def facet_stats(collection, engagement_id: str, facets: dict) -> dict:
+    """Run one $facet over an engagement's documents, unwrapping $group and $count rows"""
+    rows = await collection.aggregate([{"$match": {"engagement_id": engagement_id}}, {"$facet": facets}]).to_list(1)
+    stats = {}
+    for name, value in (rows[0] if rows else {}).items():
+        if name == "counts":
+            stats.update({k: v for k, v in value[0].items() if k != "_id"} if value else {})
+        elif facets[name][-1].get("$count"):
+            stats[name] = value[0]["count"] if value else 0
+        else:
+            stats[name] = value
+    return stats
+
+def four_blocker_windows(now: datetime) -> tuple:
+    """Stored-value bounds (today, upcoming_end) of the overdue and upcoming windows at `now`"""
+    # (due - now).days <= 14 holds for anything due within the next 15 days
+    return serialize_datetime(now), serialize_datetime(now + timedelta(days=FOUR_BLOCKER_UPCOMING_DAYS + 1))
+
+async def aggregate_four_blocker_stats(engagement_id: str) -> dict:
+    """Compute every 4-blocker count and short list server-side, one $facet per collection"""
+    now = datetime.now(timezone.utc)
+    today, upcoming_end = four_blocker_windows(now)
+    not_done = {"status": {"$ne": "DONE"}}
+    upcoming = {**not_done, "due_date": {"$gt": today, "$lt": upcoming_end}}
+    overdue = {**not_done, "due_date": {"$lt": today}}
+    open_risk = {"status": "OPEN"}
+    open_issue = {"status": {"$nin": ["RESOLVED", "CLOSED"]}}
+    
+    milestones, risks, issues, meetings, action_items = await asyncio.gather(
+        facet_stats(db.milestones, engagement_id, {
+            "counts": [{"$group": {
+                "_id": None,
+                "total": {"$sum": 1},
+                "completed": count_where({"$eq": ["$status", "DONE"]}),
+                "at_risk": count_where({"$eq": ["$status", "AT_RISK"]}),
+                "date_changes": count_where({"$gt": [{"$size": {"$ifNull": ["$date_change_history", []]}}, 0]})
+            }}],
+            "upcoming": facet_items(upcoming, MILESTONE_SORT),
+            "upcoming_count": facet_count(upcoming),
+            "overdue": facet_items(overdue, MILESTONE_SORT),
+            "overdue_count": facet_count(overdue)
+        }),
+        facet_stats(db.risks, engagement_id, {
+            "counts": [{"$group": {"_id": None, "total": {"$sum": 1}}}],
+            "open": facet_count(open_risk),
+            "high_impact": facet_count({**open_risk, "probability": "HIGH", "impact": "HIGH"}),
+            "open_risks": facet_items(open_risk, RISK_SORT)
+        }),
+        facet_stats(db.issues, engagement_id, {
+            "counts": [{"$group": {"_id": None, "total": {"$sum": 1}}}],
+            "open": facet_count(open_issue),
+            "critical": facet_count({**open_issue, "severity": "CRITICAL"}),
+            "high": facet_count({**open_issue, "severity": "HIGH"}),
+            "open_issues": facet_items(open_issue, ISSUE_SORT)
+        }),
+        facet_stats(db.meetings, engagement_id, {
+            "counts": [{"$group": {
+                "_id": None,
+                "total": {"$sum": 1},
+                "upcoming": count_where({"$eq": ["$status", "SCHEDULED"]}),
+                "completed": count_where({"$eq": ["$status", "COMPLETED"]})
+            }}]
+        }),
+        facet_stats(db.action_items, engagement_id, {
+            "counts": [{"$group": {
+                "_id": None,
+                "total": {"$sum": 1},
+                "done": count_where({"$eq": ["$status", "DONE"]})
+            }}],
+            # Action item due dates are free-form strings; only ISO-looking ones can be overdue
+            "overdue": facet_count({**not_done, "due_date": {"$regex": r"^\d{4}-\d{2}-\d{2}", "$lt": now.isoformat()}})
+        })
+    )
     
-    # Get meetings and action items
-    meetings = await db.meetings.find({"engagement_id": engagement_id}, {"_id": 0}).to_list(200)
-    action_items = await db.action_items.find({"engagement_id": engagement_id}, {"_id": 0}).to_list(500)
+    action_items["open"] = action_items.get("total", 0) - action_items.get("done", 0)
+    return {
+        "milestones": milestones,
+        "risks": risks,
+        "issues": issues,
+        "meetings": meetings,
+        "action_items": action_items
+    }
+
+async def windowed_version(engagement: dict) -> str:
+    """Engagement version plus the next due dates at which the 4-blocker's time windows change.
+
+    Overdue and upcoming counts move with the clock, not only with writes, so the ETag
+    seed changes exactly when the clock passes one of these due dates.
+    """
+    now = datetime.now(timezone.utc)
+    today, upcoming_end = four_blocker_windows(now)
+    not_done = {"engagement_id": engagement["engagement_id"], "status": {"$ne": "DONE"}}
     
-    # Calculate milestone stats
-    total_milestones = len(milestones)
-    completed_milestones = len([m for m in milestones if m.get("status") == "DONE"])
-    at_risk_milestones = len([m for m in milestones if m.get("status") == "AT_RISK"])
-    milestones_with_date_changes = len([m for m in milestones if m.get("date_change_history") and len(m.get("date_change_history", [])) > 0])
+    async def next_due(collection, bound: dict):
+        doc = await collection.find_one({**not_done, "due_date": bound}, {"_id": 0, "due_date": 1}, sort=[("due_date", ASCENDING)])
+        return doc["due_date"] if doc else None
     
-    # Upcoming milestones (next 14 days)
-    today = datetime.now(timezone.utc)
-    upcoming = []
-    for ms in milestones:
-        due = ms.get("due_date")
-        if isinstance(due, str):
-            due = datetime.fromisoformat(due.replace('Z', '+00:00'))
-        if due:
-            if due.tzinfo is None:
-                due = due.replace(tzinfo=timezone.utc)
-            if due > today and (due - today).days <= 14 and ms.get("status") != "DONE":
-                upcoming.append(ms)
-    
-    # Overdue milestones
-    overdue = []
-    for ms in milestones:
-        due = ms.get("due_date")
-        if isinstance(due, str):
-            due = datetime.fromisoformat(due.replace('Z', '+00:00'))
-        if due:
-            if due.tzinfo is None:
-                due = due.replace(tzinfo=timezone.utc)
-            if due < today and ms.get("status") != "DONE":
-                overdue.append(ms)
-    
-    # Risk stats
-    open_risks = [r for r in risks if r.get("status") == "OPEN"]
-    high_risks = [r for r in open_risks if r.get("probability") == "HIGH" and r.get("impact") == "HIGH"]
-    
-    # Issue stats
-    open_issues = [i for i in issues if i.get("status") not in ["RESOLVED", "CLOSED"]]
-    critical_issues = [i for i in open_issues if i.get("severity") == "CRITICAL"]
-    high_issues = [i for i in open_issues if i.get("severity") == "HIGH"]
+    crossings = await asyncio.gather(
+        next_due(db.milestones, {"$gte": today}),  # next milestone to fall overdue
+        next_due(db.milestones, {"$gte": upcoming_end}),  # next milestone to enter the upcoming window
+        next_due(db.action_items, {"$regex": r"^\d{4}-\d{2}-\d{2}", "$gte": now.isoformat()})
+    )
+    return f"{engagement.get('version', 0)}@" + "|".join(str(c) for c in crossings)
+
+def assemble_four_blocker(engagement, latest_pulse, stats: dict) -> dict:
+    """Shape precomputed 4-blocker counts and short lists into the API response"""
+    ms = {"total": 0, "completed": 0, "at_risk": 0, "date_changes": 0, "upcoming": [], "upcoming_count": 0, "overdue": [], "overdue_count": 0, **stats["milestones"]}
+    risks = {"total": 0, "open": 0, "high_impact": 0, "open_risks": [], **stats["risks"]}
+    issues = {"total": 0, "open": 0, "critical": 0, "high": 0, "open_issues": [], **stats["issues"]}
+    meetings = {"total": 0, "upcoming": 0, "completed": 0, **stats["meetings"]}
+    action_items = {"total": 0, "open": 0, "overdue": 0, "done": 0, **stats["action_items"]}
     
     # Generate AI summaries
     pulse_summary = _generate_pulse_summary(latest_pulse) if latest_pulse else {"status": "NO_PULSE", "message": "No pulse submitted yet"}
-    milestone_summary = _generate_milestone_summary(milestones, upcoming, overdue, milestones_with_date_changes)
-    risk_summary = _generate_risk_summary(risks, open_risks, high_risks)
-    issue_summary = _generate_issue_summary(issues, open_issues, critical_issues, high_issues)
-    
-    # Meeting & action item stats
-    upcoming_meetings = [m for m in meetings if m.get("status") == "SCHEDULED"]
-    completed_meetings = [m for m in meetings if m.get("status") == "COMPLETED"]
-    open_action_items = [a for a in action_items if a.get("status") != "DONE"]
-    overdue_action_items = []
-    for ai in open_action_items:
-        ai_due = ai.get("due_date")
-        if ai_due:
-            if isinstance(ai_due, str):
-                try:
-                    ai_due_dt = datetime.fromisoformat(ai_due.replace('Z', '+00:00'))
-                except Exception:
-                    continue
-            else:
-                ai_due_dt = ai_due
-            if ai_due_dt.tzinfo is None:
-                ai_due_dt = ai_due_dt.replace(tzinfo=timezone.utc)
-            if ai_due_dt < today:
-                overdue_action_items.append(ai)
+    milestone_summary = _generate_milestone_summary(ms["total"], ms["completed"], ms["upcoming_count"], ms["overdue_count"], ms["date_changes"])
+    risk_summary = _generate_risk_summary(risks["total"], risks["open"], risks["high_impact"])
+    issue_summary = _generate_issue_summary(issues["total"], issues["open"], issues["critical"], issues["high"])
     
     meetings_summary = {
-        "status": "CRITICAL" if len(overdue_action_items) > 2 else "ATTENTION" if len(overdue_action_items) > 0 else "HEALTHY",
-        "message": f"{len(upcoming_meetings)} upcoming meeting(s), {len(completed_meetings)} completed. {len(open_action_items)} open action item(s), {len(overdue_action_items)} overdue."
+        "status": "CRITICAL" if action_items["overdue"] > 2 else "ATTENTION" if action_items["overdue"] > 0 else "HEALTHY",
+        "message": f"{meetings['upcoming']} upcoming meeting(s), {meetings['completed']} completed. {action_items['open']} open action item(s), {action_items['overdue']} overdue."
     }
     
     return {
-        "engagement_id": engagement_id,
+        "engagement_id": engagement["engagement_id"],
         "engagement_name": engagement.get("engagement_name"),
         "rag_status": engagement.get("rag_status"),
         "health_score": engagement.get("health_score"),
@@ -1834,41 +3181,41 @@ async def get_engagement_four_blocker(engagement_id: str, request: Request):
             "summary": pulse_summary
         },
         "milestones_block": {
-            "total": total_milestones,
-            "completed": completed_milestones,
-            "at_risk": at_risk_milestones,
-            "overdue": len(overdue),
-            "upcoming": upcoming[:5],
-            "overdue_list": overdue[:5],
-            "date_changes_count": milestones_with_date_changes,
+            "total": ms["total"],
+            "completed": ms["completed"],
+            "at_risk": ms["at_risk"],
+            "overdue": ms["overdue_count"],
+            "upcoming": ms["upcoming"],
+            "overdue_list": ms["overdue"],
+            "date_changes_count": ms["date_changes"],
             "summary": milestone_summary
         },
         "risks_block": {
-            "total": len(risks),
-            "open": len(open_risks),
-            "high_impact": len(high_risks),
-            "open_risks": open_risks[:5],
+            "total": risks["total"],
+            "open": risks["open"],
+            "high_impact": risks["high_impact"],
+            "open_risks": risks["open_risks"],
             "summary": risk_summary
         },
         "issues_block": {
-            "total": len(issues),
-            "open": len(open_issues),
-            "critical": len(critical_issues),
-            "high": len(high_issues),
-            "open_issues": open_issues[:5],
+            "total": issues["total"],
+            "open": issues["open"],
+            "critical": issues["critical"],
+            "high": issues["high"],
+            "open_issues": issues["open_issues"],
             "summary": issue_summary
         },
         "meetings_block": {
-            "total": len(meetings),
-            "upcoming": len(upcoming_meetings),
-            "completed": len(completed_meetings),
+            "total": meetings["total"],
+            "upcoming": meetings["upcoming"],
+            "completed": meetings["completed"],
             "summary": meetings_summary
         },
         "action_items_block": {
-            "total": len(action_items),
-            "open": len(open_action_items),
-            "overdue": len(overdue_action_items),
-            "done": len([a for a in action_items if a.get("status") == "DONE"]),
+            "total": action_items["total"],
+            "open": action_items["open"],
+            "overdue": action_items["overdue"],
+            "done": action_items["done"],
             "summary": meetings_summary
         }
     }
@@ -1895,48 +3242,48 @@ def _generate_pulse_summary(pulse):
         "sentiment": pulse.get("sentiment")
     }
 
-def _generate_milestone_summary(milestones, upcoming, overdue, date_changes):
-    """Generate AI summary for milestones"""
-    if not milestones:
+def _generate_milestone_summary(total, completed, upcoming, overdue, date_changes):
+    """Generate AI summary for milestones from their counts"""
+    if not total:
         return {"status": "INFO", "message": "No milestones defined"}
     
-    if len(overdue) > 0:
+    if overdue > 0:
         return {
             "status": "CRITICAL",
-            "message": f"{len(overdue)} milestone(s) overdue! {len(upcoming)} due in next 2 weeks.",
+            "message": f"{overdue} milestone(s) overdue! {upcoming} due in next 2 weeks.",
             "action": "Review and update overdue milestones",
             "date_changes_note": f"{date_changes} milestone(s) had date changes" if date_changes > 0 else None
         }
-    elif len(upcoming) > 0:
+    elif upcoming > 0:
         return {
             "status": "ATTENTION",
-            "message": f"{len(upcoming)} milestone(s) due in the next 2 weeks",
+            "message": f"{upcoming} milestone(s) due in the next 2 weeks",
             "action": "Ensure progress is on track",
             "date_changes_note": f"{date_changes} milestone(s) had date changes" if date_changes > 0 else None
         }
     else:
-        completion_rate = (len([m for m in milestones if m.get("status") == "DONE"]) / len(milestones)) * 100 if milestones else 0
+        completion_rate = completed / total * 100
         return {
             "status": "HEALTHY",
             "message": f"All milestones on track. {completion_rate:.0f}% complete.",
             "date_changes_note": f"{date_changes} milestone(s) had date changes" if date_changes > 0 else None
         }
 
-def _generate_risk_summary(risks, open_risks, high_risks):
-    """Generate AI summary for risks"""
-    if not risks:
+def _generate_risk_summary(total, open_risks, high_risks):
+    """Generate AI summary for risks from their counts"""
+    if not total:
         return {"status": "INFO", "message": "No risks identified"}
     
-    if len(high_risks) > 0:
+    if high_risks > 0:
         return {
             "status": "CRITICAL",
-            "message": f"{len(high_risks)} high-probability/high-impact risk(s) require immediate attention",
+            "message": f"{high_risks} high-probability/high-impact risk(s) require immediate attention",
             "action": "Review mitigation plans for high risks"
         }
-    elif len(open_risks) > 0:
+    elif open_risks > 0:
         return {
             "status": "ATTENTION",
-            "message": f"{len(open_risks)} open risk(s) being monitored",
+            "message": f"{open_risks} open risk(s) being monitored",
             "action": "Continue monitoring and mitigation efforts"
         }
     else:
@@ -1945,27 +3292,27 @@ def _generate_risk_summary(risks, open_risks, high_risks):
             "message": "All risks mitigated or closed"
         }
 
-def _generate_issue_summary(issues, open_issues, critical_issues, high_issues):
-    """Generate AI summary for issues"""
-    if not issues:
+def _generate_issue_summary(total, open_issues, critical_issues, high_issues):
+    """Generate AI summary for issues from their counts"""
+    if not total:
         return {"status": "INFO", "message": "No issues reported"}
     
-    if len(critical_issues) > 0:
+    if critical_issues > 0:
         return {
             "status": "CRITICAL",
-            "message": f"{len(critical_issues)} critical issue(s) need immediate resolution",
+            "message": f"{critical_issues} critical issue(s) need immediate resolution",
             "action": "Escalate and resolve critical issues"
         }
-    elif len(high_issues) > 0:
+    elif high_issues > 0:
         return {
             "status": "ATTENTION",
-            "message": f"{len(high_issues)} high-priority issue(s) in progress",
+            "message": f"{high_issues} high-priority issue(s) in progress",
             "action": "Track progress on high-priority issues"
         }
-    elif len(open_issues) > 0:
+    elif open_issues > 0:
         return {
             "status": "MONITORING",
-            "message": f"{len(open_issues)} open issue(s) being tracked"
+            "message": f"{open_issues} open issue(s) being tracked"
         }
     else:
         return {
@@ -1973,6 +3320,91 @@ def _generate_issue_summary(issues, open_issues, critical_issues, high_issues):
             "message": "All issues resolved"
         }
 
+# ===================== ENGAGEMENT BUNDLE =====================
+BUNDLE_SECTIONS = ["engagement", "pulses", "milestones", "risks", "issues", "contacts", "rag_trend", "four_blocker", "meetings", "action_items"]
+
+# Collections each section is derived from
+BUNDLE_SECTION_SOURCES = {
+    "engagement": [],
+    "pulses": ["pulses"],
+    "milestones": ["milestones"],
+    "risks": ["risks"],
+    "issues": ["issues"],
+    "contacts": ["contacts"],
+    "rag_trend": ["pulses"],
+    "four_blocker": ["pulses", "four_blocker_stats"],
+    "meetings": ["meetings"],
+    "action_items": ["action_items"],
+}
+
+@api_router.get("/engagements/{engagement_id}/bundle")
+async def get_engagement_bundle(engagement_id: str, request: Request, response: Response, fields: Optional[str] = None):
+    """Get an engagement and all its detail-page sections in one request, loading each collection once"""
+    user = await require_auth(request)
+    sections = [f.strip() for f in fields.split(",") if f.strip()] if fields else BUNDLE_SECTIONS
+    unknown = [f for f in sections if f not in BUNDLE_SECTIONS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown bundle field(s): {', '.join(unknown)}")
+    
+    engagement = await db.engagements.find_one({"engagement_id": engagement_id}, {"_id": 0})
+    if not engagement:
+        raise HTTPException(status_code=404, detail="Engagement not found")
+    
+    if user["role"] == "CONSULTANT" and engagement.get("consultant_user_id") != user["user_id"]:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    # Only the 4-blocker section depends on the clock
+    version = await windowed_version(engagement) if "four_blocker" in sections else engagement.get("version", 0)
+    not_modified = await conditional_get(request, response, user, version=version)
+    if not_modified:
+        return not_modified
+    engagement.pop("version", None)
+    
+    sources = {source for section in sections for source in BUNDLE_SECTION_SOURCES[section]}
+    queries = {
+        "pulses": lambda: db.weekly_pulses.find({"engagement_id": engagement_id}, {"_id": 0}).sort(PULSE_SORT).to_list(50),
+        "milestones": lambda: db.milestones.find({"engagement_id": engagement_id}, {"_id": 0}).sort(MILESTONE_SORT).to_list(MAX_PAGE_SIZE),
+        "risks": lambda: db.risks.find({"engagement_id": engagement_id}, {"_id": 0}).sort(RISK_SORT).to_list(MAX_PAGE_SIZE),
+        "issues": lambda: db.issues.find({"engagement_id": engagement_id}, {"_id": 0}).sort(ISSUE_SORT).to_list(MAX_PAGE_SIZE),
+        "contacts": lambda: db.contacts.find({"engagement_id": engagement_id}, {"_id": 0}).sort(CONTACT_SORT).to_list(MAX_PAGE_SIZE),
+        "meetings": lambda: db.meetings.find({"engagement_id": engagement_id}, {"_id": 0}).sort(MEETING_SORT).to_list(200),
+        "action_items": lambda: db.action_items.find({"engagement_id": engagement_id}, {"_id": 0}).sort(ACTION_ITEM_SORT).to_list(500),
+        "four_blocker_stats": lambda: aggregate_four_blocker_stats(engagement_id),
+    }
+    if "engagement" in sections:
+        queries["client"] = lambda: db.clients.find_one({"client_id": engagement["client_id"]}, {"_id": 0})
+        queries["consultant"] = lambda: db.users.find_one({"user_id": engagement.get("consultant_user_id")}, {"_id": 0, "password_hash": 0, "email_normalized": 0})
+        sources |= {"client", "consultant"}
+    
+    names = [name for name in queries if name in sources]
+    results = await asyncio.gather(*(queries[name]() for name in names))
+    loaded = dict(zip(names, results))
+    
+    bundle = {}
+    if "four_blocker" in sections:
+        latest_pulse = next((p for p in loaded["pulses"] if p.get("is_draft") is not True), None)
+        bundle["four_blocker"] = assemble_four_blocker(engagement, latest_pulse, loaded["four_blocker_stats"])
+    if "rag_trend" in sections:
+        recent = [p for p in loaded["pulses"] if p.get("is_draft") is False][:8]
+        bundle["rag_trend"] = [{
+            "week_start_date": p.get("week_start_date"),
+            "rag_status": p.get("rag_status_this_week"),
+            "pulse_id": p.get("pulse_id")
+        } for p in reversed(recent)]
+    if "engagement" in sections:
+        enriched = dict(engagement)
+        enriched["client"] = loaded["client"]
+        if enriched.get("consultant_user_id"):
+            enriched["consultant"] = loaded["consultant"]
+        bundle["engagement"] = enriched
+    for section in ["pulses", "milestones", "risks", "issues", "contacts", "meetings", "action_items"]:
+        if section in sections:
+            bundle[section] = loaded[section]
+    if "action_items" in sections:
+        bundle["action_items"] = [normalize_free_form_dates(item) for item in bundle["action_items"]]
+    
+    return json_response(bundle, response)
+
 @api_router.get("/milestones/date-changes")
 async def get_all_milestone_date_changes(request: Request, engagement_id: str = None):
     """Get all milestone date changes across engagements"""
@@ -2003,8 +3435,11 @@ async def get_all_milestone_date_changes(request: Request, engagement_id: str =
     all_changes.sort(key=lambda x: x.get("changed_at", ""), reverse=True)
     
     return all_changes
+
+ACTIVITY_LOG_SORT = [("created_at", DESCENDING), ("log_id", DESCENDING)]
+
 @api_router.get("/activity-logs")
-async def get_activity_logs(request: Request, engagement_id: str = None, limit: int = 50):
+async def get_activity_logs(request: Request, response: Response, engagement_id: str = None, limit: int = 50, cursor: Optional[str] = None, include_total: bool = False, stream: bool = False):
     """Get activity logs"""
     await require_role(request, [UserRole.ADMIN, UserRole.LEAD])
     
@@ -2012,109 +3447,713 @@ async def get_activity_logs(request: Request, engagement_id: str = None, limit:
     if engagement_id:
         query["engagement_id"] = engagement_id
     
-    logs = await db.activity_logs.find(query, {"_id": 0}).sort("created_at", -1).to_list(limit)
-    return [deserialize_doc(l) for l in logs]
+    return await list_documents(db.activity_logs, query, ACTIVITY_LOG_SORT, request, response, limit, cursor, include_total, stream)
 
-# ===================== DASHBOARD ENDPOINTS =====================
-@api_router.get("/dashboard/summary")
-async def get_dashboard_summary(request: Request):
-    """Get dashboard summary for leaders"""
-    await require_role(request, [UserRole.ADMIN, UserRole.LEAD])
-    
-    # RAG counts
-    rag_counts = {
-        "GREEN": await db.engagements.count_documents({"rag_status": "GREEN", "is_active": True}),
-        "AMBER": await db.engagements.count_documents({"rag_status": "AMBER", "is_active": True}),
-        "RED": await db.engagements.count_documents({"rag_status": "RED", "is_active": True})
+@api_router.get("/activity-logs/writer")
+async def get_activity_log_writer_stats(request: Request):
+    """Activity log writer queue depth and flush counters (Admin only)"""
+    await require_role(request, [UserRole.ADMIN])
+    return activity_log_writer.stats()
+
+# ===================== ACTIVITY LOG RETENTION =====================
+ACTIVITY_LOG_ARCHIVE_JOB = "activity_log_archive"
+ACTIVITY_LOG_TTL_INDEX = "activity_log_ttl"
+ACTIVITY_LOG_ARCHIVE_BATCH_SIZE = 5000
+
+def archive_month(created_at) -> str:
+    """Monthly archive partition (YYYY-MM) for a stored created_at"""
+    return _parse_stored_date(created_at).strftime("%Y-%m")
+
+def archive_file_path(month: str) -> Path:
+    return ACTIVITY_LOG_ARCHIVE_DIR / f"activity_logs-{month}.jsonl.gz"
+
+def encode_archive_lines(logs: List[dict]) -> bytes:
+    return "".join(json.dumps(log, default=json_default) + "\n" for log in logs).encode()
+
+def append_archive_file(month: str, data: bytes):
+    """Append one gzip member to a month's archive file (readers see the members as one stream)"""
+    ACTIVITY_LOG_ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+    with gzip.open(archive_file_path(month), "ab") as f:
+        f.write(data)
+
+async def write_archive_chunk(month: str, logs: List[dict]):
+    """Persist one month's slice of an archive batch"""
+    data = encode_archive_lines(logs)
+    if ACTIVITY_LOG_ARCHIVE == "files":
+        await asyncio.to_thread(append_archive_file, month, data)
+        return
+    # Keyed on the first entry so re-running an interrupted pass rewrites the same chunk
+    await db.activity_log_archive.replace_one(
+        {"_id": f"{month}:{logs[0]['log_id']}"},
+        {
+            "month": month,
+            "count": len(logs),
+            "first_created_at": logs[0]["created_at"],
+            "last_created_at": logs[-1]["created_at"],
+            "archived_at": serialize_datetime(datetime.now(timezone.utc)),
+            "data": gzip.compress(data)
+        },
+        upsert=True
+    )
+
+async def archive_activity_logs(now: Optional[datetime] = None) -> dict:
+    """Move activity log entries past the retention window into the monthly archive"""
+    if ACTIVITY_LOG_RETENTION_DAYS <= 0:
+        return {"archived": 0, "months": [], "cutoff": None}
+    cutoff = serialize_datetime((now or datetime.now(timezone.utc)) - timedelta(days=ACTIVITY_LOG_RETENTION_DAYS))
+    archived, months = 0, set()
+    while True:
+        batch = await db.activity_logs.find({"created_at": {"$lt": cutoff}}, {"_id": 0}) \
+            .sort([("created_at", ASCENDING), ("log_id", ASCENDING)]) \
+            .limit(ACTIVITY_LOG_ARCHIVE_BATCH_SIZE).to_list(ACTIVITY_LOG_ARCHIVE_BATCH_SIZE)
+        if not batch:
+            break
+        by_month = {}
+        for log in batch:
+            by_month.setdefault(archive_month(log["created_at"]), []).append(log)
+        for month, logs in by_month.items():
+            await write_archive_chunk(month, logs)
+        # Only delete once the batch is safely archived
+        await db.activity_logs.delete_many({"log_id": {"$in": [log["log_id"] for log in batch]}})
+        archived += len(batch)
+        months.update(by_month)
+    return {"archived": archived, "months": sorted(months), "cutoff": cutoff}
+
+async def ensure_activity_log_ttl_index():
+    """Keep the created_at TTL index in line with the configured retention"""
+    indexes = await db.activity_logs.index_information()
+    if ACTIVITY_LOG_RETENTION_DAYS <= 0:
+        if ACTIVITY_LOG_TTL_INDEX in indexes:
+            await db.activity_logs.drop_index(ACTIVITY_LOG_TTL_INDEX)
+        return
+    seconds = (ACTIVITY_LOG_RETENTION_DAYS + ACTIVITY_LOG_TTL_GRACE_DAYS) * 86400
+    if ACTIVITY_LOG_TTL_INDEX not in indexes:
+        await db.activity_logs.create_index([("created_at", ASCENDING)], name=ACTIVITY_LOG_TTL_INDEX, expireAfterSeconds=seconds)
+    elif indexes[ACTIVITY_LOG_TTL_INDEX].get("expireAfterSeconds") != seconds:
+        await db.command("collMod", "activity_logs", index={"name": ACTIVITY_LOG_TTL_INDEX, "expireAfterSeconds": seconds})
+
+async def run_activity_log_archive() -> dict:
+    """Archive expired activity logs and record the run"""
+    result = await archive_activity_logs()
+    await db.job_state.update_one(
+        {"_id": ACTIVITY_LOG_ARCHIVE_JOB},
+        {"$set": {"ran_at": serialize_datetime(datetime.now(timezone.utc)), "archived": result["archived"]}},
+        upsert=True
+    )
+    if result["archived"]:
+        logger.info(f"Archived {result['archived']} activity log entries into {', '.join(result['months'])}")
+    return result
+
+async def activity_log_archive_loop():
+    """Archive expired activity logs daily at 00:00 UTC"""
+    try:
+        await ensure_activity_log_ttl_index()
+    except Exception as e:
+        logger.error(f"Could not ensure activity log TTL index: {e}")
+    while True:
+        try:
+            await run_activity_log_archive()
+            tomorrow = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+            delay = (tomorrow - datetime.now(timezone.utc)).total_seconds() + 1
+        except Exception as e:
+            logger.error(f"Activity log archive failed: {e}")
+            delay = 300
+        await asyncio.sleep(max(delay, 1))
+
+def read_archive_file(month: str) -> List[dict]:
+    path = archive_file_path(month)
+    if not path.exists():
+        return []
+    with gzip.open(path, "rt") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+async def read_archive_month(month: str) -> List[dict]:
+    """All archived entries for a month, oldest first, without duplicates from re-run passes"""
+    if ACTIVITY_LOG_ARCHIVE == "files":
+        logs = await asyncio.to_thread(read_archive_file, month)
+    else:
+        logs = []
+        async for chunk in db.activity_log_archive.find({"month": month}).sort("first_created_at", ASCENDING):
+            logs.extend(json.loads(line) for line in gzip.decompress(chunk["data"]).decode().splitlines() if line)
+    seen, unique = set(), []
+    for log in logs:
+        if log["log_id"] not in seen:
+            seen.add(log["log_id"])
+            unique.append(log)
+    unique.sort(key=lambda log: (log["created_at"], log["log_id"]))
+    return unique
+
+@api_router.get("/activity-logs/archive")
+async def get_activity_log_archive_months(request: Request):
+    """List archived activity log months (Admin only)"""
+    await require_role(request, [UserRole.ADMIN])
+    if ACTIVITY_LOG_ARCHIVE == "files":
+        files = sorted(ACTIVITY_LOG_ARCHIVE_DIR.glob("activity_logs-*.jsonl.gz")) if ACTIVITY_LOG_ARCHIVE_DIR.exists() else []
+        months = [{"month": f.name[len("activity_logs-"):-len(".jsonl.gz")], "size_bytes": f.stat().st_size} for f in files]
+    else:
+        rows = await db.activity_log_archive.aggregate([
+            {"$group": {"_id": "$month", "count": {"$sum": "$count"}, "chunks": {"$sum": 1}}},
+            {"$sort": {"_id": 1}}
+        ]).to_list(None)
+        months = [{"month": row["_id"], "count": row["count"], "chunks": row["chunks"]} for row in rows]
+    return {"storage": ACTIVITY_LOG_ARCHIVE, "retention_days": ACTIVITY_LOG_RETENTION_DAYS, "months": months}
+
+@api_router.post("/activity-logs/archive/run")
+async def run_activity_log_archive_now(request: Request):
+    """Archive activity logs past the retention window now (Admin only)"""
+    await require_role(request, [UserRole.ADMIN])
+    return await run_activity_log_archive()
+
+@api_router.get("/activity-logs/archive/{month}")
+async def get_archived_activity_logs(month: str, request: Request, engagement_id: str = None, entity_type: str = None,
+                                     actor_user_id: str = None, skip: int = 0, limit: int = 100):
+    """Query one archived month of activity logs (Admin only)"""
+    await require_role(request, [UserRole.ADMIN])
+    try:
+        datetime.strptime(month, "%Y-%m")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="month must be YYYY-MM")
+    limit = page_size(limit)
+    skip = max(skip, 0)
+    
+    logs = [
+        log for log in await read_archive_month(month)
+        if (not engagement_id or log.get("engagement_id") == engagement_id)
+        and (not entity_type or log.get("entity_type") == entity_type)
+        and (not actor_user_id or log.get("actor_user_id") == actor_user_id)
+    ]
+    return {
+        "month": month,
+        "total": len(logs),
+        "skip": skip,
+        "limit": limit,
+        "items": [deserialize_doc(log) for log in logs[skip:skip + limit]]
+    }
+
+# ===================== PORTFOLIO EXPORT =====================
+# Rows are buffered per chunk; nothing holds more than one chunk of a collection
+EXPORT_CHUNK_SIZE = 1000
+
+# Export name -> (collection, model whose fields become columns, sort order)
+EXPORT_COLLECTIONS = {
+    "engagements": ("engagements", Engagement, ENGAGEMENT_SORT),
+    "pulses": ("weekly_pulses", WeeklyPulse, PULSE_SORT),
+    "milestones": ("milestones", Milestone, MILESTONE_SORT),
+    "risks": ("risks", Risk, RISK_SORT),
+    "issues": ("issues", Issue, ISSUE_SORT),
+    "meetings": ("meetings", Meeting, MEETING_SORT),
+    "action_items": ("action_items", ActionItem, ACTION_ITEM_SORT),
+}
+
+# Milestones export one row per date change, with the change fields under this prefix
+MILESTONE_CHANGE_PREFIX = "date_change_"
+
+def export_column_kind(annotation) -> str:
+    """Map a model field annotation to an export column kind"""
+    if get_origin(annotation) is Union:
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            annotation = args[0]
+    if isinstance(annotation, type):
+        if issubclass(annotation, bool):
+            return "bool"
+        if issubclass(annotation, str):
+            return "string"
+        if issubclass(annotation, int):
+            return "int"
+        if issubclass(annotation, float):
+            return "float"
+        if issubclass(annotation, datetime):
+            return "datetime"
+    return "json"
+
+def export_columns(model, exclude: tuple = (), prefix: str = "") -> List[tuple]:
+    """(column, kind) pairs for a model's fields"""
+    return [
+        (prefix + name, export_column_kind(field.annotation))
+        for name, field in model.model_fields.items()
+        if name not in exclude
+    ]
+
+def export_schema(name: str) -> List[tuple]:
+    """Column layout for an export"""
+    if name == "milestones":
+        return export_columns(Milestone, exclude=("date_change_history",)) + export_columns(MilestoneDateChange, prefix=MILESTONE_CHANGE_PREFIX)
+    return export_columns(EXPORT_COLLECTIONS[name][1])
+
+def export_cell(value, kind: str):
+    """Coerce a stored value to its column kind, so every chunk shares one schema"""
+    if value is None:
+        return None
+    if kind == "datetime":
+        value = _parse_stored_date(value)
+        return value if isinstance(value, datetime) else None
+    if kind == "string":
+        if isinstance(value, Enum):
+            return value.value
+        return value.isoformat() if isinstance(value, datetime) else str(value)
+    if kind in ("int", "float"):
+        # Legacy or free-form values ("", "N/A") become empty cells; raising would truncate the stream
+        try:
+            return int(value) if kind == "int" else float(value)
+        except (ValueError, TypeError, OverflowError):
+            return None
+    if kind == "bool":
+        return bool(value)
+    return json.dumps(value, default=json_default)
+
+def export_rows(name: str, doc: dict, columns: List[tuple]) -> List[list]:
+    """Flatten one document into export rows"""
+    if name != "milestones":
+        return [[export_cell(doc.get(column), kind) for column, kind in columns]]
+    rows = []
+    for change in doc.get("date_change_history") or [{}]:
+        rows.append([
+            export_cell(change.get(column[len(MILESTONE_CHANGE_PREFIX):]) if column.startswith(MILESTONE_CHANGE_PREFIX) else doc.get(column), kind)
+            for column, kind in columns
+        ])
+    return rows
+
+async def export_chunks(docs, name: str, columns: List[tuple]):
+    """Group cursor output into chunks of export rows"""
+    chunk = []
+    async for doc in docs:
+        chunk.extend(export_rows(name, doc, columns))
+        if len(chunk) >= EXPORT_CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+async def csv_stream(chunks, columns: List[tuple]):
+    """Write export chunks as CSV text"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([column for column, _ in columns])
+    yield buffer.getvalue()
+    async for chunk in chunks:
+        buffer.seek(0)
+        buffer.truncate(0)
+        writer.writerows([
+            [cell.isoformat() if isinstance(cell, datetime) else cell for cell in row]
+            for row in chunk
+        ])
+        yield buffer.getvalue()
+
+class ParquetSink:
+    """Write-only file object whose bytes are drained into the response as they are written"""
+    closed = False
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def write(self, data) -> int:
+        self.buffer.extend(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = bytes(self.buffer)
+        self.buffer.clear()
+        return data
+
+def load_parquet_modules():
+    """Import pandas and pyarrow on first use; Parquet export is unavailable without them"""
+    try:
+        import pandas
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise HTTPException(status_code=501, detail="Parquet export requires pandas and pyarrow")
+    return pandas, pyarrow, pyarrow.parquet
+
+async def parquet_stream(chunks, columns: List[tuple]):
+    """Write export chunks as Parquet row groups, one per chunk"""
+    pd, pa, pq = load_parquet_modules()
+    types = {
+        "string": pa.string(),
+        "json": pa.string(),
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "bool": pa.bool_(),
+        "datetime": pa.timestamp("us", tz="UTC"),
     }
+    schema = pa.schema([(column, types[kind]) for column, kind in columns])
+    names = [column for column, _ in columns]
+    sink = ParquetSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        async for chunk in chunks:
+            frame = pd.DataFrame(chunk, columns=names, dtype=object)
+            writer.write_table(pa.Table.from_pandas(frame, schema=schema, preserve_index=False))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+async def build_export_query(name: str, user: dict, engagement_id: str = None, client_id: str = None, consultant_user_id: str = None,
+                             rag_status: str = None, is_active: bool = None, status: str = None, severity: str = None, meeting_id: str = None) -> dict:
+    """Apply the same filters the matching list endpoint accepts"""
+    if name == "engagements":
+        return build_engagement_query(user, client_id, consultant_user_id, rag_status, is_active)
+    if name == "pulses":
+        return build_pulse_query(user, engagement_id)
+    if name == "milestones":
+        return await build_engagement_scope_query(user, engagement_id)
+    if name == "risks":
+        return await build_risk_query(user, engagement_id, status)
+    if name == "issues":
+        return await build_issue_query(user, engagement_id, status, severity)
+    if name == "meetings":
+        return build_meeting_query(engagement_id)
+    return build_action_item_query(engagement_id, meeting_id)
+
+@api_router.get("/export/{collection}")
+async def export_collection(collection: str, request: Request, format: str = "csv", engagement_id: str = None, client_id: str = None,
+                            consultant_user_id: str = None, rag_status: str = None, is_active: bool = None,
+                            status: str = None, severity: str = None, meeting_id: str = None):
+    """Stream a portfolio collection as CSV or Parquet (Admin/Lead only)"""
+    user = await require_role(request, [UserRole.ADMIN, UserRole.LEAD])
+    if collection not in EXPORT_COLLECTIONS:
+        raise HTTPException(status_code=404, detail=f"Unknown export: {collection}")
+    if format not in ("csv", "parquet"):
+        raise HTTPException(status_code=400, detail="format must be 'csv' or 'parquet'")
+    if format == "parquet":
+        load_parquet_modules()
+    
+    source, _, sort_keys = EXPORT_COLLECTIONS[collection]
+    query = await build_export_query(collection, user, engagement_id, client_id, consultant_user_id, rag_status, is_active, status, severity, meeting_id)
+    columns = export_schema(collection)
+    docs = db[source].find(query, {"_id": 0}).sort(sort_keys).batch_size(EXPORT_CHUNK_SIZE)
+    chunks = export_chunks(docs, collection, columns)
+    
+    filename = f"{collection}-{datetime.now(timezone.utc):%Y%m%d}.{format}"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    if format == "parquet":
+        return StreamingResponse(parquet_stream(chunks, columns), media_type="application/vnd.apache.parquet", headers=headers)
+    return StreamingResponse(csv_stream(chunks, columns), media_type="text/csv", headers=headers)
+
+# ===================== LIVE EVENTS =====================
+# Collection -> (event entity, id field) for the change-stream source
+CHANGE_STREAM_ENTITIES = {
+    "clients": ("client", "client_id"),
+    "engagements": ("engagement", "engagement_id"),
+    "weekly_pulses": ("pulse", "pulse_id"),
+    "milestones": ("milestone", "milestone_id"),
+    "risks": ("risk", "risk_id"),
+    "issues": ("issue", "issue_id"),
+    "contacts": ("contact", "contact_id"),
+    "meetings": ("meeting", "meeting_id"),
+    "action_items": ("action_item", "action_item_id"),
+}
+CHANGE_STREAM_ACTIONS = {"insert": "create", "update": "update", "replace": "update", "delete": "delete"}
+
+def change_to_event(change: dict) -> Optional[dict]:
+    """Translate a change stream document into a mutation event.
+
+    Deletes carry no full document, so their entity_id and engagement_id are unknown
+    and only unfiltered subscribers receive them.
+    """
+    mapping = CHANGE_STREAM_ENTITIES.get(change.get("ns", {}).get("coll"))
+    action = CHANGE_STREAM_ACTIONS.get(change.get("operationType"))
+    if not mapping or not action:
+        return None
+    entity, id_field = mapping
+    doc = change.get("fullDocument")
+    if doc:
+        doc = {k: v for k, v in doc.items() if k != "_id"}
+        return mutation_event(entity, action, doc.get(id_field), doc.get("engagement_id"), doc)
+    return mutation_event(entity, action, None)
+
+async def change_stream_event_source():
+    """Publish every worker's writes to this worker's bus by tailing a database change stream"""
+    pipeline = [{"$match": {
+        "ns.coll": {"$in": list(CHANGE_STREAM_ENTITIES)},
+        "operationType": {"$in": list(CHANGE_STREAM_ACTIONS)},
+        # ETag version bumps are bookkeeping, not mutations
+        "updateDescription.updatedFields.version": {"$exists": False}
+    }}]
+    resume_token = None
+    while True:
+        try:
+            async with db.watch(pipeline, full_document="updateLookup", resume_after=resume_token) as stream:
+                async for change in stream:
+                    resume_token = stream.resume_token
+                    event = change_to_event(change)
+                    if event:
+                        event_bus.publish(event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Change stream event source failed, retrying: {e}")
+            await asyncio.sleep(5)
+
+async def sse_events(request: Request, subscription: EventSubscription):
+    """Serialize bus events as Server-Sent Events until the client disconnects"""
+    try:
+        yield "retry: 5000\n\n"
+        while not await request.is_disconnected():
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), SSE_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield f"id: {event['id']}\ndata: {json.dumps(event, default=json_default)}\n\n"
+    finally:
+        event_bus.unsubscribe(subscription)
+
+def events_ticket_key(ticket: str) -> str:
+    # Only a hash is stored, so the tickets collection holds nothing redeemable
+    return hashlib.sha256(ticket.encode()).hexdigest()
+
+@api_router.post("/events/ticket")
+async def create_events_ticket(request: Request):
+    """Issue a short-lived, single-use ticket for opening the event stream"""
+    user = await require_auth(request)
+    ticket = secrets.token_urlsafe(32)
+    await db.sse_tickets.insert_one({
+        "_id": events_ticket_key(ticket),
+        "user_id": user["user_id"],
+        "expires_at": datetime.now(timezone.utc) + timedelta(seconds=SSE_TICKET_TTL_SECONDS)
+    })
+    return {"ticket": ticket, "expires_in": SSE_TICKET_TTL_SECONDS}
+
+async def redeem_events_ticket(ticket: str) -> Optional[dict]:
+    """Consume a ticket, returning its active user, or None if it is unknown, used or expired"""
+    issued = await db.sse_tickets.find_one_and_delete({
+        "_id": events_ticket_key(ticket),
+        "expires_at": {"$gt": datetime.now(timezone.utc)}
+    })
+    if not issued:
+        return None
+    user = await db.users.find_one({"user_id": issued["user_id"]}, {"_id": 0, "password_hash": 0, "email_normalized": 0})
+    if not user or not user.get("is_active", True):
+        return None
+    return deserialize_doc(user)
+
+@api_router.get("/events")
+async def stream_events(request: Request, engagement_id: Optional[str] = None, ticket: Optional[str] = None):
+    """Stream mutation events as Server-Sent Events.
+
+    EventSource cannot send headers, and a JWT in the URL would end up in access logs, so
+    the stream is opened with a ticket from POST /events/ticket instead.
+    Consultants only receive events for their own engagements.
+    """
+    user = await redeem_events_ticket(ticket) if ticket else None
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
     
-    # Missing pulses this week
-    week_start = get_current_week_start()
-    all_active_engagements = await db.engagements.find({"is_active": True}, {"_id": 0}).to_list(1000)
+    engagement_ids = None
+    if user["role"] == "CONSULTANT":
+        owned = set(await db.engagements.distinct("engagement_id", {"consultant_user_id": user["user_id"]}))
+        if engagement_id and engagement_id not in owned:
+            raise HTTPException(status_code=403, detail="Access denied")
+        engagement_ids = {engagement_id} if engagement_id else owned
+    elif engagement_id:
+        engagement_ids = {engagement_id}
     
-    missing_pulses = []
-    for eng in all_active_engagements:
-        pulse = await db.weekly_pulses.find_one({
-            "engagement_id": eng["engagement_id"],
-            "week_start_date": week_start.isoformat()
-        }, {"_id": 0})
-        if not pulse:
-            eng = deserialize_doc(eng)
-            if eng.get("consultant_user_id"):
-                consultant = await db.users.find_one({"user_id": eng["consultant_user_id"]}, {"_id": 0})
-                eng["consultant"] = deserialize_doc(consultant) if consultant else None
-            client = await db.clients.find_one({"client_id": eng["client_id"]}, {"_id": 0})
-            eng["client"] = deserialize_doc(client) if client else None
-            missing_pulses.append(eng)
-    
-    # Top issues by severity
-    critical_issues = await db.issues.find({"severity": "CRITICAL", "status": {"$in": ["OPEN", "IN_PROGRESS", "BLOCKED"]}}, {"_id": 0}).to_list(10)
-    high_issues = await db.issues.find({"severity": "HIGH", "status": {"$in": ["OPEN", "IN_PROGRESS", "BLOCKED"]}}, {"_id": 0}).to_list(10)
-    
-    # Enrich issues with engagement info
-    for issue in critical_issues + high_issues:
-        eng = await db.engagements.find_one({"engagement_id": issue["engagement_id"]}, {"_id": 0})
-        issue["engagement"] = deserialize_doc(eng) if eng else None
-    
-    # Top risks (high probability + high impact)
-    high_risks = await db.risks.find({
-        "probability": "HIGH",
-        "impact": "HIGH",
-        "status": "OPEN"
-    }, {"_id": 0}).to_list(10)
-    
-    for risk in high_risks:
-        eng = await db.engagements.find_one({"engagement_id": risk["engagement_id"]}, {"_id": 0})
-        risk["engagement"] = deserialize_doc(eng) if eng else None
-    
-    # Milestones due in next 30 days
+    subscription = event_bus.subscribe(engagement_ids)
+    return StreamingResponse(
+        sse_events(request, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@api_router.get("/events/stats")
+async def get_event_stats(request: Request):
+    """Event bus subscriber and publish counters (Admin only)"""
+    await require_role(request, [UserRole.ADMIN])
+    return event_bus.stats()
+
+# ===================== DASHBOARD ENDPOINTS =====================
+class DashboardSummaryCache:
+    """Single-flight snapshot of the dashboard summary, invalidated by mutation events"""
+    
+    def __init__(self, compute, max_age: float):
+        self._compute = compute
+        self.max_age = max_age
+        self.snapshot = None
+        self.computed_at = None
+        self.generation = 0
+        self._snapshot_generation = -1
+        self._build = None
+        self._build_generation = -1
+        self._invalidated = asyncio.Event()
+        self.hits = 0
+        self.builds = 0
+    
+    def invalidate(self):
+        self.generation += 1
+        self._invalidated.set()
+    
+    def is_fresh(self) -> bool:
+        return (
+            self.snapshot is not None
+            and self._snapshot_generation == self.generation
+            and (datetime.now(timezone.utc) - self.computed_at).total_seconds() < self.max_age
+        )
+    
+    async def get(self) -> tuple:
+        """Return (summary, computed_at), rebuilding first if the snapshot is stale"""
+        if self.is_fresh():
+            self.hits += 1
+            return self.snapshot, self.computed_at
+        return await self.rebuild()
+    
+    async def rebuild(self) -> tuple:
+        # Join a build already running for the current generation; one started before
+        # the latest invalidation may have missed that write, so start another
+        if self._build is None or self._build.done() or self._build_generation != self.generation:
+            self._build_generation = self.generation
+            self._build = asyncio.create_task(self._run_build(self.generation))
+        return await asyncio.shield(self._build)
+    
+    async def _run_build(self, generation: int) -> tuple:
+        computed_at = datetime.now(timezone.utc)
+        summary = await self._compute()
+        self.builds += 1
+        if generation >= self._snapshot_generation:
+            self.snapshot, self.computed_at, self._snapshot_generation = summary, computed_at, generation
+        return summary, computed_at
+    
+    async def run(self, debounce: float):
+        """Rebuild after invalidations (coalescing bursts) and whenever the snapshot ages out"""
+        while True:
+            try:
+                await asyncio.wait_for(self._invalidated.wait(), timeout=self.max_age)
+                await asyncio.sleep(debounce)
+                aged_out = False
+            except asyncio.TimeoutError:
+                aged_out = True
+            self._invalidated.clear()
+            if not aged_out and self.is_fresh():
+                # A request already rebuilt it
+                continue
+            try:
+                await self.rebuild()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Dashboard summary rebuild failed: {e}")
+
+DASHBOARD_SUMMARY_ENTITIES = {"engagement", "pulse", "issue", "risk", "milestone"}
+
+async def compute_dashboard_summary() -> dict:
+    """Compute the leadership dashboard summary from scratch"""
     now = datetime.now(timezone.utc)
     thirty_days = now + timedelta(days=30)
-    upcoming_milestones = await db.milestones.find({
-        "status": {"$nin": ["DONE", "BLOCKED"]},
-    }, {"_id": 0}).to_list(100)
-    
-    # Filter by due_date
-    filtered_milestones = []
-    for ms in upcoming_milestones:
-        due_date = ms.get("due_date")
-        if isinstance(due_date, str):
-            due_date = datetime.fromisoformat(due_date)
-        if due_date.tzinfo is None:
-            due_date = due_date.replace(tzinfo=timezone.utc)
-        if now <= due_date <= thirty_days:
-            eng = await db.engagements.find_one({"engagement_id": ms["engagement_id"]}, {"_id": 0})
-            ms["engagement"] = deserialize_doc(eng) if eng else None
-            filtered_milestones.append(deserialize_doc(ms))
-    
-    # Sort by due_date - handle both string and datetime objects
-    def get_sort_date(ms):
-        due = ms.get("due_date")
-        if isinstance(due, str):
-            due = datetime.fromisoformat(due.replace('Z', '+00:00'))
-        if due is None:
-            return now
-        if due.tzinfo is None:
-            due = due.replace(tzinfo=timezone.utc)
-        return due
-    
-    filtered_milestones.sort(key=get_sort_date)
+    
+    # Milestones due in next 30 days: range-filtered, sorted and joined server-side
+    milestone_pipeline = [
+        {"$match": {
+            "status": {"$nin": ["DONE", "BLOCKED"]},
+            "due_date": {"$gte": serialize_datetime(now), "$lte": serialize_datetime(thirty_days)}
+        }},
+        {"$sort": {"due_date": 1, "milestone_id": 1}},
+        {"$facet": {
+            "items": [
+                {"$limit": 10},
+                {"$lookup": {
+                    "from": "engagements",
+                    "localField": "engagement_id",
+                    "foreignField": "engagement_id",
+                    "pipeline": [{"$project": {"_id": 0, "version": 0}}],
+                    "as": "engagement"
+                }},
+                {"$project": {"_id": 0}}
+            ],
+            "total": [{"$count": "count"}]
+        }}
+    ]
+    
+    # The counts and lists below are independent, so they run concurrently
+    (green, amber, red, total_engagements, (missing_pulses_count, missing_pulses),
+     critical_issues, high_issues, high_risks, milestone_window) = await asyncio.gather(
+        # RAG counts and active engagements
+        db.engagements.count_documents({"rag_status": "GREEN", "is_active": True}),
+        db.engagements.count_documents({"rag_status": "AMBER", "is_active": True}),
+        db.engagements.count_documents({"rag_status": "RED", "is_active": True}),
+        db.engagements.count_documents({"is_active": True}),
+        # Engagements missing a pulse this week
+        find_missing_pulses(get_current_week_start(), limit=10),
+        # Top issues by severity
+        db.issues.find({"severity": "CRITICAL", "status": {"$in": OPEN_ISSUE_STATUSES}}, {"_id": 0}).to_list(10),
+        db.issues.find({"severity": "HIGH", "status": {"$in": OPEN_ISSUE_STATUSES}}, {"_id": 0}).to_list(10),
+        # Top risks (high probability + high impact)
+        db.risks.find({"probability": "HIGH", "impact": "HIGH", "status": "OPEN"}, {"_id": 0}).to_list(10),
+        # Milestones due in next 30 days
+        db.milestones.aggregate(milestone_pipeline).to_list(1)
+    )
+    rag_counts = {"GREEN": green, "AMBER": amber, "RED": red}
+    
+    # Enrich issues and risks with their engagements in one query
+    flagged = critical_issues + high_issues + high_risks
+    flagged_engagements = {}
+    if flagged:
+        async for eng in db.engagements.find(
+            {"engagement_id": {"$in": list({doc["engagement_id"] for doc in flagged})}}, {"_id": 0, "version": 0}
+        ):
+            flagged_engagements[eng["engagement_id"]] = eng
+    for doc in flagged:
+        eng = flagged_engagements.get(doc["engagement_id"])
+        doc["engagement"] = deserialize_doc(dict(eng)) if eng else None
+    
+    milestone_window = milestone_window[0] if milestone_window else {"items": [], "total": []}
+    
+    upcoming_milestones = []
+    for ms in milestone_window["items"]:
+        engagements = ms.pop("engagement")
+        ms = deserialize_doc(ms)
+        ms["engagement"] = deserialize_doc(engagements[0]) if engagements else None
+        upcoming_milestones.append(ms)
+    upcoming_milestones_count = milestone_window["total"][0]["count"] if milestone_window["total"] else 0
     
     return {
         "rag_counts": rag_counts,
-        "total_engagements": len(all_active_engagements),
-        "missing_pulses": missing_pulses[:10],
-        "missing_pulses_count": len(missing_pulses),
+        "total_engagements": total_engagements,
+        "missing_pulses": missing_pulses,
+        "missing_pulses_count": missing_pulses_count,
         "critical_issues": [deserialize_doc(i) for i in critical_issues],
         "high_issues": [deserialize_doc(i) for i in high_issues],
         "high_risks": [deserialize_doc(r) for r in high_risks],
-        "upcoming_milestones": filtered_milestones[:10]
+        "upcoming_milestones": upcoming_milestones,
+        "upcoming_milestones_count": upcoming_milestones_count
     }
 
+dashboard_cache = DashboardSummaryCache(compute_dashboard_summary, DASHBOARD_CACHE_MAX_AGE_SECONDS)
+event_bus.add_listener(lambda event: dashboard_cache.invalidate() if event["entity"] in DASHBOARD_SUMMARY_ENTITIES else None)
+
+@api_router.get("/dashboard/summary")
+async def get_dashboard_summary(request: Request, response: Response, fresh: bool = False):
+    """Get dashboard summary for leaders, served from the cached snapshot unless ?fresh=1"""
+    user = await require_role(request, [UserRole.ADMIN, UserRole.LEAD])
+    summary, computed_at = await (dashboard_cache.rebuild() if fresh else dashboard_cache.get())
+    not_modified = await conditional_get(request, response, user, version=computed_at.isoformat())
+    if not_modified:
+        return not_modified
+    return json_response({**summary, "computed_at": computed_at.isoformat()}, response)
+
+@api_router.post("/health-scores/rebuild")
+async def rebuild_all_health_scores(request: Request, dry_run: bool = False):
+    """Recompute all materialized health scores and report drift (Admin only)"""
+    await require_role(request, [UserRole.ADMIN])
+    result = await rebuild_health_scores(dry_run=dry_run)
+    if result["updated"]:
+        dashboard_cache.invalidate()
+    return result
+
 @api_router.get("/dashboard/rag-trend/{engagement_id}")
-async def get_rag_trend(engagement_id: str, request: Request):
+async def get_rag_trend(engagement_id: str, request: Request, response: Response):
     """Get RAG trend for last 8 weeks"""
-    await require_auth(request)
+    user = await require_auth(request)
+    not_modified = await conditional_get(request, response, user, engagement_id)
+    if not_modified:
+        return not_modified
     
     pulses = await db.weekly_pulses.find(
         {"engagement_id": engagement_id, "is_draft": False},
@@ -2124,16 +4163,13 @@ async def get_rag_trend(engagement_id: str, request: Request):
     # Reverse to show chronologically
     pulses.reverse()
     
-    trend = []
-    for pulse in pulses:
-        pulse = deserialize_doc(pulse)
-        trend.append({
-            "week_start_date": pulse.get("week_start_date"),
-            "rag_status": pulse.get("rag_status_this_week"),
-            "pulse_id": pulse.get("pulse_id")
-        })
+    trend = [{
+        "week_start_date": pulse.get("week_start_date"),
+        "rag_status": pulse.get("rag_status_this_week"),
+        "pulse_id": pulse.get("pulse_id")
+    } for pulse in pulses]
     
-    return trend
+    return json_response(trend, response)
 
 # ===================== SEED DATA ENDPOINT =====================
 @api_router.post("/seed-data")
@@ -2154,7 +4190,7 @@ async def seed_demo_data(request: Request):
     ]
     
     for user in users:
-        await db.users.insert_one(serialize_doc(user.model_dump()))
+        await db.users.insert_one(serialize_user(user))
     
     # Create demo clients
     clients = [
@@ -2309,8 +4345,245 @@ async def seed_demo_data(request: Request):
     for contact in contacts:
         await db.contacts.insert_one(serialize_doc(contact.model_dump()))
     
+    await rebuild_health_scores()
+    dashboard_cache.invalidate()
+    
     return {"message": "Demo data seeded successfully", "seeded": True}
 
+# ===================== METRICS =====================
+class RouteMetrics:
+    """Latency histogram, status counts and MongoDB usage for one method and route template"""
+    
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.total_seconds = 0.0
+        self.statuses = {}
+        self.db_queries = 0
+        self.db_seconds = 0.0
+    
+    def observe(self, status: int, seconds: float, db: DbQueryStats):
+        self.count += 1
+        self.total_seconds += seconds
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.db_queries += db.queries
+        self.db_seconds += db.seconds
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.bucket_counts[i] += 1
+                break
+    
+    def cumulative(self) -> List[int]:
+        return list(itertools.accumulate(self.bucket_counts))
+    
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by interpolating within its bucket, as histogram_quantile does"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        lower, below = 0.0, 0
+        for bound, seen in zip(self.buckets, self.cumulative()):
+            if seen >= rank:
+                in_bucket = seen - below
+                return lower + (bound - lower) * ((rank - below) / in_bucket if in_bucket else 1)
+            lower, below = bound, seen
+        # Beyond the largest bucket: the best bound we can give
+        return self.buckets[-1]
+
+class RequestMetrics:
+    """Per-route request metrics for api_router endpoints, rendered in Prometheus text format"""
+    
+    QUANTILES = (0.5, 0.95, 0.99)
+    
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.routes = {}
+        # ASGI scopes of requests in progress; the router records the matched route on each
+        self.active = {}
+    
+    @staticmethod
+    def route_key(scope) -> Optional[tuple]:
+        route = scope.get("route")
+        if isinstance(route, APIRoute) and route.path.startswith(api_router.prefix):
+            return scope["method"], route.path
+        return None
+    
+    def observe(self, scope, status: int, seconds: float, db: DbQueryStats):
+        key = self.route_key(scope)
+        if key is None:
+            return
+        metrics = self.routes.get(key)
+        if metrics is None:
+            metrics = self.routes[key] = RouteMetrics(self.buckets)
+        metrics.observe(status, seconds, db)
+    
+    def in_flight(self) -> dict:
+        counts = {}
+        for scope in list(self.active.values()):
+            key = self.route_key(scope)
+            if key is not None:
+                counts[key] = counts.get(key, 0) + 1
+        return counts
+    
+    def render(self) -> List[str]:
+        routes = sorted(self.routes.items())
+        in_flight = self.in_flight()
+        lines = [
+            "# HELP http_requests_total Requests handled, by route and status code",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, path), metrics in routes:
+            for status, count in sorted(metrics.statuses.items()):
+                lines.append(f'http_requests_total{{method="{method}",route="{path}",status="{status}"}} {count}')
+        lines += [
+            "# HELP http_requests_in_flight Requests currently being handled, by route",
+            "# TYPE http_requests_in_flight gauge",
+        ]
+        for method, path in sorted(set(self.routes) | set(in_flight)):
+            lines.append(f'http_requests_in_flight{{method="{method}",route="{path}"}} {in_flight.get((method, path), 0)}')
+        lines += [
+            "# HELP http_request_duration_seconds Time to complete the response, by route",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, path), metrics in routes:
+            labels = f'method="{method}",route="{path}"'
+            for bound, count in zip(self.buckets, metrics.cumulative()):
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound:g}"}} {count}')
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {metrics.count}')
+            lines.append(f'http_request_duration_seconds_sum{{{labels}}} {metrics.total_seconds:.6f}')
+            lines.append(f'http_request_duration_seconds_count{{{labels}}} {metrics.count}')
+        lines += [
+            "# HELP http_request_duration_quantile_seconds Latency quantiles estimated from the histogram buckets",
+            "# TYPE http_request_duration_quantile_seconds gauge",
+        ]
+        for (method, path), metrics in routes:
+            for q in self.QUANTILES:
+                lines.append(f'http_request_duration_quantile_seconds{{method="{method}",route="{path}",quantile="{q}"}} {metrics.quantile(q):.6f}')
+        lines += [
+            "# HELP http_request_db_queries_total MongoDB commands issued while handling requests, by route",
+            "# TYPE http_request_db_queries_total counter",
+        ]
+        for (method, path), metrics in routes:
+            lines.append(f'http_request_db_queries_total{{method="{method}",route="{path}"}} {metrics.db_queries}')
+        lines += [
+            "# HELP http_request_db_seconds_total MongoDB round-trip time spent handling requests, by route",
+            "# TYPE http_request_db_seconds_total counter",
+        ]
+        for (method, path), metrics in routes:
+            lines.append(f'http_request_db_seconds_total{{method="{method}",route="{path}"}} {metrics.db_seconds:.6f}')
+        return lines
+
+class RequestMetricsMiddleware:
+    """ASGI middleware timing api_router requests from arrival until the last body chunk is sent.
+
+    Requests are labelled with the route template the router matched; those matching no
+    api_router route (static files, 404s) are not recorded, so arbitrary paths cannot grow
+    the label set. MongoDB commands are counted per request and reported in the X-DB-Queries
+    and X-DB-Time-Ms headers (for streamed responses, only those issued before the headers).
+    """
+    
+    def __init__(self, app, metrics: RequestMetrics):
+        self.app = app
+        self.metrics = metrics
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(api_router.prefix):
+            return await self.app(scope, receive, send)
+        
+        status = 500
+        event_stream = False
+        db = DbQueryStats()
+        
+        async def send_with_status(message):
+            nonlocal status, event_stream
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                event_stream = any(name == b"content-type" and value.startswith(b"text/event-stream") for name, value in headers)
+                headers.append((b"x-db-queries", str(db.queries).encode()))
+                headers.append((b"x-db-time-ms", f"{db.seconds * 1000:.1f}".encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+        
+        request_id = id(scope)
+        self.metrics.active[request_id] = scope
+        context_token = db_query_stats.set(db)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            db_query_stats.reset(context_token)
+            del self.metrics.active[request_id]
+            self.metrics.observe(scope, status, elapsed, db)
+            # Event streams stay open by design, so only their query count is budgeted
+            if (SLOW_REQUEST_MS and not event_stream and elapsed * 1000 > SLOW_REQUEST_MS) or (SLOW_REQUEST_DB_QUERIES and db.queries > SLOW_REQUEST_DB_QUERIES):
+                route = scope.get("route")
+                logger.warning(
+                    f"Slow request {scope['method']} {route.path if route else scope['path']} -> {status}: "
+                    f"{elapsed * 1000:.0f} ms, {db.queries} MongoDB queries ({db.seconds * 1000:.0f} ms, {db.documents} documents)"
+                )
+
+request_metrics = RequestMetrics(METRICS_LATENCY_BUCKETS)
+
+def prometheus_metric(name: str, kind: str, help_text: str, samples: List[tuple]) -> List[str]:
+    """Render one metric family from (labels, value) samples"""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    for labels, value in samples:
+        label_text = ",".join(f'{key}="{val}"' for key, val in labels.items())
+        lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+    return lines
+
+def component_metrics() -> List[str]:
+    """Counters kept by the MongoDB listener, activity log writer, event bus, dashboard cache and login limiter"""
+    commands = sorted(db_query_listener.stats().items())
+    writer = activity_log_writer.stats()
+    bus = event_bus.stats()
+    limiter = login_rate_limiter.stats()
+    return [
+        *prometheus_metric("mongodb_commands_total", "counter", "MongoDB commands completed, by command", [
+            ({"command": name}, totals["count"]) for name, totals in commands
+        ]),
+        *prometheus_metric("mongodb_command_failures_total", "counter", "MongoDB commands that failed, by command", [
+            ({"command": name}, totals["failures"]) for name, totals in commands
+        ]),
+        *prometheus_metric("mongodb_command_seconds_total", "counter", "MongoDB command round-trip time, by command", [
+            ({"command": name}, f'{totals["seconds"]:.6f}') for name, totals in commands
+        ]),
+        *prometheus_metric("mongodb_documents_returned_total", "counter", "Documents returned in cursor batches and findAndModify replies, by command", [
+            ({"command": name}, totals["documents"]) for name, totals in commands
+        ]),
+        *prometheus_metric("activity_log_queue_depth", "gauge", "Activity log entries waiting to be flushed", [({}, writer["queue_depth"])]),
+        *prometheus_metric("activity_log_writes_total", "counter", "Activity log entries written, by path", [
+            ({"mode": "buffered"}, writer["buffered_writes"]),
+            ({"mode": "sync"}, writer["sync_writes"]),
+            ({"mode": "failed"}, writer["failed_writes"]),
+        ]),
+        *prometheus_metric("activity_log_batches_flushed_total", "counter", "Activity log batches inserted", [({}, writer["batches_flushed"])]),
+        *prometheus_metric("activity_log_batch_retries_total", "counter", "Activity log batch inserts retried after a failure", [({}, writer["retried_batches"])]),
+        *prometheus_metric("event_bus_subscribers", "gauge", "Live event subscribers", [({}, bus["subscribers"])]),
+        *prometheus_metric("event_bus_published_total", "counter", "Mutation events published", [({}, bus["published"])]),
+        *prometheus_metric("event_bus_dropped", "gauge", "Events dropped by slow subscribers still connected", [({}, bus["dropped"])]),
+        *prometheus_metric("dashboard_cache_hits_total", "counter", "Dashboard summaries served from the snapshot", [({}, dashboard_cache.hits)]),
+        *prometheus_metric("dashboard_cache_builds_total", "counter", "Dashboard summary rebuilds", [({}, dashboard_cache.builds)]),
+        *prometheus_metric("login_attempts_total", "counter", "Login attempts, by throttling outcome", [
+            ({"outcome": "allowed"}, limiter["allowed"]),
+            ({"outcome": "throttled_ip"}, limiter["throttled_ip"]),
+            ({"outcome": "throttled_email"}, limiter["throttled_email"]),
+        ]),
+        *prometheus_metric("login_limiter_tracked_keys", "gauge", "IPs and emails tracked by the in-memory login limiter", [({}, limiter["tracked_keys"])]),
+    ]
+
+@api_router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics(request: Request):
+    """Request and component metrics in Prometheus text format (metrics token or Admin)"""
+    authorization = request.headers.get("Authorization", "")
+    if not (METRICS_TOKEN and hmac.compare_digest(authorization, f"Bearer {METRICS_TOKEN}")):
+        await require_role(request, [UserRole.ADMIN])
+    lines = request_metrics.render() + component_metrics()
+    return PlainTextResponse("\n".join(lines) + "\n", media_type="text/plain; version=0.0.4")
+
 # ===================== ROOT ENDPOINT =====================
 @api_router.get("/")
 async def root():
@@ -2325,11 +4598,245 @@ app.add_middleware(
     allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count", "ETag", "X-DB-Queries", "X-DB-Time-Ms"],
 )
 
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    client.close()
+app.add_middleware(RequestMetricsMiddleware, metrics=request_metrics)
+
+# ===================== DATABASE MIGRATIONS =====================
+# Each migration runs once; applied versions are recorded in schema_migrations.
+# Append new migrations with the next version number - never renumber or edit applied ones.
+MIGRATIONS = []
+
+def migration(version: int, description: str):
+    """Register a versioned migration"""
+    def decorator(fn):
+        MIGRATIONS.append((version, description, fn))
+        return fn
+    return decorator
+
+@migration(1, "Unique indexes on entity ids")
+async def _migration_entity_id_indexes():
+    entity_ids = {
+        "users": "user_id",
+        "clients": "client_id",
+        "engagements": "engagement_id",
+        "weekly_pulses": "pulse_id",
+        "milestones": "milestone_id",
+        "risks": "risk_id",
+        "issues": "issue_id",
+        "contacts": "contact_id",
+        "meetings": "meeting_id",
+        "action_items": "action_item_id",
+        "activity_logs": "log_id",
+    }
+    for collection, field in entity_ids.items():
+        await db[collection].create_index([(field, ASCENDING)], unique=True)
+
+@migration(2, "Compound indexes for engagement-scoped query shapes")
+async def _migration_query_indexes():
+    await db.users.create_index([("email", ASCENDING)])
+    await db.engagements.create_index([("consultant_user_id", ASCENDING), ("is_active", ASCENDING)])
+    await db.engagements.create_index([("is_active", ASCENDING), ("rag_status", ASCENDING)])
+    await db.engagements.create_index([("client_id", ASCENDING)])
+    await db.engagements.create_index([("engagement_code", ASCENDING)])
+    await db.weekly_pulses.create_index([("engagement_id", ASCENDING), ("week_start_date", DESCENDING)])
+    await db.weekly_pulses.create_index([("consultant_user_id", ASCENDING), ("week_start_date", DESCENDING)])
+    await db.weekly_pulses.create_index([("week_start_date", ASCENDING)])
+    await db.milestones.create_index([("engagement_id", ASCENDING), ("due_date", ASCENDING)])
+    await db.milestones.create_index([("status", ASCENDING), ("due_date", ASCENDING)])
+    await db.risks.create_index([("engagement_id", ASCENDING), ("status", ASCENDING), ("probability", ASCENDING), ("impact", ASCENDING)])
+    await db.risks.create_index([("status", ASCENDING), ("probability", ASCENDING), ("impact", ASCENDING)])
+    await db.issues.create_index([("engagement_id", ASCENDING), ("status", ASCENDING), ("severity", ASCENDING)])
+    await db.issues.create_index([("severity", ASCENDING), ("status", ASCENDING)])
+    await db.contacts.create_index([("engagement_id", ASCENDING)])
+    await db.meetings.create_index([("engagement_id", ASCENDING), ("date", DESCENDING)])
+    await db.action_items.create_index([("engagement_id", ASCENDING), ("created_at", DESCENDING)])
+    await db.action_items.create_index([("meeting_id", ASCENDING)])
+    await db.activity_logs.create_index([("engagement_id", ASCENDING), ("created_at", DESCENDING)])
+    await db.activity_logs.create_index([("created_at", DESCENDING)])
+
+# Top-level datetime fields per collection (meeting dates and action item due dates are free-form strings)
+DATE_FIELDS = {
+    "users": ["created_at", "updated_at"],
+    "clients": ["created_at", "updated_at"],
+    "engagements": ["start_date", "target_end_date", "last_pulse_date", "completed_date", "created_at", "updated_at"],
+    "weekly_pulses": ["week_start_date", "week_end_date", "submitted_at", "created_at", "updated_at"],
+    "milestones": ["due_date", "original_due_date", "created_at", "updated_at"],
+    "risks": ["target_resolution_date", "last_reviewed_date", "created_at", "updated_at"],
+    "issues": ["due_date", "created_at", "updated_at"],
+    "contacts": ["created_at", "updated_at"],
+    "meetings": ["created_at", "updated_at"],
+    "action_items": ["created_at", "updated_at"],
+    "activity_logs": ["created_at"],
+}
+MILESTONE_HISTORY_DATE_FIELDS = ["changed_at", "previous_date", "new_date"]
+
+def _parse_stored_date(value):
+    """Parse an ISO date string as written by older versions, assuming UTC when naive"""
+    if not isinstance(value, str):
+        return value
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return value
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+# Version 3 was the native date conversion; it is now the date storage step below, since it
+# depends on configuration rather than schema version and cannot be undone.
+
+# Recorded in schema_migrations alongside the versions (as was version 3 before it)
+NATIVE_DATES_STEP = "native_dates"
+
+async def convert_dates_to_native(batch_size: int = 1000):
+    """Rewrite ISO date strings as BSON dates in every date field"""
+    for collection, fields in DATE_FIELDS.items():
+        string_dates = {"$or": [{field: {"$type": "string"}} for field in fields]}
+        if collection == "milestones":
+            string_dates["$or"].extend({f"date_change_history.{field}": {"$type": "string"}} for field in MILESTONE_HISTORY_DATE_FIELDS)
+        
+        updates = []
+        async for doc in db[collection].find(string_dates):
+            changes = {field: _parse_stored_date(doc[field]) for field in fields if isinstance(doc.get(field), str)}
+            if collection == "milestones" and doc.get("date_change_history"):
+                changes["date_change_history"] = [
+                    {**change, **{field: _parse_stored_date(change[field]) for field in MILESTONE_HISTORY_DATE_FIELDS if field in change}}
+                    for change in doc["date_change_history"]
+                ]
+            updates.append(UpdateOne({"_id": doc["_id"]}, {"$set": changes}))
+            if len(updates) >= batch_size:
+                await db[collection].bulk_write(updates, ordered=False)
+                updates = []
+        if updates:
+            await db[collection].bulk_write(updates, ordered=False)
+
+@migration(4, "Keyset pagination indexes on list sort keys")
+async def _migration_pagination_indexes():
+    for collection, sort_keys in [
+        ("users", USER_SORT),
+        ("clients", CLIENT_SORT),
+        ("engagements", ENGAGEMENT_SORT),
+        ("weekly_pulses", PULSE_SORT),
+        ("milestones", MILESTONE_SORT),
+        ("risks", RISK_SORT),
+        ("issues", ISSUE_SORT),
+        ("contacts", CONTACT_SORT),
+        ("meetings", MEETING_SORT),
+        ("action_items", ACTION_ITEM_SORT),
+        ("activity_logs", ACTIVITY_LOG_SORT),
+    ]:
+        await db[collection].create_index(sort_keys)
+    # Engagement-scoped listings filter on engagement_id before walking the sort keys
+    for collection, sort_keys in [
+        ("milestones", MILESTONE_SORT),
+        ("risks", RISK_SORT),
+        ("issues", ISSUE_SORT),
+        ("contacts", CONTACT_SORT),
+        ("meetings", MEETING_SORT),
+        ("action_items", ACTION_ITEM_SORT),
+        ("activity_logs", ACTIVITY_LOG_SORT),
+    ]:
+        await db[collection].create_index([("engagement_id", ASCENDING), *sort_keys])
+
+async def apply_date_storage():
+    """Convert stored dates once DATE_STORAGE=native, and refuse iso mode after that.
+
+    The conversion is one-way: iso mode filters dates as strings ($regex, lexicographic
+    ranges) and would silently stop matching converted documents.
+    """
+    converted = await db.schema_migrations.find_one({"_id": {"$in": [3, NATIVE_DATES_STEP]}})
+    if DATE_STORAGE != "native":
+        if converted:
+            raise RuntimeError("Stored dates were converted to native BSON dates; set DATE_STORAGE=native (the switch cannot be reverted)")
+        return
+    if converted:
+        return
+    logger.info("Converting stored dates to native BSON dates")
+    await convert_dates_to_native()
+    await db.schema_migrations.update_one(
+        {"_id": NATIVE_DATES_STEP},
+        {"$set": {"description": "Convert ISO date strings to native BSON dates", "applied_at": serialize_datetime(datetime.now(timezone.utc))}},
+        upsert=True
+    )
+
+@migration(5, "Normalized, uniquely indexed user emails for exact-match login")
+async def _migration_email_normalized(batch_size: int = 1000):
+    updates = []
+    async for user in db.users.find({}, {"_id": 1, "email": 1, "email_normalized": 1}):
+        normalized = normalize_email(user.get("email") or "")
+        if not normalized:
+            # No email to log in with; left unset so the partial index skips it
+            if "email_normalized" in user:
+                updates.append(UpdateOne({"_id": user["_id"]}, {"$unset": {"email_normalized": ""}}))
+        elif user.get("email_normalized") != normalized:
+            updates.append(UpdateOne({"_id": user["_id"]}, {"$set": {"email_normalized": normalized}}))
+        if len(updates) >= batch_size:
+            await db.users.bulk_write(updates, ordered=False)
+            updates = []
+    if updates:
+        await db.users.bulk_write(updates, ordered=False)
+    
+    duplicates = await db.users.aggregate([
+        {"$match": {"email_normalized": {"$type": "string"}}},
+        {"$group": {"_id": "$email_normalized", "user_ids": {"$push": "$user_id"}}},
+        {"$match": {"user_ids.1": {"$exists": True}}}
+    ]).to_list(None)
+    if duplicates:
+        # Logins keep working off the backfilled field; the index waits until the accounts are merged
+        logger.error(
+            "Not creating the unique email index until these users are merged (they differ only in case or whitespace): "
+            + "; ".join(f"{d['_id']} ({', '.join(str(u) for u in d['user_ids'])})" for d in duplicates)
+        )
+        return False
+    await db.users.create_index(
+        [("email_normalized", ASCENDING)], unique=True,
+        partialFilterExpression={"email_normalized": {"$type": "string"}}
+    )
+
+@migration(6, "TTL index expiring login rate limit windows")
+async def _migration_rate_limit_ttl():
+    await db.rate_limits.create_index([("expires_at", ASCENDING)], expireAfterSeconds=0)
+
+@migration(7, "TTL index expiring unused event stream tickets")
+async def _migration_sse_ticket_ttl():
+    await db.sse_tickets.create_index([("expires_at", ASCENDING)], expireAfterSeconds=0)
+
+async def run_migrations() -> List[int]:
+    """Apply pending migrations in version order and return the versions applied.
+
+    A migration returning False is deferred: it is not recorded, so it runs again on the
+    next startup, and later versions still apply.
+    """
+    applied = {doc["_id"] for doc in await db.schema_migrations.find({}, {"_id": 1}).to_list(None)}
+    newly_applied = []
+    for version, description, fn in sorted(MIGRATIONS, key=lambda m: m[0]):
+        if version in applied:
+            continue
+        logger.info(f"Applying migration {version}: {description}")
+        if await fn() is False:
+            logger.warning(f"Migration {version} deferred until its preconditions hold")
+            continue
+        await db.schema_migrations.update_one(
+            {"_id": version},
+            {"$set": {"description": description, "applied_at": serialize_datetime(datetime.now(timezone.utc))}},
+            upsert=True
+        )
+        newly_applied.append(version)
+    return newly_applied
+
+@app.on_event("startup")
+async def run_migrations_on_startup():
+    """Bring indexes and stored data up to the current schema version"""
+    # Outside the try: starting in iso mode over converted dates must fail loudly
+    await apply_date_storage()
+    try:
+        newly_applied = await run_migrations()
+        if newly_applied:
+            logger.info(f"Applied migrations: {newly_applied}")
+        else:
+            logger.info("Database schema up to date")
+    except Exception as e:
+        logger.error(f"Error running migrations on startup: {e}")
 
 # ===================== AUTO-SEED ON STARTUP =====================
 @app.on_event("startup")
@@ -2349,40 +4856,67 @@ async def seed_users_on_startup():
         
         # CompassX Users - seth.cushing as ADMIN with specific password
         compassx_users = [
-            User(name="Seth Cushing", email="seth.cushing@compassx.com", role=UserRole.ADMIN, password_hash=hash_password(admin_password)),
-            User(name="Ashley Clark", email="ashley.clark@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Brian Clements", email="brian.clements@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Brian Snowden", email="brian.snowden@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Bryan Posso", email="bryan.posso@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Chris McConnell", email="chris.mcconnell@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Christopher Grant", email="christopher.grant@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Daniel Eimen", email="daniel.eimen@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Deepak Sivaraman", email="deepak.sivaraman@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Fifi Thrift", email="fifi.thrift@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Keilan Malone", email="keilan.malone@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Kyle Kim", email="kyle.kim@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Matt Kalina", email="matt.kalina@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Padmanabhan Satyamoorthy", email="paddy.satyamoorthy@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Raquel Edwards", email="raquel.edwards@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Rey Khachatourian", email="rey.khachatourian@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Ricardo Gonzales", email="ricardo.gonzales@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Saif Quaderi", email="saif.quaderi@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Sandeep Komuravelli", email="sandeep.komuravelli@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Shane Hogan", email="shane.hogan@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Sim Singh", email="sim.singh@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Steve Marcott", email="steve.marcott@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Trinh Do", email="trinh.do@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
-            User(name="Victoria Pearson", email="victoria.pearson@compassx.com", role=UserRole.CONSULTANT, password_hash=hash_password(default_password)),
+            User(name="Seth Cushing", email="seth.cushing@compassx.com", role=UserRole.ADMIN),
+            User(name="Ashley Clark", email="ashley.clark@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Brian Clements", email="brian.clements@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Brian Snowden", email="brian.snowden@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Bryan Posso", email="bryan.posso@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Chris McConnell", email="chris.mcconnell@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Christopher Grant", email="christopher.grant@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Daniel Eimen", email="daniel.eimen@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Deepak Sivaraman", email="deepak.sivaraman@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Fifi Thrift", email="fifi.thrift@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Keilan Malone", email="keilan.malone@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Kyle Kim", email="kyle.kim@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Matt Kalina", email="matt.kalina@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Padmanabhan Satyamoorthy", email="paddy.satyamoorthy@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Raquel Edwards", email="raquel.edwards@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Rey Khachatourian", email="rey.khachatourian@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Ricardo Gonzales", email="ricardo.gonzales@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Saif Quaderi", email="saif.quaderi@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Sandeep Komuravelli", email="sandeep.komuravelli@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Shane Hogan", email="shane.hogan@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Sim Singh", email="sim.singh@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Steve Marcott", email="steve.marcott@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Trinh Do", email="trinh.do@compassx.com", role=UserRole.CONSULTANT),
+            User(name="Victoria Pearson", email="victoria.pearson@compassx.com", role=UserRole.CONSULTANT),
         ]
         
-        for user in compassx_users:
-            await db.users.insert_one(serialize_doc(user.model_dump()))
+        # bcrypt is slow by design; hash every seed password in parallel on the hashing pool
+        hashes = await asyncio.gather(*(
+            hash_password(admin_password if user.role == UserRole.ADMIN else default_password) for user in compassx_users
+        ))
+        for user, password_hash in zip(compassx_users, hashes):
+            user.password_hash = password_hash
+            await db.users.insert_one(serialize_user(user))
         
         logger.info(f"Successfully seeded {len(compassx_users)} CompassX users with passwords")
         
     except Exception as e:
         logger.error(f"Error seeding users on startup: {e}")
 
+# ===================== BACKGROUND JOBS =====================
+background_tasks: List[asyncio.Task] = []
+
+# Registered after the migration and seeding hooks, so the jobs start on an up-to-date database
+@app.on_event("startup")
+async def start_background_jobs():
+    """Start long-running background jobs"""
+    activity_log_writer.start()
+    background_tasks.append(asyncio.create_task(health_score_rollover_loop()))
+    background_tasks.append(asyncio.create_task(activity_log_archive_loop()))
+    background_tasks.append(asyncio.create_task(dashboard_cache.run(DASHBOARD_CACHE_DEBOUNCE_SECONDS)))
+    if EVENT_SOURCE == "change_stream":
+        background_tasks.append(asyncio.create_task(change_stream_event_source()))
+
+@app.on_event("shutdown")
+async def shutdown_db_client():
+    for task in background_tasks:
+        task.cancel()
+    await activity_log_writer.stop()
+    password_hasher.shutdown()
+    client.close()
+
 # ===================== STATIC FILES FOR PRODUCTION =====================
 # Serve React frontend in production (when build folder exists)
 FRONTEND_BUILD_DIR = Path(__file__).parent.parent / "frontend" / "build"
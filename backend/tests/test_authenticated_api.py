@@ -11,6 +11,8 @@ Tests that use JWT authentication to verify:
 import pytest
 import requests
 import os
+import base64
+import json
 from datetime import datetime, timedelta
 
 # Get BASE_URL from environment
@@ -125,6 +127,46 @@ class TestLogin:
         assert response.status_code == 401, f"Expected 401, got {response.status_code}"
         print("✓ Invalid credentials correctly rejected")
     
+    def test_login_email_is_case_insensitive(self, api_client):
+        """Test login matches the email regardless of case and surrounding whitespace"""
+        response = api_client.post(f"{API_URL}/auth/login", json={
+            "email": f"  {ADMIN_EMAIL.upper()} ",
+            "password": ADMIN_PASSWORD
+        })
+        assert response.status_code == 200, f"Login failed: {response.text}"
+        assert "email_normalized" not in response.json()["user"]
+        print("✓ Login email is case-insensitive")
+    
+    def test_login_email_is_not_a_pattern(self, api_client):
+        """Test regex metacharacters in the email are matched literally"""
+        pattern = ADMIN_EMAIL.replace(".", "?").replace("c", ".", 1)
+        for email in [pattern, ".*", ADMIN_EMAIL[:-1] + "."]:
+            response = api_client.post(f"{API_URL}/auth/login", json={
+                "email": email,
+                "password": ADMIN_PASSWORD
+            })
+            assert response.status_code == 401, f"{email!r} logged in"
+        print("✓ Login email is matched literally")
+    
+    def test_repeated_failed_logins_are_throttled(self, api_client, admin_token):
+        """Test an email is throttled with 429 and Retry-After once its attempts run out"""
+        stats = api_client.get(f"{API_URL}/auth/login-limiter", headers={
+            "Authorization": f"Bearer {admin_token}"
+        }).json()
+        email = f"throttle.{datetime.now().timestamp()}@test.com"
+        for _ in range(stats["email_limit"]):
+            response = api_client.post(f"{API_URL}/auth/login", json={"email": email, "password": "wrongpassword"})
+            assert response.status_code == 401, f"Expected 401, got {response.status_code}"
+        response = api_client.post(f"{API_URL}/auth/login", json={"email": email, "password": "wrongpassword"})
+        assert response.status_code == 429, f"Expected 429, got {response.status_code}"
+        assert int(response.headers["Retry-After"]) > 0
+        
+        after = api_client.get(f"{API_URL}/auth/login-limiter", headers={
+            "Authorization": f"Bearer {admin_token}"
+        }).json()
+        assert after["throttled_email"] >= stats["throttled_email"] + 1
+        print(f"✓ Login throttled after {stats['email_limit']} attempts, Retry-After {response.headers['Retry-After']}s")
+    
     def test_auth_me_with_valid_token(self, api_client, admin_token):
         """Test /api/auth/me returns user info with valid token"""
         response = api_client.get(f"{API_URL}/auth/me", headers={
@@ -239,6 +281,467 @@ class TestFourBlockerAPI:
         print(f"  Milestones: {ms_block['total']} total, {ms_block['completed']} done")
         print(f"  Risks: {risk_block['open']} open, {risk_block['high_impact']} high impact")
         print(f"  Issues: {issue_block['open']} open, {issue_block['critical']} critical")
+    
+    def test_four_blocker_counts_match_lists(self, api_client, admin_token):
+        """Test the aggregated counts agree with the engagement's list endpoints"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        engagement_id = "eng_001"
+        data = api_client.get(f"{API_URL}/engagements/{engagement_id}/four-blocker", headers=headers).json()
+        
+        milestones = api_client.get(f"{API_URL}/milestones?engagement_id={engagement_id}", headers=headers).json()
+        risks = api_client.get(f"{API_URL}/risks?engagement_id={engagement_id}", headers=headers).json()
+        issues = api_client.get(f"{API_URL}/issues?engagement_id={engagement_id}", headers=headers).json()
+        
+        assert data["milestones_block"]["total"] == len(milestones)
+        assert data["milestones_block"]["completed"] == len([m for m in milestones if m["status"] == "DONE"])
+        assert data["risks_block"]["total"] == len(risks)
+        assert data["risks_block"]["open"] == len([r for r in risks if r["status"] == "OPEN"])
+        assert data["issues_block"]["total"] == len(issues)
+        assert data["issues_block"]["open"] == len([i for i in issues if i["status"] not in ["RESOLVED", "CLOSED"]])
+        assert len(data["risks_block"]["open_risks"]) <= 5
+        assert len(data["issues_block"]["open_issues"]) <= 5
+        print(f"✓ Four-blocker counts match list endpoints for {engagement_id}")
+
+
+# ============== CURSOR PAGINATION API TEST ==============
+class TestCursorPagination:
+    """Test keyset pagination on list endpoints"""
+    
+    def test_users_paged_with_cursor(self, api_client, admin_token):
+        """Test following X-Next-Cursor walks every user exactly once"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        full = api_client.get(f"{API_URL}/users", headers=headers)
+        assert full.status_code == 200
+        expected = [u["user_id"] for u in full.json()]
+        
+        seen = []
+        params = {"limit": 5, "include_total": "true"}
+        while True:
+            response = api_client.get(f"{API_URL}/users", headers=headers, params=params)
+            assert response.status_code == 200, f"Page failed: {response.text}"
+            assert len(response.json()) <= 5
+            assert int(response.headers["X-Total-Count"]) == len(expected)
+            seen.extend(u["user_id"] for u in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+            params = {"limit": 5, "cursor": cursor, "include_total": "true"}
+        
+        assert seen == expected
+        print(f"✓ Paged through {len(seen)} users")
+    
+    def test_invalid_cursor_rejected(self, api_client, admin_token):
+        """Test a malformed cursor returns 400"""
+        response = api_client.get(f"{API_URL}/risks?cursor=not-a-cursor", headers={
+            "Authorization": f"Bearer {admin_token}"
+        })
+        assert response.status_code == 400
+        print("✓ Invalid cursor rejected")
+    
+    def test_operator_cursor_rejected(self, api_client, admin_token):
+        """Test a well-formed cursor carrying query operators returns 400"""
+        cursor = base64.urlsafe_b64encode(json.dumps([{"$ne": None}, {"$ne": None}]).encode()).decode()
+        response = api_client.get(f"{API_URL}/users", params={"cursor": cursor}, headers={
+            "Authorization": f"Bearer {admin_token}"
+        })
+        assert response.status_code == 400
+        print("✓ Cursor with operators rejected")
+    
+    def test_ndjson_stream_matches_list(self, api_client, admin_token):
+        """Test ?stream=1 and the NDJSON Accept header stream the same pulses as the list"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        listed = api_client.get(f"{API_URL}/pulses?limit=1000", headers=headers)
+        assert listed.status_code == 200
+        
+        streamed = api_client.get(f"{API_URL}/pulses?stream=1", headers=headers)
+        assert streamed.status_code == 200
+        assert streamed.headers["Content-Type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in streamed.text.splitlines()]
+        assert [p["pulse_id"] for p in lines] == [p["pulse_id"] for p in listed.json()]
+        
+        accepted = api_client.get(f"{API_URL}/pulses", headers={**headers, "Accept": "application/x-ndjson"})
+        assert accepted.text == streamed.text
+        print(f"✓ Streamed {len(lines)} pulses as NDJSON")
+
+
+# ============== ACTIVITY LOG WRITER API TEST ==============
+class TestActivityLogWriter:
+    """Test the buffered activity log writer stats"""
+    
+    def test_writer_stats(self, api_client, admin_token):
+        """Test admin can read writer queue depth"""
+        response = api_client.get(f"{API_URL}/activity-logs/writer", headers={
+            "Authorization": f"Bearer {admin_token}"
+        })
+        assert response.status_code == 200
+        data = response.json()
+        assert data["durability"] in ["buffered", "sync"]
+        assert data["queue_depth"] >= 0
+        assert data["queue_depth"] <= data["max_queue"]
+        print(f"✓ Activity log writer: {data['queue_depth']} queued, {data['batches_flushed']} batches flushed")
+    
+    def test_writer_stats_requires_admin(self, api_client, consultant_token):
+        """Test consultants cannot read writer stats"""
+        response = api_client.get(f"{API_URL}/activity-logs/writer", headers={
+            "Authorization": f"Bearer {consultant_token}"
+        })
+        assert response.status_code == 403
+        print("✓ Writer stats require admin")
+
+
+# ============== ACTIVITY LOG ARCHIVE API TEST ==============
+class TestActivityLogArchive:
+    """Test activity log retention archive endpoints"""
+    
+    def test_archive_run_and_months(self, api_client, admin_token):
+        """Test running the archive and listing archived months"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        run = api_client.post(f"{API_URL}/activity-logs/archive/run", headers=headers)
+        assert run.status_code == 200, f"Archive run failed: {run.text}"
+        assert run.json()["archived"] >= 0
+        
+        response = api_client.get(f"{API_URL}/activity-logs/archive", headers=headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["storage"] in ["collection", "files"]
+        for month in data["months"]:
+            month_response = api_client.get(f"{API_URL}/activity-logs/archive/{month['month']}?limit=5", headers=headers)
+            assert month_response.status_code == 200
+            assert len(month_response.json()["items"]) <= 5
+        print(f"✓ Activity log archive has {len(data['months'])} months")
+    
+    def test_archive_month_validation(self, api_client, admin_token):
+        """Test malformed archive month returns 400"""
+        response = api_client.get(f"{API_URL}/activity-logs/archive/last-year", headers={
+            "Authorization": f"Bearer {admin_token}"
+        })
+        assert response.status_code == 400
+        print("✓ Invalid archive month rejected")
+
+
+# ============== LIVE EVENTS API TEST ==============
+class TestLiveEvents:
+    """Test the Server-Sent Events mutation stream"""
+    
+    def events_ticket(self, api_client, token):
+        response = api_client.post(f"{API_URL}/events/ticket", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 200
+        return response.json()["ticket"]
+    
+    def test_event_stream_receives_mutation(self, api_client, admin_token):
+        """Test an engagement update is pushed to a subscribed stream"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        ticket = self.events_ticket(api_client, admin_token)
+        stream = requests.get(f"{API_URL}/events?engagement_id=eng_001&ticket={ticket}", stream=True, timeout=10)
+        try:
+            assert stream.status_code == 200
+            assert stream.headers["Content-Type"].startswith("text/event-stream")
+            
+            engagement = api_client.get(f"{API_URL}/engagements/eng_001", headers=headers).json()
+            update = api_client.put(f"{API_URL}/engagements/eng_001", headers=headers, json={
+                "engagement_name": engagement["engagement_name"]
+            })
+            assert update.status_code == 200
+            
+            for line in stream.iter_lines(decode_unicode=True):
+                if line and line.startswith("data: "):
+                    event = json.loads(line[len("data: "):])
+                    if event["type"] == "engagement.update":
+                        break
+            assert event["engagement_id"] == "eng_001"
+            assert event["entity_id"] == "eng_001"
+            print(f"✓ Received live event {event['type']} #{event['id']}")
+        finally:
+            stream.close()
+        
+        reused = api_client.get(f"{API_URL}/events?ticket={ticket}")
+        assert reused.status_code == 401
+        print("✓ Event stream tickets are single-use")
+    
+    def test_event_stream_requires_auth(self, api_client, admin_token):
+        """Test the stream rejects anonymous, bad-ticket and bearer-token connections"""
+        assert api_client.get(f"{API_URL}/events").status_code == 401
+        assert api_client.get(f"{API_URL}/events?ticket=not-a-ticket").status_code == 401
+        assert api_client.get(f"{API_URL}/events?ticket={admin_token}").status_code == 401
+        assert api_client.get(f"{API_URL}/events?token={admin_token}").status_code == 401
+        assert api_client.get(f"{API_URL}/events", headers={
+            "Authorization": f"Bearer {admin_token}"
+        }).status_code == 401
+        assert api_client.post(f"{API_URL}/events/ticket").status_code == 401
+        print("✓ Event stream requires a ticket")
+    
+    def test_consultant_cannot_follow_other_engagement(self, api_client, consultant_token):
+        """Test consultants cannot subscribe to engagements they do not own"""
+        ticket = self.events_ticket(api_client, consultant_token)
+        response = api_client.get(f"{API_URL}/events?engagement_id=eng_does_not_exist&ticket={ticket}")
+        assert response.status_code == 403
+        print("✓ Consultant event subscription is scoped")
+
+
+# ============== CONDITIONAL REQUESTS TEST ==============
+class TestConditionalRequests:
+    """Test ETag / If-None-Match handling on read endpoints"""
+    
+    def test_unchanged_engagement_returns_304(self, api_client, admin_token):
+        """Test repeating a request with its ETag returns an empty 304"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        for path in ["/engagements/eng_001", "/engagements/eng_001/four-blocker", "/risks?engagement_id=eng_001", "/dashboard/summary"]:
+            first = api_client.get(f"{API_URL}{path}", headers=headers)
+            assert first.status_code == 200
+            etag = first.headers.get("ETag")
+            assert etag, f"No ETag on {path}"
+            
+            second = api_client.get(f"{API_URL}{path}", headers={**headers, "If-None-Match": etag})
+            assert second.status_code == 304, f"{path} returned {second.status_code}"
+            assert second.content == b""
+        print("✓ Unchanged reads return 304 Not Modified")
+    
+    def test_mutation_changes_etag(self, api_client, admin_token):
+        """Test a write to an engagement invalidates its ETag"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        etag = api_client.get(f"{API_URL}/issues?engagement_id=eng_001", headers=headers).headers["ETag"]
+        
+        issue = api_client.post(f"{API_URL}/issues", headers=headers, json={
+            "engagement_id": "eng_001",
+            "title": "TEST_ETag Issue",
+            "description": "Should change the engagement version",
+            "severity": "LOW"
+        })
+        assert issue.status_code == 200
+        
+        response = api_client.get(f"{API_URL}/issues?engagement_id=eng_001", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert any(i["issue_id"] == issue.json()["issue_id"] for i in response.json())
+        print("✓ Mutation changes the ETag")
+        
+        api_client.delete(f"{API_URL}/issues/{issue.json()['issue_id']}", headers=headers)
+    
+    def test_access_is_checked_before_304(self, api_client, admin_token, consultant_token, consultant_user):
+        """Test a consultant gets 403, not 304, for another consultant's engagement"""
+        engagements = api_client.get(f"{API_URL}/engagements", headers={"Authorization": f"Bearer {admin_token}"}).json()
+        other = next((e for e in engagements if e.get("consultant_user_id") != consultant_user["user_id"]), None)
+        if not other:
+            pytest.skip("No engagement owned by another consultant")
+        
+        headers = {"Authorization": f"Bearer {consultant_token}", "If-None-Match": "*"}
+        for path in ["", "/four-blocker", "/bundle"]:
+            response = api_client.get(f"{API_URL}/engagements/{other['engagement_id']}{path}", headers=headers)
+            assert response.status_code == 403, f"{path or '/'} returned {response.status_code}"
+        print("✓ Access is checked before answering 304")
+    
+    def test_version_is_not_exposed(self, api_client, admin_token):
+        """Test the ETag version counter stays out of engagement payloads"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        assert all("version" not in e for e in api_client.get(f"{API_URL}/engagements", headers=headers).json())
+        assert "version" not in api_client.get(f"{API_URL}/engagements/eng_001", headers=headers).json()
+        assert "version" not in api_client.get(f"{API_URL}/engagements/eng_001/bundle", headers=headers).json()["engagement"]
+        print("✓ Engagement version stays internal")
+
+
+# ============== METRICS API TEST ==============
+class TestMetrics:
+    """Test the Prometheus metrics endpoint"""
+    
+    def test_metrics_record_route_latency(self, api_client, admin_token):
+        """Test requests are counted and timed under their route template"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        assert api_client.get(f"{API_URL}/engagements/eng_001", headers=headers).status_code == 200
+        
+        response = api_client.get(f"{API_URL}/metrics", headers=headers)
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith("text/plain")
+        labels = 'method="GET",route="/api/engagements/{engagement_id}"'
+        assert f'http_requests_total{{{labels},status="200"}}' in response.text
+        assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}}' in response.text
+        assert f'http_request_duration_quantile_seconds{{{labels},quantile="0.95"}}' in response.text
+        assert "eng_001" not in response.text
+        assert "dashboard_cache_builds_total" in response.text
+        print("✓ Metrics expose per-route latency histograms")
+    
+    def test_responses_report_database_usage(self, api_client, admin_token):
+        """Test API responses carry the request's MongoDB query count and time"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        response = api_client.get(f"{API_URL}/engagements/eng_001/four-blocker", headers=headers)
+        assert response.status_code == 200
+        assert int(response.headers["X-DB-Queries"]) > 0
+        assert float(response.headers["X-DB-Time-Ms"]) >= 0
+        
+        metrics = api_client.get(f"{API_URL}/metrics", headers=headers).text
+        assert 'http_request_db_queries_total{method="GET",route="/api/engagements/{engagement_id}/four-blocker"}' in metrics
+        assert 'mongodb_commands_total{command="aggregate"}' in metrics
+        print(f"✓ Four-blocker used {response.headers['X-DB-Queries']} queries ({response.headers['X-DB-Time-Ms']} ms)")
+    
+    def test_metrics_require_admin(self, api_client, consultant_token):
+        """Test anonymous and non-admin callers cannot scrape metrics"""
+        assert api_client.get(f"{API_URL}/metrics").status_code == 401
+        response = api_client.get(f"{API_URL}/metrics", headers={"Authorization": f"Bearer {consultant_token}"})
+        assert response.status_code == 403
+        print("✓ Metrics require an admin or the metrics token")
+
+# ============== BULK CREATE API TEST ==============
+class TestBulkCreate:
+    """Test bulk create endpoints"""
+    
+    def test_bulk_contacts_unordered_reports_per_item(self, api_client, admin_token):
+        """Test an unordered bulk insert writes valid items and reports invalid ones"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        items = [
+            {"engagement_id": "eng_001", "name": "TEST_Bulk Contact A", "type": "CLIENT"},
+            {"name": "TEST_Bulk Contact Missing Engagement"},
+            {"engagement_id": "eng_001", "name": "TEST_Bulk Contact B", "type": "CLIENT"},
+        ]
+        response = api_client.post(f"{API_URL}/contacts/bulk", headers=headers, json={"items": items, "ordered": False})
+        assert response.status_code == 200, f"Bulk create failed: {response.text}"
+        data = response.json()
+        
+        assert data["inserted"] == 2
+        assert data["failed"] == 1
+        assert [r["ok"] for r in data["results"]] == [True, False, True]
+        assert "engagement_id" in data["results"][1]["error"]
+        
+        for result in data["results"]:
+            if result["ok"]:
+                api_client.delete(f"{API_URL}/contacts/{result['id']}", headers=headers)
+        print("✓ Unordered bulk create reports per-item results")
+    
+    def test_bulk_ordered_stops_at_first_failure(self, api_client, admin_token):
+        """Test an ordered bulk insert skips everything after the first failure"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        items = [
+            {"title": "TEST_Bulk Milestone Missing Engagement", "due_date": "2027-01-01T00:00:00Z"},
+            {"engagement_id": "eng_001", "title": "TEST_Bulk Milestone", "due_date": "2027-01-01T00:00:00Z"},
+        ]
+        response = api_client.post(f"{API_URL}/milestones/bulk", headers=headers, json={"items": items})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["inserted"] == 0
+        assert [r["ok"] for r in data["results"]] == [False, False]
+        print("✓ Ordered bulk create stops at first failure")
+    
+    def test_bulk_unsupported_entity(self, api_client, admin_token):
+        """Test bulk create on an unsupported entity returns 404"""
+        response = api_client.post(f"{API_URL}/users/bulk", headers={
+            "Authorization": f"Bearer {admin_token}"
+        }, json={"items": []})
+        assert response.status_code == 404
+        print("✓ Unsupported bulk entity rejected")
+
+
+# ============== PORTFOLIO EXPORT API TEST ==============
+class TestPortfolioExport:
+    """Test CSV/Parquet portfolio exports"""
+    
+    def test_export_pulses_csv(self, api_client, admin_token):
+        """Test pulses export as CSV with one row per pulse"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        response = api_client.get(f"{API_URL}/export/pulses", headers=headers)
+        assert response.status_code == 200, f"Export failed: {response.text}"
+        assert response.headers["Content-Type"].startswith("text/csv")
+        assert "attachment" in response.headers["Content-Disposition"]
+        
+        lines = response.text.splitlines()
+        assert lines[0].startswith("pulse_id,engagement_id")
+        listed = api_client.get(f"{API_URL}/pulses?limit=1000", headers=headers).json()
+        assert len(lines) - 1 == len(listed)
+        print(f"✓ Exported {len(lines) - 1} pulses as CSV")
+    
+    def test_export_milestones_flattens_date_changes(self, api_client, admin_token):
+        """Test milestone export carries date change columns"""
+        response = api_client.get(f"{API_URL}/export/milestones", headers={
+            "Authorization": f"Bearer {admin_token}"
+        })
+        assert response.status_code == 200
+        header = response.text.splitlines()[0].split(",")
+        assert "date_change_history" not in header
+        assert "date_change_reason" in header and "date_change_new_date" in header
+        print("✓ Milestone export flattens date change history")
+    
+    def test_export_parquet(self, api_client, admin_token):
+        """Test Parquet export returns a Parquet file"""
+        response = api_client.get(f"{API_URL}/export/risks?format=parquet", headers={
+            "Authorization": f"Bearer {admin_token}"
+        })
+        if response.status_code == 501:
+            pytest.skip("pyarrow not installed on server")
+        assert response.status_code == 200
+        assert response.content[:4] == b"PAR1" and response.content[-4:] == b"PAR1"
+        print(f"✓ Parquet export: {len(response.content)} bytes")
+    
+    def test_export_rejected_for_consultant(self, api_client, consultant_token):
+        """Test consultants cannot export"""
+        response = api_client.get(f"{API_URL}/export/engagements", headers={
+            "Authorization": f"Bearer {consultant_token}"
+        })
+        assert response.status_code == 403
+        print("✓ Consultant export rejected")
+
+
+# ============== ENGAGEMENT BUNDLE API TEST ==============
+class TestEngagementBundleAPI:
+    """Test the consolidated engagement detail bundle"""
+    
+    def test_bundle_returns_all_sections(self, api_client, admin_token):
+        """Test /api/engagements/{id}/bundle returns every detail-page section"""
+        response = api_client.get(f"{API_URL}/engagements/eng_001/bundle", headers={
+            "Authorization": f"Bearer {admin_token}"
+        })
+        if response.status_code == 404:
+            pytest.skip("eng_001 not found")
+        assert response.status_code == 200, f"Bundle failed: {response.text}"
+        data = response.json()
+        
+        for section in ["engagement", "pulses", "milestones", "risks", "issues", "contacts", "rag_trend", "four_blocker", "meetings", "action_items"]:
+            assert section in data, f"Bundle missing {section}"
+        assert data["engagement"]["engagement_id"] == "eng_001"
+        assert "milestones_block" in data["four_blocker"]
+        print(f"✓ Bundle for eng_001: {len(data['milestones'])} milestones, {len(data['risks'])} risks, {len(data['issues'])} issues")
+    
+    def test_bundle_four_blocker_matches_endpoint(self, api_client, admin_token):
+        """Test the bundle's four_blocker is the same aggregation as the four-blocker endpoint"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        bundle = api_client.get(f"{API_URL}/engagements/eng_001/bundle?fields=four_blocker", headers=headers)
+        if bundle.status_code == 404:
+            pytest.skip("eng_001 not found")
+        four_blocker = api_client.get(f"{API_URL}/engagements/eng_001/four-blocker", headers=headers).json()
+        assert bundle.json()["four_blocker"] == four_blocker
+        print("✓ Bundle four_blocker matches the four-blocker endpoint")
+    
+    def test_bundle_fields_selector(self, api_client, admin_token):
+        """Test fields= limits the returned sections"""
+        response = api_client.get(f"{API_URL}/engagements/eng_001/bundle?fields=risks,rag_trend", headers={
+            "Authorization": f"Bearer {admin_token}"
+        })
+        if response.status_code == 404:
+            pytest.skip("eng_001 not found")
+        assert response.status_code == 200
+        assert set(response.json().keys()) == {"risks", "rag_trend"}
+        
+        bad = api_client.get(f"{API_URL}/engagements/eng_001/bundle?fields=bogus", headers={
+            "Authorization": f"Bearer {admin_token}"
+        })
+        assert bad.status_code == 400
+        print("✓ Bundle fields selector works")
+    
+    def test_action_item_due_date_shape(self, api_client, admin_token):
+        """Test list and bundle render a date-only due_date like the create response does"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        created = api_client.post(f"{API_URL}/action-items", headers=headers, json={
+            "engagement_id": "eng_001",
+            "description": "TEST_Due date shape",
+            "due_date": "2026-10-20"
+        })
+        assert created.status_code == 200
+        item = created.json()
+        try:
+            assert item["due_date"] == "2026-10-20T00:00:00"
+            listed = api_client.get(f"{API_URL}/action-items?engagement_id=eng_001", headers=headers).json()
+            bundled = api_client.get(f"{API_URL}/engagements/eng_001/bundle?fields=action_items", headers=headers).json()["action_items"]
+            for items in [listed, bundled]:
+                assert next(i for i in items if i["action_item_id"] == item["action_item_id"])["due_date"] == item["due_date"]
+            print("✓ Action item due dates keep their shape")
+        finally:
+            api_client.delete(f"{API_URL}/action-items/{item['action_item_id']}", headers=headers)
 
 
 # ============== MILESTONE DATE CHANGE API TEST ==============
@@ -488,10 +991,95 @@ class TestDashboardSummary:
         assert "total_engagements" in data
         assert "rag_counts" in data
         assert "missing_pulses_count" in data
+        assert "upcoming_milestones_count" in data
+        assert len(data["upcoming_milestones"]) <= 10
+        assert data["upcoming_milestones_count"] >= len(data["upcoming_milestones"])
         
         print(f"✓ Dashboard summary: {data['total_engagements']} engagements")
         print(f"  RAG: G={data['rag_counts'].get('GREEN', 0)}, A={data['rag_counts'].get('AMBER', 0)}, R={data['rag_counts'].get('RED', 0)}")
         print(f"  Missing pulses: {data['missing_pulses_count']}")
+    
+    def test_dashboard_summary_cache_invalidated_by_writes(self, api_client, admin_token):
+        """Test the cached summary is rebuilt after a critical issue is created"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        before = api_client.get(f"{API_URL}/dashboard/summary", headers=headers).json()
+        assert "computed_at" in before
+        
+        issue = api_client.post(f"{API_URL}/issues", headers=headers, json={
+            "engagement_id": "eng_001",
+            "title": "TEST_Dashboard Cache Issue",
+            "description": "Should invalidate the dashboard snapshot",
+            "severity": "CRITICAL"
+        })
+        assert issue.status_code == 200
+        
+        after = api_client.get(f"{API_URL}/dashboard/summary", headers=headers).json()
+        assert after["computed_at"] > before["computed_at"]
+        print(f"✓ Dashboard summary recomputed at {after['computed_at']}")
+        
+        api_client.delete(f"{API_URL}/issues/{issue.json()['issue_id']}", headers=headers)
+    
+    def test_dashboard_summary_fresh_bypass(self, api_client, admin_token):
+        """Test ?fresh=1 recomputes instead of serving the snapshot"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        cached = api_client.get(f"{API_URL}/dashboard/summary", headers=headers).json()
+        fresh = api_client.get(f"{API_URL}/dashboard/summary?fresh=1", headers=headers).json()
+        assert fresh["computed_at"] > cached["computed_at"]
+        print("✓ Dashboard summary fresh bypass works")
+
+
+# ============== MISSING PULSES TEST ==============
+class TestMissingPulses:
+    """Test the missing-pulse endpoint used by reminder tooling"""
+    
+    def test_missing_pulses_paged_and_grouped(self, api_client, admin_token):
+        """Test /api/pulses/missing pages and groups by consultant"""
+        response = api_client.get(f"{API_URL}/pulses/missing?group_by=consultant&page_size=5", headers={
+            "Authorization": f"Bearer {admin_token}"
+        })
+        assert response.status_code == 200, f"Missing pulses failed: {response.text}"
+        data = response.json()
+        
+        assert "week_start_date" in data
+        assert data["page"] == 1
+        assert len(data["items"]) <= 5
+        assert sum(len(g["engagements"]) for g in data["groups"]) == len(data["items"])
+        print(f"✓ Missing pulses: {data['total']} engagement(s) across {len(data['groups'])} consultant group(s) on page 1")
+    
+    def test_missing_pulses_requires_lead_or_admin(self, api_client, consultant_token):
+        """Test consultants cannot list missing pulses"""
+        response = api_client.get(f"{API_URL}/pulses/missing", headers={
+            "Authorization": f"Bearer {consultant_token}"
+        })
+        assert response.status_code == 403
+        print("✓ Missing pulses requires lead or admin")
+
+
+# ============== HEALTH SCORE REBUILD TEST ==============
+class TestHealthScoreRebuild:
+    """Test materialized health score maintenance"""
+    
+    def test_health_score_dry_run_reports_drift(self, api_client, admin_token):
+        """Test /api/health-scores/rebuild?dry_run=true reports without writing"""
+        response = api_client.post(f"{API_URL}/health-scores/rebuild?dry_run=true", headers={
+            "Authorization": f"Bearer {admin_token}"
+        })
+        assert response.status_code == 200, f"Rebuild failed: {response.text}"
+        data = response.json()
+        
+        assert data["dry_run"] is True
+        assert data["updated"] == 0
+        assert "checked" in data
+        assert "drift_count" in data
+        print(f"✓ Health score dry run: {data['drift_count']} of {data['checked']} engagements drifted")
+    
+    def test_health_score_rebuild_requires_admin(self, api_client, consultant_token):
+        """Test consultants cannot trigger a rebuild"""
+        response = api_client.post(f"{API_URL}/health-scores/rebuild", headers={
+            "Authorization": f"Bearer {consultant_token}"
+        })
+        assert response.status_code == 403
+        print("✓ Health score rebuild requires admin")
 
 
 if __name__ == "__main__":
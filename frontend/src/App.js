@@ -25,6 +25,59 @@ export const getCurrentUser = () => {
   return userStr ? JSON.parse(userStr) : null;
 };
 
+// Subscribe to live mutation events; returns an unsubscribe function.
+// EventSource cannot send headers, so each connection is opened with a short-lived,
+// single-use ticket. A ticket cannot be reused, so reconnects fetch a fresh one.
+export const subscribeToEvents = (onEvent, params = {}) => {
+  if (!localStorage.getItem('token') || typeof EventSource === 'undefined') return () => {};
+  let source = null;
+  let retryTimer = null;
+  let retryDelay = 1000;
+  let closed = false;
+
+  const reconnect = () => {
+    if (closed) return;
+    retryTimer = setTimeout(connect, retryDelay);
+    retryDelay = Math.min(retryDelay * 2, 30000);
+  };
+
+  const connect = async () => {
+    try {
+      const response = await fetch(`${API_URL}/api/events/ticket`, {
+        method: 'POST',
+        headers: getAuthHeader()
+      });
+      if (response.status === 401) return;
+      if (!response.ok) throw new Error(`Ticket request failed: ${response.status}`);
+      const { ticket } = await response.json();
+      if (closed) return;
+      source = new EventSource(`${API_URL}/api/events?${new URLSearchParams({ ...params, ticket })}`);
+      source.onopen = () => { retryDelay = 1000; };
+      source.onmessage = (message) => {
+        try {
+          onEvent(JSON.parse(message.data));
+        } catch (error) {
+          console.error('Error handling live event:', error);
+        }
+      };
+      source.onerror = () => {
+        source.close();
+        reconnect();
+      };
+    } catch (error) {
+      console.error('Error opening live events:', error);
+      reconnect();
+    }
+  };
+
+  connect();
+  return () => {
+    closed = true;
+    clearTimeout(retryTimer);
+    if (source) source.close();
+  };
+};
+
 // Helper to logout
 export const logout = () => {
   localStorage.removeItem('token');
@@ -1,4 +1,4 @@
-import { useState, useEffect } from "react";
+import { useState, useEffect, useRef } from "react";
 import { useNavigate, useParams, useLocation } from "react-router-dom";
 import { toast } from "sonner";
 import { Button } from "../components/ui/button";
@@ -16,7 +16,7 @@ import {
   CheckCircle, XCircle, TrendingUp, Lock, History, ChevronRight
 } from "lucide-react";
 import { format, parseISO } from "date-fns";
-import { getAuthHeader, getCurrentUser } from "../App";
+import { getAuthHeader, getCurrentUser, subscribeToEvents } from "../App";
 
 const API_URL = process.env.REACT_APP_BACKEND_URL;
 
@@ -48,10 +48,25 @@ export default function EngagementDetail() {
   const [meetingDialog, setMeetingDialog] = useState({ open: false, data: null });
   const [actionItemDialog, setActionItemDialog] = useState({ open: false, data: null });
 
+  const liveRefreshTimer = useRef(null);
+
   useEffect(() => {
     fetchData();
   }, [engagementId]);
 
+  // Refetch the bundle when anyone changes this engagement; bursts collapse into one request
+  useEffect(() => {
+    const unsubscribe = subscribeToEvents((event) => {
+      if (event.entity === 'engagement' && event.action === 'delete') return;
+      clearTimeout(liveRefreshTimer.current);
+      liveRefreshTimer.current = setTimeout(fetchData, 500);
+    }, { engagement_id: engagementId });
+    return () => {
+      clearTimeout(liveRefreshTimer.current);
+      unsubscribe();
+    };
+  }, [engagementId]);
+
   const fetchData = async () => {
     try {
       // Fetch user if not available
@@ -62,33 +77,21 @@ export default function EngagementDetail() {
         setUser(userData);
       }
 
-      // Fetch engagement
-      const engRes = await fetch(`${API_URL}/api/engagements/${engagementId}`, { headers: getAuthHeader() });
-      if (!engRes.ok) throw new Error('Engagement not found');
-      setEngagement(await engRes.json());
-
-      // Fetch related data
-      const [pulsesRes, msRes, risksRes, issuesRes, contactsRes, trendRes, fourBlockerRes, meetingsRes, actionItemsRes] = await Promise.all([
-        fetch(`${API_URL}/api/pulses?engagement_id=${engagementId}`, { headers: getAuthHeader() }),
-        fetch(`${API_URL}/api/milestones?engagement_id=${engagementId}`, { headers: getAuthHeader() }),
-        fetch(`${API_URL}/api/risks?engagement_id=${engagementId}`, { headers: getAuthHeader() }),
-        fetch(`${API_URL}/api/issues?engagement_id=${engagementId}`, { headers: getAuthHeader() }),
-        fetch(`${API_URL}/api/contacts?engagement_id=${engagementId}`, { headers: getAuthHeader() }),
-        fetch(`${API_URL}/api/dashboard/rag-trend/${engagementId}`, { headers: getAuthHeader() }),
-        fetch(`${API_URL}/api/engagements/${engagementId}/four-blocker`, { headers: getAuthHeader() }),
-        fetch(`${API_URL}/api/meetings?engagement_id=${engagementId}`, { headers: getAuthHeader() }),
-        fetch(`${API_URL}/api/action-items?engagement_id=${engagementId}`, { headers: getAuthHeader() })
-      ]);
-
-      if (pulsesRes.ok) setPulses(await pulsesRes.json());
-      if (msRes.ok) setMilestones(await msRes.json());
-      if (risksRes.ok) setRisks(await risksRes.json());
-      if (issuesRes.ok) setIssues(await issuesRes.json());
-      if (contactsRes.ok) setContacts(await contactsRes.json());
-      if (trendRes.ok) setRagTrend(await trendRes.json());
-      if (fourBlockerRes.ok) setFourBlocker(await fourBlockerRes.json());
-      if (meetingsRes.ok) setMeetings(await meetingsRes.json());
-      if (actionItemsRes.ok) setActionItems(await actionItemsRes.json());
+      // Fetch engagement and all related data in one request
+      const bundleRes = await fetch(`${API_URL}/api/engagements/${engagementId}/bundle`, { headers: getAuthHeader() });
+      if (!bundleRes.ok) throw new Error('Engagement not found');
+      const bundle = await bundleRes.json();
+
+      setEngagement(bundle.engagement);
+      setPulses(bundle.pulses);
+      setMilestones(bundle.milestones);
+      setRisks(bundle.risks);
+      setIssues(bundle.issues);
+      setContacts(bundle.contacts);
+      setRagTrend(bundle.rag_trend);
+      setFourBlocker(bundle.four_blocker);
+      setMeetings(bundle.meetings);
+      setActionItems(bundle.action_items);
 
     } catch (error) {
       console.error('Error fetching data:', error);
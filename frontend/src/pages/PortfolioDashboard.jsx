@@ -1,4 +1,4 @@
-import { useState, useEffect } from "react";
+import { useState, useEffect, useRef } from "react";
 import { useNavigate, useLocation } from "react-router-dom";
 import { toast } from "sonner";
 import { Button } from "../components/ui/button";
@@ -18,7 +18,7 @@ import {
   Edit2, Trash2, X, CheckCircle
 } from "lucide-react";
 import { format, parseISO } from "date-fns";
-import { getAuthHeader, getCurrentUser, logout } from "../App";
+import { getAuthHeader, getCurrentUser, logout, subscribeToEvents } from "../App";
 
 const API_URL = process.env.REACT_APP_BACKEND_URL;
 
@@ -47,10 +47,84 @@ export default function PortfolioDashboard() {
   const [clientsSheet, setClientsSheet] = useState(false);
   const [consultantsSheet, setConsultantsSheet] = useState(false);
 
+  const liveRefreshTimer = useRef(null);
+  const staleData = useRef({ summary: false, engagements: false });
+  const engagementsRef = useRef(engagements);
+  engagementsRef.current = engagements;
+
   useEffect(() => {
     fetchData();
   }, []);
 
+  // Refetch only what the buffered events made stale, once a burst of events settles
+  const refreshStaleData = async () => {
+    const stale = staleData.current;
+    staleData.current = { summary: false, engagements: false };
+    try {
+      if (stale.summary) {
+        const summaryRes = await fetch(`${API_URL}/api/dashboard/summary`, { headers: getAuthHeader() });
+        if (summaryRes.ok) setSummary(await summaryRes.json());
+      }
+      if (stale.engagements) {
+        const engRes = await fetch(`${API_URL}/api/engagements`, { headers: getAuthHeader() });
+        if (engRes.ok) setEngagements(await engRes.json());
+      }
+    } catch (error) {
+      console.error('Error refreshing live data:', error);
+    }
+  };
+
+  const markStale = (...resources) => {
+    resources.forEach((resource) => { staleData.current[resource] = true; });
+    clearTimeout(liveRefreshTimer.current);
+    liveRefreshTimer.current = setTimeout(refreshStaleData, 1000);
+  };
+
+  // Keep the portfolio current: apply each event's data to local state, and only
+  // refetch what cannot be derived from it (joined rows, counts, the summary)
+  useEffect(() => {
+    const unsubscribe = subscribeToEvents((event) => {
+      const { entity, action, entity_id: id, data } = event;
+      if (entity === 'client') {
+        if (action === 'create' && data) {
+          setClients((current) => [...current, data]);
+        } else if (action === 'update' && data) {
+          setClients((current) => current.map((c) => c.client_id === id ? { ...c, ...data } : c));
+          setEngagements((current) => current.map((e) =>
+            e.client_id === id ? { ...e, client: { ...e.client, ...data } } : e
+          ));
+        } else if (action === 'delete') {
+          setClients((current) => current.filter((c) => c.client_id !== id));
+        }
+      } else if (entity === 'engagement') {
+        if (action === 'update' && data) {
+          // A new client or consultant changes the joined fields, which the event does not carry
+          const previous = engagementsRef.current.find((e) => e.engagement_id === id);
+          const relinked = !previous || previous.client_id !== data.client_id ||
+            previous.consultant_user_id !== data.consultant_user_id;
+          setEngagements((current) => current.map((e) =>
+            e.engagement_id === id ? { ...e, ...data } : e
+          ));
+          markStale('summary', ...(relinked ? ['engagements'] : []));
+        } else if (action === 'delete') {
+          setEngagements((current) => current.filter((e) => e.engagement_id !== id));
+          markStale('summary');
+        } else {
+          markStale('summary', 'engagements');
+        }
+      } else if (entity === 'pulse' || entity === 'issue' || entity === 'risk') {
+        // These move the engagement's RAG status, health score and open counts
+        markStale('summary', 'engagements');
+      } else if (entity === 'milestone') {
+        markStale('summary');
+      }
+    });
+    return () => {
+      clearTimeout(liveRefreshTimer.current);
+      unsubscribe();
+    };
+  }, []);
+
   const fetchData = async () => {
     try {
       if (!user) {